@@ -0,0 +1,75 @@
+"""
+	Compare walking a directory tree with `GPathBuilder` against walking it with the GPath operators `/` and `-`, at different depths of the tree.
+
+	Usage: `python benchmarks/bench_builder.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath, GPathBuilder
+
+from util import measure, report
+
+
+def make_walk(depth: int, width: int) -> list[str]:
+	# Events of a depth-first walk of a tree with `width` subdirectories and `width` files in each directory: a name to enter a directory, "" to leave it, or a name prefixed by "+" for a file
+	events = []
+
+	def walk(level: int) -> None:
+		for i in range(width):
+			events.append(f"+file{i}")
+		if level < depth:
+			for i in range(width):
+				events.append(f"dir{i}")
+				walk(level + 1)
+				events.append("")
+
+	walk(1)
+	return events
+
+
+def walk_operators(start: GPath, events: list[str]) -> list[GPath]:
+	files = []
+	path = start
+	for event in events:
+		if event == "":
+			path = path - 1
+		elif event[0] == "+":
+			files.append(path / event[1:])
+		else:
+			path = path / event
+	return files
+
+
+def walk_builder(start: GPath, events: list[str]) -> list[GPath]:
+	files = []
+	builder = GPathBuilder(start)
+	for event in events:
+		if event == "":
+			builder.pop()
+		elif event[0] == "+":
+			builder.push(event[1:])
+			files.append(builder.freeze())
+			builder.pop()
+		else:
+			builder.push(event)
+	return files
+
+
+def main() -> None:
+	for prefix_depth in (2, 20):
+		start = GPath("/" + "/".join(f"base{i}" for i in range(prefix_depth)))
+		events = make_walk(depth=4, width=6)
+		expected = walk_operators(start, events)
+		assert walk_builder(start, events) == expected
+		assert walk_operators(GPath(start, compact=True), events) == expected
+		name = f"{len(expected)} files under {prefix_depth} components"
+
+		reference = measure(walk_operators, start, events, repeat=3)
+		report(f"{name}/operators", reference)
+		report(f"{name}/operators (compact)", measure(walk_operators, GPath(start, compact=True), events, repeat=3), reference)
+		report(f"{name}/builder", measure(walk_builder, start, events, repeat=3), reference)
+
+
+if __name__ == '__main__':
+	main()
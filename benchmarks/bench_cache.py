@@ -0,0 +1,111 @@
+"""
+	Measure the throughput of `ParseCache` and `RenderCache` shared between 32 threads, and compare them against parsing and rendering every path, and against an LRU cache that takes a lock on every lookup.
+
+	Usage: `python benchmarks/bench_cache.py [threads]`
+
+	The requests are skewed towards a small number of popular paths. Each case is measured both with all of the paths fitting in the caches, and with many more paths than the caches can hold, in which case most of the time goes to misses.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from gpath import GPath, cache
+
+
+class LockedLRUCache:
+	# Reference implementation of the memoisation that users would otherwise write themselves, which takes a lock on every lookup
+	def __init__(self, function: Callable, max_size: int):
+		self._function = function
+		self._entries: OrderedDict = OrderedDict()
+		self._max_size = max_size
+		self._lock = threading.Lock()
+
+	def get(self, *key):
+		with self._lock:
+			value = self._entries.get(key)
+			if value is not None:
+				self._entries.move_to_end(key)
+				return value
+		value = self._function(*key)
+		with self._lock:
+			self._entries[key] = value
+			if len(self._entries) > self._max_size:
+				self._entries.popitem(last=False)
+		return value
+
+
+def make_requests(count: int, distinct: int, seed: int) -> list[str]:
+	# Skewed towards a small number of popular paths, as for the requests to a web server
+	rng = random.Random(seed)
+	paths = [f"/srv/app/static/{i % 50}/assets/file-{i}.js" for i in range(distinct)]
+	return rng.choices(paths, weights=[1 / (i + 1) for i in range(distinct)], k=count)
+
+
+def run_threads(threads: int, work: Callable[[list[str]], None], requests: list[list[str]]) -> float:
+	barrier = threading.Barrier(threads + 1)
+
+	def target(thread_requests: list[str]) -> None:
+		barrier.wait()
+		work(thread_requests)
+
+	workers = [threading.Thread(target=target, args=(requests[i],)) for i in range(threads)]
+	for worker in workers:
+		worker.start()
+	barrier.wait()
+	start = time.perf_counter()
+	for worker in workers:
+		worker.join()
+	return time.perf_counter() - start
+
+
+def run(threads: int, distinct: int, max_size: int) -> None:
+	per_thread = 20_000
+	requests = [make_requests(per_thread, distinct, seed) for seed in range(threads)]
+	total = threads * per_thread
+	print(f"{threads} threads, {distinct} distinct paths, caches of {max_size} paths")
+
+	def uncached(thread_requests: list[str]) -> None:
+		for path in thread_requests:
+			str(GPath(path).render('windows'))
+
+	locked_parse = LockedLRUCache(GPath, max_size)
+	locked_render = LockedLRUCache(lambda path, platform: str(path.render(platform)), max_size)
+
+	def locked(thread_requests: list[str]) -> None:
+		for path in thread_requests:
+			locked_render.get(locked_parse.get(path), 'windows')
+
+	parse_cache = cache.ParseCache(max_size)
+	render_cache = cache.RenderCache(max_size)
+
+	def shared(thread_requests: list[str]) -> None:
+		for path in thread_requests:
+			render_cache.get(parse_cache.get(path), 'windows')
+
+	reference = None
+	for name, work in (("uncached", uncached), ("locked LRU cache", locked), ("ParseCache + RenderCache", shared)):
+		run_threads(threads, work, requests)  # Warm up the caches
+		seconds = min(run_threads(threads, work, requests) for _ in range(3))
+		if reference is None:
+			reference = seconds
+		print(f"{name:<40} {total / seconds:>12,.0f} lookups/s  ({reference / seconds:.1f}x)")
+
+	stats = parse_cache.stats()
+	print(f"{'hit rate':<40} {stats['hits'] / (stats['hits'] + stats['misses']):>12.1%}")
+
+
+def main() -> None:
+	threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+	run(threads, distinct=2_000, max_size=4_096)
+	print()
+	run(threads, distinct=50_000, max_size=4_096)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,44 @@
+"""
+	Compare `GPath.common_with()` against the previous implementation, which compared every pair of components instead of stopping at the first mismatch, on paths with 100 components that diverge at different depths.
+
+	Usage: `python benchmarks/bench_common_with.py`
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from gpath import GPath
+from gpath._gpath import _parts_like
+
+from util import measure, report
+
+
+DEPTH = 100
+
+
+def legacy_common_with(path: GPath, other: GPath) -> Optional[GPath]:
+	# Previous implementation of GPath.common_with() for two absolute paths on the same drive, kept as the reference for this benchmark
+	parts = []
+	common_path = GPath(path)
+	for part1, part2 in zip(path._parts, other._parts):
+		if part1 == part2:
+			parts.append(part1)
+	common_path._parts = _parts_like(path._parts, parts)
+	return common_path
+
+
+def main() -> None:
+	for compact in (False, True):
+		base = GPath("/" + "/".join(f"dir{i:03}" for i in range(DEPTH)), compact=compact)
+		for diverge in (1, 10, 50, 99, DEPTH):
+			others = [GPath("/" + "/".join(f"dir{i:03}" if i < diverge else f"other{j}-{i:03}" for i in range(DEPTH)), compact=compact) for j in range(100)]
+			assert [base.common_with(other) for other in others] == [legacy_common_with(base, other) for other in others]
+			name = f"diverge at {diverge} ({'compact' if compact else 'tuple'})"
+			reference = measure(lambda: [legacy_common_with(base, other) for other in others])
+			report(f"{name}/legacy", reference)
+			report(f"{name}/common_with", measure(lambda: [base.common_with(other) for other in others]), reference)
+
+
+if __name__ == '__main__':
+	main()
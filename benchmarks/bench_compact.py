@@ -0,0 +1,52 @@
+"""
+	Compare the default and compact representations of GPath when building a deep directory tree by appending one component at a time.
+
+	Usage: `python benchmarks/bench_compact.py`
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def build_tree(root: GPath, depth: int, fanout: int) -> list[GPath]:
+	# Every directory down to `depth`, plus `fanout` files in each of them
+	paths = []
+	directory = root
+	for level in range(depth):
+		directory = directory / f"level{level:03}"
+		paths.append(directory)
+		for i in range(fanout):
+			paths.append(directory / f"file{i:03}.dat")
+	return paths
+
+
+def main() -> None:
+	for depth in (10, 100):
+		results = {}
+		for compact in (False, True):
+			root = GPath("/srv/data", compact=compact)
+			tracemalloc.start()
+			paths = build_tree(root, depth, 100)
+			memory, _ = tracemalloc.get_traced_memory()
+			tracemalloc.stop()
+			results[compact] = paths
+
+			label = f"depth {depth}, {'compact' if compact else 'default'}"
+			elapsed = measure(build_tree, root, depth, 100, repeat=3)
+			report(f"{label}: build", elapsed)
+			print(f"{label}: {memory / 2**20:.1f} MiB for {len(paths)} paths")
+
+		assert results[False] == results[True]
+
+		default_paths, compact_paths = results[False], results[True]
+		report(f"depth {depth}, default: compare siblings", measure(lambda: [a == b for a, b in zip(default_paths, default_paths[1:])]))
+		report(f"depth {depth}, compact: compare siblings", measure(lambda: [a == b for a, b in zip(compact_paths, compact_paths[1:])]))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,42 @@
+"""
+	Compare `GPath.__contains__()` against the previous implementation, which created the common base path using `common_with()` and compared it with `self`.
+
+	Usage: `python benchmarks/bench_contains.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def legacy_contains(path: GPath, other: GPath) -> bool:
+	# Previous implementation of GPath.__contains__(), kept as the reference for this benchmark
+	common_path = path.common_with(other, allow_current=True, allow_parents=True)
+	return common_path is not None and common_path == path
+
+
+def main() -> None:
+	for compact in (False, True):
+		base = GPath("/srv/data/2024/shard-001/group/part", compact=compact)
+		cases = {
+			"contained": [GPath(f"/srv/data/2024/shard-001/group/part/file-{i:04}.parquet", compact=compact) for i in range(1000)],
+			"early mismatch": [GPath(f"/srv/logs/2024/shard-001/group/part/file-{i:04}.log", compact=compact) for i in range(1000)],
+			"other drive": [GPath(f"C:/srv/data/file-{i:04}", compact=compact) for i in range(1000)],
+		}
+		for name, paths in cases.items():
+			assert [path in base for path in paths] == [legacy_contains(base, path) for path in paths]
+			reference = measure(lambda: [legacy_contains(base, path) for path in paths])
+			report(f"{name} ({'compact' if compact else 'tuple'})/legacy", reference)
+			report(f"{name} ({'compact' if compact else 'tuple'})/contains", measure(lambda: [path in base for path in paths]), reference)
+
+	strs = [f"/srv/data/2024/shard-001/group/part/file-{i:04}.parquet" for i in range(1000)]
+	base = GPath("/srv/data/2024/shard-001/group/part")
+	reference = measure(lambda: [legacy_contains(base, GPath(path)) for path in strs])
+	report("str operand/legacy", reference)
+	report("str operand/contains", measure(lambda: [path in base for path in strs]), reference)
+
+
+if __name__ == '__main__':
+	main()
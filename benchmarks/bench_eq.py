@@ -0,0 +1,40 @@
+"""
+	Compare `GPath.__eq__()` against a str operand with the previous behaviour of constructing a temporary GPath.
+
+	Usage: `python benchmarks/bench_eq.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def legacy_eq(gpath: GPath, other) -> bool:
+	# Previous implementation, kept as the reference for this benchmark
+	if not isinstance(other, GPath):
+		other = GPath(other, encoding=gpath._encoding)
+	return gpath._tuple == other._tuple
+
+
+def compare_all(eq, gpath: GPath, prefixes: list[str]) -> int:
+	return sum(1 for prefix in prefixes if eq(gpath, prefix))
+
+
+def main() -> None:
+	prefixes = [f"/srv/routes/service{i:04}/v1/handler" for i in range(1000)]
+	for label, gpath in (
+		("match at end", GPath(prefixes[-1])),
+		("no match", GPath("/srv/other/path")),
+	):
+		assert compare_all(legacy_eq, gpath, prefixes) == compare_all(GPath.__eq__, gpath, prefixes)
+
+		legacy_time = measure(compare_all, legacy_eq, gpath, prefixes)
+		current_time = measure(compare_all, GPath.__eq__, gpath, prefixes)
+		report(f"1000 str operands, {label}: legacy", legacy_time)
+		report(f"1000 str operands, {label}: current", current_time, reference=legacy_time)
+
+
+if __name__ == '__main__':
+	main()
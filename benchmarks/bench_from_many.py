@@ -0,0 +1,45 @@
+"""
+	Compare `GPath.from_many()` against calling the constructor once per path.
+
+	Usage: `python benchmarks/bench_from_many.py`
+"""
+
+from __future__ import annotations
+
+import random
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def make_paths(count: int, seed: int=0) -> list[str]:
+	rng = random.Random(seed)
+	vocabulary = [f"dir{i:03}" for i in range(200)]
+	return ["/".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+
+def construct_each(paths: list, platform=None, encoding=None) -> list[GPath]:
+	return [GPath(path, platform=platform, encoding=encoding) for path in paths]
+
+
+def main() -> None:
+	paths = make_paths(100_000)
+	byte_paths = [path.encode('utf_8') for path in paths]
+
+	for label, batch, platform, encoding in (
+		("str, generic", paths, None, None),
+		("str, posix", paths, 'posix', None),
+		("str, windows", paths, 'windows', None),
+		("bytes, generic", byte_paths, None, 'utf_8'),
+	):
+		assert GPath.from_many(batch, platform=platform, encoding=encoding) == construct_each(batch, platform=platform, encoding=encoding)
+
+		each_time = measure(construct_each, batch, platform, encoding, repeat=3, number=1)
+		many_time = measure(GPath.from_many, batch, platform, encoding, repeat=3, number=1)
+		report(f"{label}, 100k: constructor", each_time)
+		report(f"{label}, 100k: from_many", many_time, reference=each_time)
+
+
+if __name__ == '__main__':
+	main()
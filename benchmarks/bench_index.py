@@ -0,0 +1,56 @@
+"""
+	Compare the queries of `GPathIndex` against linear scans of a list of GPaths using `GPath.__contains__()`, for an increasing number of indexed paths.
+
+	Usage: `python benchmarks/bench_index.py`
+"""
+
+from __future__ import annotations
+
+import random
+
+from gpath import GPath, GPathIndex
+
+from util import measure, report
+
+
+def make_paths(rng: random.Random, count: int) -> list[GPath]:
+	vocabulary = [f"dir{i:02}" for i in range(20)]
+	return [GPath("/" + "/".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 8)))) for _ in range(count)]
+
+
+def scan_longest_prefix(paths: list[GPath], query: GPath) -> GPath:
+	longest = None
+	for path in paths:
+		if query in path and (longest is None or path in longest):
+			longest = path
+	return longest
+
+
+def scan_subtree(paths: list[GPath], query: GPath) -> list[GPath]:
+	return [path for path in paths if path in query]
+
+
+def main() -> None:
+	rng = random.Random(0)
+	for count in (1_000, 10_000, 50_000):
+		paths = list(dict.fromkeys(make_paths(rng, count)))
+		queries = make_paths(rng, 10)
+		index = GPathIndex(paths)
+		for query in queries:
+			assert index.longest_prefix(query) == scan_longest_prefix(paths, query)
+		print(f"{len(paths)} paths")
+
+		reference = measure(lambda: [scan_longest_prefix(paths, query) for query in queries], repeat=1, number=1)
+		report("longest_prefix/scan", reference)
+		report("longest_prefix/index", measure(lambda: [index.longest_prefix(query) for query in queries]), reference)
+
+		reference = measure(lambda: [scan_subtree(paths, query) for query in queries], repeat=1, number=1)
+		report("subtree/scan", reference)
+		report("subtree/index", measure(lambda: [list(index.subtree(query)) for query in queries]), reference)
+
+		report("build", measure(lambda: GPathIndex(paths), repeat=1, number=1))
+		print()
+
+
+if __name__ == '__main__':
+	main()
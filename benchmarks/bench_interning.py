@@ -0,0 +1,52 @@
+"""
+	Compare the resident memory used by many GPaths with and without interning of path components.
+
+	Each mode is measured in a separate process, so that the peak resident set size of one does not affect the other.
+
+	Usage: `python benchmarks/bench_interning.py [count]`
+"""
+
+from __future__ import annotations
+
+import resource
+import subprocess
+import sys
+import time
+
+from gpath import GPath, interning
+
+
+def make_path(i: int) -> str:
+	# Paths drawn from a small vocabulary of directory names, created as new strings every time
+	return f"/data/{2000 + i % 25}/region-{i % 7}/shard-{i % 1000:03}/part-{i % 5000:05}.parquet"
+
+
+def peak_rss_bytes() -> int:
+	# ru_maxrss is in kilobytes on Linux but in bytes on macOS
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def child(mode: str, count: int) -> None:
+	pool = interning.enable() if mode == 'on' else None
+	baseline = peak_rss_bytes()
+	start = time.perf_counter()
+	gpaths = [GPath(make_path(i)) for i in range(count)]
+	elapsed = time.perf_counter() - start
+	used = peak_rss_bytes() - baseline
+	saved = pool.saved_bytes if pool is not None else 0
+	print(f"interning {mode:<3}  {len(gpaths):>9} paths  {used / 2**20:>9.1f} MiB resident  {saved / 2**20:>9.1f} MiB reported saved  {elapsed:>7.2f} s")
+
+
+def main() -> None:
+	if len(sys.argv) > 2 and sys.argv[1] == '--child':
+		child(sys.argv[2], int(sys.argv[3]))
+		return
+
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+	for mode in ('off', 'on'):
+		subprocess.run([sys.executable, __file__, '--child', mode, str(count)], check=True)
+
+
+if __name__ == '__main__':
+	main()
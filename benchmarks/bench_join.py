@@ -0,0 +1,39 @@
+"""
+	Compare `GPath.join()` against folding the same segments with `__add__()`, for increasing numbers of segments.
+
+	Usage: `python benchmarks/bench_join.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def legacy_join(paths: list) -> GPath:
+	# Previous implementation, kept as the reference for this benchmark
+	combined_path = paths[0]
+	if not isinstance(combined_path, GPath):
+		combined_path = GPath(combined_path)
+	for path in paths[1:]:
+		combined_path = combined_path + path
+	return combined_path
+
+
+def main() -> None:
+	for count in (10, 100, 1000):
+		for label, segments in (
+			("str", ["/srv"] + [f"segment{i}" for i in range(count - 1)]),
+			("GPath", [GPath("/srv")] + [GPath(f"segment{i}/..") if i % 10 == 9 else GPath(f"segment{i}") for i in range(count - 1)]),
+		):
+			assert GPath.join(segments) == legacy_join(segments)
+
+			legacy_time = measure(legacy_join, segments)
+			current_time = measure(GPath.join, segments)
+			report(f"{count} {label} segments: legacy", legacy_time)
+			report(f"{count} {label} segments: current", current_time, reference=legacy_time)
+
+
+if __name__ == '__main__':
+	main()
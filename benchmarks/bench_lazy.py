@@ -0,0 +1,36 @@
+"""
+	Compare lazy GPaths against GPaths that are parsed immediately, for workloads that only create GPaths, render them back to strings, or use them as dictionary keys.
+
+	Usage: `python benchmarks/bench_lazy.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath
+
+from util import measure, report
+
+
+def main() -> None:
+	corpora = {
+		"canonical": [f"/srv/data/2024/shard-{i % 1000:03}/part-{i:06}.parquet" for i in range(10_000)],
+		"unnormalised": [f"/srv/data/./2024//shard-{i % 1000:03}/tmp/../part-{i:06}.parquet" for i in range(10_000)],
+	}
+	for name, strs in corpora.items():
+		lookup = {GPath(path): i for i, path in enumerate(strs)}
+		for lazy in (False, True):
+			assert [str(GPath(path, lazy=lazy)) for path in strs] == [str(GPath(path)) for path in strs]
+
+		for workload, func in [
+			("init", lambda lazy: [GPath(path, lazy=lazy) for path in strs]),
+			("from_many", lambda lazy: GPath.from_many(strs, lazy=lazy)),
+			("init + str", lambda lazy: [str(GPath(path, lazy=lazy)) for path in strs]),
+			("init + dict lookup", lambda lazy: [lookup[GPath(path, lazy=lazy)] for path in strs]),
+		]:
+			reference = measure(func, False)
+			report(f"{name}/{workload}/eager", reference)
+			report(f"{name}/{workload}/lazy", measure(func, True), reference)
+
+
+if __name__ == '__main__':
+	main()
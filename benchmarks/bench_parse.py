@@ -0,0 +1,148 @@
+"""
+	Measure the throughput of the GPath constructor for each platform, and compare the precompiled parser of each platform against the previous implementation, which looked up the rules of the platform on every call. If the optional compiled accelerator is built, the pure-Python parser is also measured separately.
+
+	Usage: `python benchmarks/bench_parse.py`
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Collection
+from typing import Union
+
+from gpath import GPath, _rules
+from gpath._gpath import _make_python_parser, _normalise_relative, _parsers_of_platforms, _speedups
+from gpath.platform import Platform
+
+from util import measure, report
+
+
+def legacy_split_relative(
+	path: str,
+	delimiters: Union[str, Collection[str]],
+	collapse: bool=True
+) -> list[str]:
+	if path == "":
+		return [path]
+
+	if delimiters == "" or len(delimiters) == 0:
+		return [path]
+
+	delimiter_iter = iter(delimiters)
+	delimiter = next(delimiter_iter)
+	for d in delimiter_iter:
+		path = path.replace(d, delimiter)
+
+	if not collapse:
+		return path.split(delimiter)
+
+	# Leading and repeated delimiters are dropped, while a single trailing delimiter is kept as a trailing empty part
+	parts = [part for part in path.split(delimiter) if part != ""]
+	if len(parts) == 0 or path[-1] == delimiter:
+		parts.append("")
+	return parts
+
+
+def legacy_parse_posix(path: str) -> tuple[tuple[str, ...], bool, str, int]:
+	# Previous implementation of the parsers, kept as the reference for this benchmark
+	root = False
+	for root_indicator in _rules.posix_rules.roots:
+		if path.startswith(root_indicator):
+			root = True
+			break
+
+	if root:
+		rootless_path = path[1:]
+	else:
+		rootless_path = path
+
+	return legacy_parse_relative(rootless_path, root, "", _rules.posix_rules.separators)
+
+
+def legacy_parse_with_drive(path: str, rules) -> tuple[tuple[str, ...], bool, str, int]:
+	if len(path) >= 2 and path[1] in rules.drive_postfixes:
+		drive = path[0]
+		driveless_path = path[2:]
+	else:
+		drive = ""
+		driveless_path = path
+
+	root = False
+	for root_indicator in rules.roots:
+		if driveless_path.startswith(root_indicator):
+			root = True
+			break
+
+	if root:
+		rootless_path = driveless_path[1:]
+	else:
+		rootless_path = driveless_path
+
+	return legacy_parse_relative(rootless_path, root, drive, rules.separators)
+
+
+def legacy_parse_relative(rootless_path: str, root: bool, drive: str, separators: Collection[str]) -> tuple[tuple[str, ...], bool, str, int]:
+	parts = _normalise_relative(legacy_split_relative(rootless_path, delimiters=separators))
+	parent_level = 0
+	while parent_level < len(parts) and parts[parent_level] in _rules.generic_rules.parent_indicators:
+		parent_level += 1
+	return (tuple(parts[parent_level:]), root, drive, 0 if root else parent_level)
+
+
+python_parsers = {
+	Platform.GENERIC: _make_python_parser(_rules.generic_rules, with_drive=True),
+	Platform.POSIX: _make_python_parser(_rules.posix_rules, with_drive=False),
+	Platform.WINDOWS: _make_python_parser(_rules.windows_rules, with_drive=True),
+}
+
+
+legacy_parsers = {
+	Platform.GENERIC: lambda path: legacy_parse_with_drive(path, _rules.generic_rules),
+	Platform.POSIX: legacy_parse_posix,
+	Platform.WINDOWS: lambda path: legacy_parse_with_drive(path, _rules.windows_rules),
+}
+
+
+def make_paths(platform: Platform, count: int, seed: int=0) -> list[str]:
+	rng = random.Random(seed)
+	vocabulary = [f"dir{i:02}" for i in range(50)]
+	paths = []
+	for i in range(count):
+		parts = [rng.choice(vocabulary) for _ in range(rng.randint(1, 10))]
+		if i % 10 == 0:
+			parts.insert(rng.randrange(len(parts)), rng.choice([".", ".."]))  # Some paths that need to be normalised
+		if platform == Platform.WINDOWS:
+			paths.append("C:\\" + "\\".join(parts))
+		elif i % 2 == 0:
+			paths.append("/" + "/".join(parts))
+		else:
+			paths.append("/".join(parts))
+	return paths
+
+
+def main() -> None:
+	count = 10_000
+	for platform in Platform:
+		paths = make_paths(platform, count)
+		parse = _parsers_of_platforms[platform]
+		legacy_parse = legacy_parsers[platform]
+		assert [parse(path) for path in paths] == [legacy_parse(path) for path in paths]
+
+		reference = measure(lambda: [legacy_parse(path) for path in paths])
+		report(f"{platform}/legacy parser", reference)
+		if _speedups is not None:
+			python_parse = python_parsers[platform]
+			assert [parse(path) for path in paths] == [python_parse(path) for path in paths]
+			report(f"{platform}/python parser", measure(lambda: [python_parse(path) for path in paths]), reference)
+			report(f"{platform}/compiled parser", measure(lambda: [parse(path) for path in paths]), reference)
+		else:
+			report(f"{platform}/parser", measure(lambda: [parse(path) for path in paths]), reference)
+
+		seconds = measure(lambda: [GPath(path, platform=platform) for path in paths])
+		print(f"{f'{platform}/constructor':<40} {count / seconds:>12,.0f} paths/s")
+		seconds = measure(lambda: GPath.from_many(paths, platform=platform))
+		print(f"{f'{platform}/from_many':<40} {count / seconds:>12,.0f} paths/s")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,74 @@
+"""
+	Measure how `GPath.partition()` scales with the number of input paths, and compare it with the previous implementation on the smallest input.
+
+	Usage: `python benchmarks/bench_partition.py [max_count]`
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+from gpath import GPath
+
+from util import format_time, measure, report
+
+
+def legacy_partition(gpaths: list[GPath], allow_current: bool=True, allow_parents: bool=False) -> dict[GPath, list[GPath]]:
+	# Previous O(n·k) implementation, kept as the reference for this benchmark
+	partition_map = {}
+	if len(gpaths) > 0:
+		partition_map[gpaths[0]] = [] if allow_parents else [gpaths[0]]
+
+	for path in gpaths[1:]:
+		partition_found = False
+		for partition in partition_map:
+			candidate_common = partition.common_with(path, allow_current=allow_current, allow_parents=allow_parents)
+			if candidate_common is not None:
+				partition_found = True
+				if candidate_common != partition:
+					partition_map[candidate_common] = partition_map[partition]
+					del partition_map[partition]
+				if not allow_parents:
+					partition_map[candidate_common].append(path)
+				break
+		if not partition_found:
+			partition_map[path] = [] if allow_parents else [path]
+
+	for partition, path_list in partition_map.items():
+		partition_map[partition] = [path.subpath_from(partition) for path in path_list]
+	return partition_map
+
+
+def make_paths(count: int, seed: int=0) -> list[GPath]:
+	# Relative paths under 1000 different top-level directories, plus absolute paths on a few drives
+	rng = random.Random(seed)
+	top_level = [f"project{i:03}" for i in range(1000)]
+	vocabulary = [f"dir{i:02}" for i in range(50)]
+	paths = []
+	for _ in range(count):
+		components = [rng.choice(top_level)] + [rng.choice(vocabulary) for _ in range(rng.randint(0, 6))]
+		prefix = rng.choice(["", "", "", "/", "C:/", "D:/", "../"])
+		paths.append(GPath(prefix + "/".join(components)))
+	return paths
+
+
+def main() -> None:
+	max_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+	paths = make_paths(10_000)
+	legacy_time = measure(legacy_partition, paths, False, repeat=1, number=1)
+	current_time = measure(lambda: GPath.partition(paths, allow_current=False), repeat=3, number=1)
+	report("10k paths: legacy", legacy_time)
+	report("10k paths: current", current_time, reference=legacy_time)
+
+	count = 10_000
+	while count <= max_count:
+		paths = make_paths(count)
+		current_time = measure(lambda: GPath.partition(paths, allow_current=False), repeat=3, number=1)
+		print(f"{count:>9} paths: {format_time(current_time):>12}  ({format_time(current_time / count)} per path)")
+		count *= 10
+
+
+if __name__ == '__main__':
+	main()
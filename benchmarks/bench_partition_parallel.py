@@ -0,0 +1,51 @@
+"""
+	Measure the speedup of `GPath.partition()` with multiple worker processes over the serial implementation, for increasing numbers of workers.
+
+	Usage: `python benchmarks/bench_partition_parallel.py [count] [max_processes]`
+
+	The speedup depends on the number of physical cores available; on a machine with fewer cores than workers, the extra workers only add overhead.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+from gpath import GPath
+
+from util import format_time
+
+
+def make_paths(count: int, seed: int=0) -> list[str]:
+	# Relative paths under 1000 different top-level directories, as strings to be parsed by the workers
+	rng = random.Random(seed)
+	top_level = [f"project{i:03}" for i in range(1000)]
+	vocabulary = [f"dir{i:02}" for i in range(50)]
+	return ["/".join([rng.choice(top_level)] + [rng.choice(vocabulary) for _ in range(rng.randint(0, 6))]) for _ in range(count)]
+
+
+def main() -> None:
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+	max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else max(os.cpu_count() or 1, 4)
+	paths = make_paths(count)
+	print(f"{count} paths, {os.cpu_count()} CPUs")
+
+	start = time.perf_counter()
+	expected = GPath.partition(paths, allow_current=False, allow_parents=False)
+	serial_time = time.perf_counter() - start
+	print(f"{'serial':<16} {format_time(serial_time):>12}")
+
+	processes = 2
+	while processes <= max_processes:
+		start = time.perf_counter()
+		result = GPath.partition(paths, allow_current=False, allow_parents=False, processes=processes)
+		elapsed = time.perf_counter() - start
+		assert list(result.items()) == list(expected.items())
+		print(f"{f'{processes} processes':<16} {format_time(elapsed):>12}  ({serial_time / elapsed:.2f}x)")
+		processes *= 2
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,39 @@
+"""
+	Compare repeated `str()` and `repr()` calls on the same GPaths with rendering a new RenderedPath every time.
+
+	Usage: `python benchmarks/bench_render.py`
+"""
+
+from __future__ import annotations
+
+from gpath import GPath, render
+from gpath.platform import Platform
+
+from util import measure, report
+
+
+def render_each_time(gpaths: list[GPath], platform: Platform) -> list[str]:
+	# Previous behaviour of str(), kept as the reference for this benchmark
+	return [str(render.get_type(platform)(gpath)) for gpath in gpaths]
+
+
+def render_cached(gpaths: list[GPath], platform: Platform) -> list[str]:
+	return [str(gpath.render(platform)) for gpath in gpaths]
+
+
+def main() -> None:
+	gpaths = [GPath(f"/srv/data/2024/shard-{i:03}/part-{i:05}.parquet") for i in range(10_000)]
+	for platform in Platform:
+		assert render_each_time(gpaths, platform) == render_cached(gpaths, platform)
+
+		legacy_time = measure(render_each_time, gpaths, platform)
+		current_time = measure(render_cached, gpaths, platform)
+		report(f"10k renders, {platform}: uncached", legacy_time)
+		report(f"10k renders, {platform}: cached", current_time, reference=legacy_time)
+
+	current_time = measure(lambda: [repr(gpath) for gpath in gpaths])
+	report("10k repr()", current_time)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,63 @@
+"""
+	Compare `render.render_many()` against calling `str()` on a new RenderedPath for each GPath, as done before batch rendering was added.
+
+	Usage: `python benchmarks/bench_render_many.py`
+"""
+
+from __future__ import annotations
+
+import io
+
+from gpath import GPath, _rules, render
+from gpath.platform import Platform
+
+from util import measure, report
+
+
+def legacy_render(path: GPath, platform: Platform) -> str:
+	# Previous implementation of RenderedPath.__str__() for each platform, kept as the reference for this benchmark
+	rendered_path = render.get_type(platform)(path)
+	if platform == Platform.POSIX:
+		if bool(rendered_path):
+			return (_rules.posix_rules.roots[0] if path.absolute else "") + _rules.posix_rules.separators[0].join(path.relative_parts)
+		return _rules.posix_rules.current_indicators[0]
+
+	rules = _rules.get_type(platform)
+	if bool(rendered_path):
+		return (path.drive + rules.drive_postfixes[0] if path.drive != "" else "") + (rules.roots[0] if path.absolute else "") + rules.separators[0].join(path.relative_parts)
+	return rules.current_indicators[0]
+
+
+def legacy_render_many(paths: list[GPath], platform: Platform) -> list[str]:
+	return [legacy_render(path, platform) for path in paths]
+
+
+def legacy_write_many(paths: list[GPath], platform: Platform) -> None:
+	file = io.StringIO()
+	for path in paths:
+		file.write(legacy_render(path, platform) + "\n")
+
+
+def write_many(paths: list[GPath], platform: Platform) -> None:
+	render.render_many(paths, platform, file=io.StringIO())
+
+
+def main() -> None:
+	paths = [GPath(f"C:/srv/data/2024/shard-{i % 1000:03}/part-{i:06}.parquet") for i in range(100_000)]
+	paths += [GPath(f"../../shard-{i % 1000:03}/part-{i:06}.parquet") for i in range(100_000)]
+	for platform in Platform:
+		assert render.render_many(paths, platform) == legacy_render_many(paths, platform)
+
+		legacy_time = measure(legacy_render_many, paths, platform, repeat=3)
+		current_time = measure(render.render_many, paths, platform, repeat=3)
+		report(f"{platform}, list: legacy", legacy_time)
+		report(f"{platform}, list: render_many", current_time, reference=legacy_time)
+
+		legacy_time = measure(legacy_write_many, paths, platform, repeat=3)
+		current_time = measure(write_many, paths, platform, repeat=3)
+		report(f"{platform}, file: legacy", legacy_time)
+		report(f"{platform}, file: render_many", current_time, reference=legacy_time)
+
+
+if __name__ == '__main__':
+	main()
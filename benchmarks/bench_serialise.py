@@ -0,0 +1,64 @@
+"""
+	Compare `serialise.dumps()` and `serialise.loads()` against pickle and newline-delimited text, in both size and speed.
+
+	Usage: `python benchmarks/bench_serialise.py [count]`
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from gpath import GPath, render, serialise
+
+from util import format_time
+
+
+def make_paths(count: int, seed: int=0) -> list[GPath]:
+	rng = random.Random(seed)
+	directories = [f"dir{i:03}" for i in range(200)]
+	paths = []
+	for i in range(count):
+		depth = rng.randint(3, 10)
+		paths.append(GPath("/srv/" + "/".join(rng.choice(directories) for _ in range(depth)) + f"/file{i:08}.dat"))
+	return paths
+
+
+def text_dumps(paths: list[GPath]) -> bytes:
+	return "\n".join(render.render_many(paths, 'posix')).encode('utf_8')
+
+
+def text_loads(data: bytes) -> list[GPath]:
+	return GPath.from_many(data.decode('utf_8').split("\n"))
+
+
+def time_once(func: Callable[..., Any], *args: Any) -> tuple[float, Any]:
+	start = time.perf_counter()
+	result = func(*args)
+	return time.perf_counter() - start, result
+
+
+def main() -> None:
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+	paths = make_paths(count)
+	print(f"{count} paths")
+
+	for name, dumps, loads in (
+		("pickle", lambda paths: pickle.dumps(paths, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+		("text", text_dumps, text_loads),
+		("serialise", serialise.dumps, serialise.loads),
+		("serialise, sorted", lambda paths: serialise.dumps(paths, sort=True), serialise.loads),
+	):
+		dump_time, data = time_once(dumps, paths)
+		load_time, loaded = time_once(loads, data)
+		if name != "serialise, sorted":
+			assert loaded == paths
+		print(f"{name:<20} {len(data) / 2**20:8.1f} MiB  dump {format_time(dump_time):>12}  load {format_time(load_time):>12}")
+
+
+if __name__ == '__main__':
+	main()
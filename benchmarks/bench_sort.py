@@ -0,0 +1,60 @@
+"""
+	Compare sorting paths with `render.sorted_paths()` and with cached `RenderedPath.sort_key` against sorting RenderedPaths that rebuild their keys on every comparison, as done before the keys were cached.
+
+	Usage: `python benchmarks/bench_sort.py [count]`
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from gpath import GPath, render
+
+from util import format_time
+
+
+class LegacyPosixRenderedPath(render.PosixRenderedPath):
+	# Previous implementation of comparisons, kept as the reference for this benchmark
+	__slots__ = ()
+
+	def __lt__(self, other) -> bool:
+		return self._tuple < other._tuple
+
+
+def make_paths(count: int, seed: int=0) -> list[GPath]:
+	rng = random.Random(seed)
+	vocabulary = [f"dir{i:02}" for i in range(50)]
+	return [GPath("/" + "/".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 8)))) for _ in range(count)]
+
+
+def time_once(func) -> tuple[float, list]:
+	# Sorting a large list is measured once, since the list is not re-sorted in real use and repeats would only sort sorted input
+	start = time.perf_counter()
+	result = func()
+	return time.perf_counter() - start, result
+
+
+def main() -> None:
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+	paths = make_paths(count)
+	print(f"{count} paths")
+
+	legacy_rendered = [LegacyPosixRenderedPath(path) for path in paths]
+	legacy_time, legacy_result = time_once(lambda: sorted(legacy_rendered))
+	expected = [rendered_path._path for rendered_path in legacy_result]
+	print(f"{'sorted(RenderedPath)/legacy':<40} {format_time(legacy_time):>12}")
+
+	rendered = [render.PosixRenderedPath(path) for path in paths]
+	seconds, result = time_once(lambda: sorted(rendered))
+	assert [rendered_path._path for rendered_path in result] == expected
+	print(f"{'sorted(RenderedPath)/sort_key':<40} {format_time(seconds):>12}  ({legacy_time / seconds:.1f}x)")
+
+	seconds, result = time_once(lambda: render.sorted_paths(paths, 'posix'))
+	assert result == expected
+	print(f"{'sorted_paths':<40} {format_time(seconds):>12}  ({legacy_time / seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+	main()
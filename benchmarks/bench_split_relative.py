@@ -0,0 +1,70 @@
+"""
+	Compare the parser of each platform against the previous character-by-character implementation of splitting, on long path strings.
+
+	Usage: `python benchmarks/bench_split_relative.py`
+"""
+
+from __future__ import annotations
+
+import random
+
+from gpath import _rules
+from gpath._gpath import _parsers_of_platforms
+from gpath.platform import Platform
+
+from util import measure, report
+
+
+def legacy_split_relative(path: str, delimiters, collapse: bool=True) -> list[str]:
+	# Previous quadratic implementation, kept as the reference for this benchmark
+	if path == "":
+		return [path]
+	if delimiters == "" or len(delimiters) == 0:
+		return [path]
+
+	delimiter_iter = iter(delimiters)
+	delimiter = next(delimiter_iter)
+	for d in delimiter_iter:
+		path = path.replace(d, delimiter)
+
+	if collapse:
+		new_path = delimiter
+		for c in path:
+			if c == delimiter and new_path[-1] == delimiter:
+				pass
+			else:
+				new_path += c
+		path = new_path[1:]
+
+	return path.split(delimiter)
+
+
+def make_path(length: int, separators: list[str], seed: int=0) -> str:
+	rng = random.Random(seed)
+	components = []
+	total = 0
+	while total < length:
+		component = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789-_") for _ in range(rng.randint(1, 16)))
+		separator = rng.choice(separators) * rng.choice([1, 1, 1, 2])
+		components.append(component + separator)
+		total += len(component) + len(separator)
+	return "".join(components)[:length]
+
+
+def main() -> None:
+	for platform, rules in ((Platform.POSIX, _rules.posix_rules), (Platform.WINDOWS, _rules.windows_rules)):
+		parse = _parsers_of_platforms[platform]
+		for length in (1024, 32 * 1024):
+			path = make_path(length, rules.separators)
+			# The parser also drops the empty parts left by repeated separators, which the legacy splitting kept
+			assert parse(path)[0] == tuple(part for part in legacy_split_relative(path, rules.separators) if part != "")
+
+			legacy_time = measure(legacy_split_relative, path, rules.separators)
+			current_time = measure(parse, path)
+			label = f"{rules.__name__}, {length // 1024} KB"
+			report(f"{label}: legacy", legacy_time)
+			report(f"{label}: current", current_time, reference=legacy_time)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,80 @@
+"""
+	Compare reading a large file of paths with `stream.read_paths()` and `stream.read_paths_mmap()` against building a list of GPaths from its lines, in both time and peak memory.
+
+	Usage: `python benchmarks/bench_stream.py [count]`
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from gpath import GPath, stream
+
+from util import format_time
+
+
+def legacy_read(file_path: str) -> int:
+	# Previous approach of loading every path into memory at once, kept as the reference for this benchmark
+	with open(file_path) as file:
+		paths = [GPath(line.rstrip("\n")) for line in file]
+	return len(paths)
+
+
+def stream_read(file_path: str) -> int:
+	with open(file_path) as file:
+		return sum(1 for _ in stream.read_paths(file))
+
+
+def stream_read_bytes(file_path: str) -> int:
+	with open(file_path, 'rb') as file:
+		return sum(1 for _ in stream.read_paths(file))
+
+
+def stream_read_mmap(file_path: str) -> int:
+	return sum(1 for _ in stream.read_paths_mmap(file_path))
+
+
+def stream_copy(file_path: str) -> int:
+	with open(file_path) as file, open(os.devnull, 'w') as output:
+		stream.write_paths(stream.read_paths(file), output, platform='windows')
+	return 0
+
+
+def run(name: str, func: Callable[[str], Any], file_path: str) -> None:
+	start = time.perf_counter()
+	func(file_path)
+	elapsed = time.perf_counter() - start
+
+	tracemalloc.start()
+	func(file_path)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	print(f"{name:<24} {format_time(elapsed):>12}  peak {peak / 2**20:8.1f} MiB")
+
+
+def main() -> None:
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+	with tempfile.TemporaryDirectory() as directory:
+		file_path = os.path.join(directory, "paths.txt")
+		with open(file_path, 'w') as file:
+			for i in range(count):
+				file.write(f"/srv/data/2024/shard-{i % 1000:03}/part-{i:07}.parquet\n")
+
+		assert legacy_read(file_path) == stream_read(file_path) == stream_read_bytes(file_path) == stream_read_mmap(file_path) == count
+
+		print(f"{count} paths, {os.path.getsize(file_path) / 2**20:.1f} MiB")
+		run("legacy list", legacy_read, file_path)
+		run("read_paths, text", stream_read, file_path)
+		run("read_paths, bytes", stream_read_bytes, file_path)
+		run("read_paths_mmap", stream_read_mmap, file_path)
+		run("read and write_paths", stream_copy, file_path)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,281 @@
+"""
+	Benchmark suite covering the hot paths of GPath on deterministic path corpora, with comparison against a stored baseline.
+
+	Usage: `python benchmarks/suite.py [--output FILE] [--baseline FILE] [--save-baseline] [--threshold RATIO] [--filter TEXT] [--quick]`
+
+	The results are printed as a table, and written as JSON to `--output` if given. If the baseline file exists, every case is compared against it, and the script exits with status 1 if any case is slower than the baseline by more than `--threshold`.
+
+	To make runs comparable when the speed of the machine drifts, every case is compared relative to a fixed calibration workload that does not use GPath. Timings still depend on the machine and the Python version, so the baseline should be regenerated using `--save-baseline` on whichever machine the suite is normally run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+from collections.abc import Callable
+from typing import Any, Optional
+
+from gpath import GPath
+from gpath._gpath import _parsers_of_platforms
+from gpath.platform import Platform
+
+from util import format_time, measure
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 1.25
+
+SEED = 20240101
+CORPUS_SIZE = 2000
+BYTES_ENCODINGS = ('utf_8', 'utf_16_le', 'latin_1', 'shift_jis')
+
+
+def make_name(rng: random.Random) -> str:
+	return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789-_") for _ in range(rng.randint(3, 12)))
+
+
+def deep_posix_corpus(rng: random.Random, count: int) -> list[str]:
+	# Files in a deep tree with a small vocabulary of directory names, like a source checkout or a data lake
+	vocabulary = [make_name(rng) for _ in range(50)]
+	paths = []
+	for _ in range(count):
+		depth = rng.randint(8, 24)
+		paths.append("/" + "/".join(rng.choice(vocabulary) for _ in range(depth)) + f"/{make_name(rng)}.txt")
+	return paths
+
+
+def windows_corpus(rng: random.Random, count: int) -> list[str]:
+	vocabulary = ["Program Files", "Users", "AppData", "Local", "Temp", "Windows", "System32"] + [make_name(rng) for _ in range(30)]
+	paths = []
+	for _ in range(count):
+		drive = rng.choice("CDEZ")
+		separator = rng.choice(["\\", "\\", "/"])
+		depth = rng.randint(2, 10)
+		paths.append(f"{drive}:" + separator + separator.join(rng.choice(vocabulary) for _ in range(depth)) + f"{separator}{make_name(rng)}.dll")
+	return paths
+
+
+def parent_heavy_corpus(rng: random.Random, count: int) -> list[str]:
+	# Relative paths that mix many parent and current directory indicators with named components
+	paths = []
+	for _ in range(count):
+		parts = []
+		for _ in range(rng.randint(10, 40)):
+			choice = rng.random()
+			if choice < 0.4:
+				parts.append("..")
+			elif choice < 0.5:
+				parts.append(".")
+			else:
+				parts.append(make_name(rng))
+		paths.append("/".join(parts))
+	return paths
+
+
+def long_corpus(rng: random.Random, count: int, length: int, separators: str) -> list[str]:
+	# Very long relative paths with occasional repeated separators, which stress the parsers rather than GPath itself
+	paths = []
+	for _ in range(count):
+		components = []
+		total = 0
+		while total < length:
+			component = make_name(rng) + rng.choice(separators) * rng.choice([1, 1, 1, 2])
+			components.append(component)
+			total += len(component)
+		paths.append("".join(components)[:length])
+	return paths
+
+
+def bytes_corpora(rng: random.Random, count: int) -> dict[str, list[bytes]]:
+	# Non-ASCII names that can be represented in every one of BYTES_ENCODINGS
+	vocabulary = {
+		'utf_8': ["données", "日本語", "résumé", "データ", "κείμενο"],
+		'utf_16_le': ["données", "日本語", "résumé", "データ", "κείμενο"],
+		'latin_1': ["données", "résumé", "naïve", "façade", "über"],
+		'shift_jis': ["日本語", "データ", "ファイル", "設定", "画像"],
+	}
+	corpora = {}
+	for encoding in BYTES_ENCODINGS:
+		names = vocabulary[encoding] + [make_name(rng) for _ in range(10)]
+		paths = []
+		for _ in range(count):
+			depth = rng.randint(3, 12)
+			paths.append(("/srv/" + "/".join(rng.choice(names) for _ in range(depth))).encode(encoding))
+		corpora[encoding] = paths
+	return corpora
+
+
+def calibration_workload() -> list[str]:
+	# Plain string and list operations of a similar mix to GPath, used to normalise for the speed of the machine
+	output = []
+	for i in range(2000):
+		parts = f"/srv/data/{i}/../shard/{i % 7}/file.txt".split("/")
+		stack: list[str] = []
+		for part in parts:
+			if part == "..":
+				stack.pop()
+			elif part != "":
+				stack.append(part)
+		output.append("/".join(stack))
+	return output
+
+
+def make_cases(quick: bool) -> list[tuple[str, Callable[[], Any]]]:
+	rng = random.Random(SEED)
+	count = CORPUS_SIZE // 10 if quick else CORPUS_SIZE
+
+	posix_strs = deep_posix_corpus(rng, count)
+	windows_strs = windows_corpus(rng, count)
+	parent_strs = parent_heavy_corpus(rng, count)
+	bytes_paths = bytes_corpora(rng, count)
+
+	posix_gpaths = [GPath(p) for p in posix_strs]
+	windows_gpaths = [GPath(p, platform='windows') for p in windows_strs]
+	parent_gpaths = [GPath(p) for p in parent_strs]
+	posix_pairs = list(zip(posix_gpaths, posix_gpaths[1:] + posix_gpaths[:1]))
+	windows_pairs = list(zip(windows_gpaths, windows_gpaths[1:] + windows_gpaths[:1]))
+	parent_pairs = list(zip(parent_gpaths, parent_gpaths[1:] + parent_gpaths[:1]))
+
+	long_paths = {
+		(target, length): long_corpus(rng, max(1, count * 1024 // length // 10), length, separators)
+		for target, separators in ((Platform.POSIX, "/"), (Platform.WINDOWS, "\\/"))
+		for length in (1024, 32 * 1024)
+	}
+
+	# Bases that every path in the pair shares, so that relpath_from() does not give up early
+	relpath_pairs = [(a, a.common_with(b) or GPath("/")) for a, b in posix_pairs]
+
+	join_segments = [posix_gpaths[0]] + [GPath(p) for p in parent_strs[:100]]
+
+	cases: list[tuple[str, Callable[[], Any]]] = [
+		("init/posix", lambda: [GPath(p) for p in posix_strs]),
+		("init/windows", lambda: [GPath(p, platform='windows') for p in windows_strs]),
+		("init/parents", lambda: [GPath(p) for p in parent_strs]),
+	]
+	for encoding in BYTES_ENCODINGS:
+		paths = bytes_paths[encoding]
+		cases.append((f"init/bytes-{encoding}", lambda paths=paths, encoding=encoding: [GPath(p, encoding=encoding) for p in paths]))
+
+	cases += [
+		("from_many/posix", lambda: GPath.from_many(posix_strs)),
+		("common_with/posix", lambda: [a.common_with(b) for a, b in posix_pairs]),
+		("common_with/windows", lambda: [a.common_with(b) for a, b in windows_pairs]),
+		("common_with/parents", lambda: [a.common_with(b, allow_parents=True) for a, b in parent_pairs]),
+		("relpath_from/posix", lambda: [a.relpath_from(b) for a, b in relpath_pairs]),
+		("relpath_from/parents", lambda: [a.relpath_from(b) for a, b in parent_pairs]),
+		("partition/posix", lambda: GPath.partition(posix_gpaths)),
+		("partition/windows", lambda: GPath.partition(windows_gpaths)),
+		("partition/parents", lambda: GPath.partition(parent_gpaths, allow_parents=True)),
+		("join/mixed", lambda: GPath.join(join_segments)),
+		("add/posix", lambda: [a + b for a, b in zip(posix_gpaths, parent_gpaths)]),
+		("eq/posix", lambda: [a == b for a, b in posix_pairs]),
+		("hash/posix-uncached", lambda: [hash(GPath(g)) for g in posix_gpaths]),
+	]
+	for (target, length), paths in long_paths.items():
+		parse = _parsers_of_platforms[target]
+		cases.append((f"parse/{target}-{length // 1024}kb", lambda parse=parse, paths=paths: [parse(p) for p in paths]))
+	for target in (Platform.POSIX, Platform.WINDOWS):
+		cases.append((f"render/{target}", lambda target=target: [str(GPath(g).render(target)) for g in posix_gpaths]))
+
+	return cases
+
+
+def run(cases: list[tuple[str, Callable[[], Any]]], repeat: int) -> dict[str, float]:
+	results = {}
+	for name, func in cases:
+		gc.collect()  # Do not charge the garbage of earlier cases to this one
+		seconds = measure(func, repeat=repeat)
+		results[name] = seconds
+		print(f"{name:<32} {format_time(seconds):>12}", flush=True)
+	return results
+
+
+def write_json(document: dict[str, Any], path: str) -> None:
+	with open(path, 'w') as file:
+		json.dump(document, file, indent='\t', sort_keys=True)
+		file.write("\n")
+
+
+def compare(document: dict[str, Any], baseline_document: dict[str, Any], cases: dict[str, Callable[[], Any]], threshold: float, repeat: int) -> list[str]:
+	"""
+		Print the ratio of each result against the baseline, after normalising both by their calibration times, and return the names of the cases that regressed by more than `threshold`.
+
+		Cases that appear to have regressed are measured once more before being reported, to filter out interference from other processes; the better of the two timings is kept in `document`.
+	"""
+	results = document['results']
+	baseline = baseline_document['results']
+	scale = baseline_document['calibration'] / document['calibration']
+	print(f"\n{'calibration':<32} {1 / scale:>11.2f}x  (not normalised)")
+
+	regressions = []
+	for name in results:
+		if name not in baseline:
+			print(f"{name:<32} {'(new)':>12}")
+			continue
+		ratio = results[name] * scale / baseline[name]
+		if ratio > threshold:
+			results[name] = min(results[name], measure(cases[name], repeat=repeat))
+			ratio = results[name] * scale / baseline[name]
+		marker = ""
+		if ratio > threshold:
+			marker = "  REGRESSION"
+			regressions.append(name)
+		print(f"{name:<32} {ratio:>11.2f}x{marker}")
+	return regressions
+
+
+def main(argv: Optional[list[str]]=None) -> int:
+	parser = argparse.ArgumentParser(description="Run the GPath benchmark suite.")
+	parser.add_argument('--output', help="write the results as JSON to this file")
+	parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file to compare against (default: %(default)s)")
+	parser.add_argument('--save-baseline', action='store_true', help="overwrite the baseline with the results of this run instead of comparing against it")
+	parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="maximum allowed ratio of current time to baseline time (default: %(default)s)")
+	parser.add_argument('--filter', default="", help="only run cases whose name contains this text")
+	parser.add_argument('--quick', action='store_true', help="use smaller corpora and fewer rounds, for a smoke test; results are not comparable with a full run")
+	args = parser.parse_args(argv)
+
+	cases = {name: func for name, func in make_cases(args.quick) if args.filter in name}
+	repeat = 2 if args.quick else 5
+	calibration = measure(calibration_workload, repeat=repeat)
+	results = run(list(cases.items()), repeat=repeat)
+	# Measure calibration again at the end, since the speed of the machine can drift during the run
+	calibration = min(calibration, measure(calibration_workload, repeat=repeat))
+
+	document = {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'machine': platform.machine(),
+		'quick': args.quick,
+		'calibration': calibration,
+		'results': results,
+	}
+
+	status = 0
+	if args.save_baseline:
+		write_json(document, args.baseline)
+		print(f"\nSaved baseline to {args.baseline}")
+	elif not os.path.exists(args.baseline):
+		print(f"\nNo baseline found at {args.baseline}; run with --save-baseline to create one")
+	else:
+		with open(args.baseline) as file:
+			baseline = json.load(file)
+		if baseline.get('quick', False) != args.quick or 'calibration' not in baseline:
+			print("\nBaseline was recorded with a different corpus size; skipping comparison")
+		else:
+			regressions = compare(document, baseline, cases, args.threshold, repeat)
+			if len(regressions) > 0:
+				print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold}x: {', '.join(regressions)}", file=sys.stderr)
+				status = 1
+
+	if args.output is not None:
+		write_json(document, args.output)
+	return status
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import timeit
+from typing import Any, Callable, Optional
+
+
+def measure(func: Callable[..., Any], *args: Any, repeat: int=5, number: Optional[int]=None) -> float:
+	"""
+		Return the best time in seconds taken by a single call of `func(*args)`, out of `repeat` rounds.
+
+		If `number` is not given, the number of calls per round is chosen automatically so that each round takes at least 0.2 seconds.
+	"""
+	timer = timeit.Timer(lambda: func(*args))
+	if number is None:
+		number, _ = timer.autorange()
+	return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds: float) -> str:
+	for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+		if seconds >= scale:
+			return f"{seconds / scale:.3f} {unit}"
+	return f"{seconds / 1e-9:.1f} ns"
+
+
+def report(name: str, seconds: float, reference: Optional[float]=None) -> None:
+	"""
+		Print the timing of a single benchmark case, and its speedup over `reference` if given.
+	"""
+	if reference is None:
+		print(f"{name:<40} {format_time(seconds):>12}")
+	else:
+		print(f"{name:<40} {format_time(seconds):>12}  ({reference / seconds:.1f}x)")
@@ -0,0 +1,9 @@
+from setuptools import Extension, setup
+
+
+# The compiled accelerator is optional: if it cannot be built, for example because there is no C compiler, the package is installed without it and falls back to the pure-Python implementation
+setup(
+	ext_modules=[
+		Extension('gpath._speedups', sources=['src/gpath/_speedups.c'], optional=True),
+	],
+)
@@ -5,7 +5,9 @@
 
 __version__ = '0.4.5'
 
-from . import platform, render
+from . import cache, instrument, interning, platform, render, serialise, stream
+from ._builder import GPathBuilder
 from ._gpath import GPath, GPathLike
+from ._index import GPathIndex
 
-__all__ = ('GPath', 'GPathLike', 'platform', 'render')
+__all__ = ('GPath', 'GPathBuilder', 'GPathIndex', 'GPathLike', 'cache', 'instrument', 'interning', 'platform', 'render', 'serialise', 'stream')
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+
+from . import interning, _rules
+from ._gpath import GPath, GPathLike
+from ._nodes import PathNode, make_node
+from .platform import Platform
+
+
+__all__ = ('GPathBuilder',)
+
+
+class GPathBuilder:
+	"""
+		A mutable path that is built up or taken down one component at a time, and can be turned into a GPath at any point.
+
+		Repeatedly using <code><var>g</var> / <var>name</var></code> and <code><var>g</var> - 1</code> to walk a directory tree creates a new GPath and copies all of its components at every step. Instead, the builder keeps a stack of the components that were pushed since the last call to `freeze()`, on top of the components already in the compact representation (see `GPath.__init__()`), so that `push()` and `pop()` take constant time, and `freeze()` only has to convert the newly pushed components. GPaths frozen from the same builder share the memory used by their common prefixes.
+
+		Components are added and removed with the same semantics as `GPath.__add__()` and `GPath.__sub__()`, including for parent directories and the filesystem root.
+
+		Examples
+		--------
+		```python
+		builder = GPathBuilder("/srv")
+		builder.push("data")
+		builder.push("2024")
+		builder.freeze()          # GPath("/srv/data/2024")
+		builder.pop()
+		builder.extend("../logs")
+		builder.freeze()          # GPath("/srv/logs")
+		```
+	"""
+
+	__slots__ = ('_node', '_pending', '_root', '_drive', '_parent_level', '_platform', '_encoding', '_separators')
+
+	def __init__(self,
+		path: GPathLike="",
+		platform: Optional[Union[str, Platform]]=None,
+		encoding: Optional[str]=None,
+	):
+		"""
+			Initialise a builder starting from `path`.
+
+			Parameters
+			----------
+			`path`
+			: the initial path, which is parsed in the same way as by `GPath.__init__()`
+
+			`​platform`
+			: interpret `path` as originating from a specific platform (see `GPath.__init__()`); the platform also determines which separators are not allowed in the components given to `push()`, and propagates to GPaths returned by `freeze()`
+
+			`​encoding`
+			: the text encoding that should be used to decode paths given as bytes-like objects (see `GPath.__init__()`)
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+		"""
+		path = GPath(path, platform=platform, encoding=encoding, compact=True)
+		path._validate()
+		self._node: PathNode = path._parts  # type: ignore
+		self._pending: list[str] = []  # Components after `_node` that have not been converted to the compact representation yet
+		self._root: bool = path._root
+		self._drive: str = path._drive
+		self._parent_level: int = path._parent_level
+		self._platform: Optional[Platform] = path._platform
+		self._encoding: Optional[str] = path._encoding
+		self._separators: tuple[str, ...] = tuple(_rules.get_type(Platform.GENERIC if self._platform is None else self._platform).separators)
+
+	def push(self, name: str) -> None:
+		"""
+			Add a single component to the end of the path, in constant time.
+
+			The parent directory indicator `..` removes the last component instead, as with `pop()`, while the current directory indicator `.` and the empty string have no effect.
+
+			Raises
+			------
+			`ValueError` if `name` contains a path separator of the platform of the builder; use `extend()` to add multiple components at once
+		"""
+		if name == "" or name == _rules.COMMON_CURRENT_INDICATOR:
+			return
+		if name == _rules.COMMON_PARENT_INDICATOR:
+			self.pop()
+			return
+		for separator in self._separators:
+			if separator in name:
+				raise ValueError(f"path component cannot contain a separator: {repr(name)}")
+
+		if interning._pool is not None:
+			name = interning._pool.intern(name)
+		self._pending.append(name)
+
+	def pop(self, n: int=1) -> None:
+		"""
+			Remove `n` components from the end of the path, in time proportional to `n`.
+
+			As with `GPath.__sub__()`, removing more components than there are named components moves up to a parent directory for a relative path, and stops at the filesystem root for an absolute path.
+
+			Raises
+			------
+			`ValueError` if `n` is negative
+		"""
+		if n < 0:
+			raise ValueError(f"cannot remove a negative number of components from the path: {n}")
+		pending = self._pending
+		if n <= len(pending):
+			if n > 0:
+				del pending[-n:]
+			return
+		n -= len(pending)
+		pending.clear()
+
+		node = self._node
+		removed = min(n, len(node))
+		if not self._root:
+			self._parent_level += n - removed
+		self._node = node.ancestor(len(node) - removed)
+
+	def extend(self, other: GPathLike) -> None:
+		"""
+			Add `other` to the end of the path, with the same result as <code><var>g</var> + <var>other</var></code> (see `GPath.__add__()`), in time proportional to the number of components of `other`.
+
+			Raises
+			------
+			`ValueError` if `other` is an invalid GPath
+		"""
+		if isinstance(other, GPath):
+			other._validate()
+		else:
+			other = GPath(other, encoding=self._encoding)
+
+		self._flush()
+		if other._root:
+			self._node = make_node(other._parts)
+			self._root = True
+			self._parent_level = 0
+		else:
+			node = self._node
+			removed = min(other._parent_level, len(node))  # parent of directory of root is still root
+			if not self._root:
+				self._parent_level += other._parent_level - removed
+			self._node = node.ancestor(len(node) - removed).descendant(other._parts)
+
+		if other._drive != "":
+			self._drive = other._drive
+
+	def freeze(self) -> GPath:
+		"""
+			Get the current path as a new GPath in the compact representation, in time proportional to the number of components pushed since the last call to `freeze()`.
+
+			The builder can still be modified afterwards without affecting the GPath.
+		"""
+		self._flush()
+		return GPath._from_fields(self._node, self._root, self._drive, self._parent_level, self._platform, self._encoding)
+
+	def __len__(self) -> int:
+		"""
+			Get the number of named components of the current path, excluding any parent directories.
+
+			Usage: <code>len(<var>builder</var>)</code>
+		"""
+		return len(self._node) + len(self._pending)
+
+	def _flush(self) -> None:
+		# Convert the pending components to the compact representation
+		if len(self._pending) > 0:
+			self._node = self._node.descendant(self._pending)
+			self._pending.clear()
+
+	def __repr__(self) -> str:
+		"""
+			Return a string that, when printed, gives the Python code associated with instantiating a copy of the builder.
+
+			Usage: <code>repr(<var>builder</var>)</code>
+		"""
+		# Pending components are not flushed, so that inspecting the builder, such as in a debugger, does not change its state
+		path = GPath._from_fields((*self._node.to_tuple(), *self._pending), self._root, self._drive, self._parent_level, self._platform, self._encoding)
+		return f"GPathBuilder({repr(path)})"
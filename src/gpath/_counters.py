@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Callable
+
+
+class Counters:
+	# Statistics of a single thread, which are only ever incremented by that thread
+	__slots__ = ('hits', 'misses', 'saved_bytes')
+
+	def __init__(self):
+		self.hits: int = 0
+		self.misses: int = 0
+		self.saved_bytes: int = 0
+
+	def add(self, other: Counters) -> None:
+		self.hits += other.hits
+		self.misses += other.misses
+		self.saved_bytes += other.saved_bytes
+
+	def reset(self) -> None:
+		self.hits = 0
+		self.misses = 0
+		self.saved_bytes = 0
+
+
+class ThreadCounters:
+	# Statistics that are counted separately by each thread, since `+=` on a shared counter could lose updates without a lock, and summed when read
+	# The statistics of each thread are created by `factory`, which must return an object with the methods `add(other)` and `reset()`, such as Counters
+	# The counters of the current thread are looked up as `local.counters`, falling back to `get()` on AttributeError, which avoids a method call on the fast path
+	# The counters of threads that have exited are folded into a single total whenever a new thread is added or the statistics are read, so that a pool of short-lived threads does not accumulate them
+
+	__slots__ = ('local', '_factory', '_lock', '_threads', '_retired')
+
+	def __init__(self, factory: Callable[[], Any]=Counters):
+		self.local: threading.local = threading.local()
+		self._factory: Callable[[], Any] = factory
+		self._lock: threading.Lock = threading.Lock()
+		self._threads: list[tuple[weakref.ref[threading.Thread], Any]] = []
+		self._retired: Any = factory()
+
+	def get(self) -> Any:
+		# Get the counters of the current thread, adding them if this is the first time the thread counts anything
+		try:
+			return self.local.counters
+		except AttributeError:
+			counters = self._factory()
+			self.local.counters = counters
+			with self._lock:
+				self._retire()
+				self._threads.append((weakref.ref(threading.current_thread()), counters))
+			return counters
+
+	def _retire(self) -> None:
+		# Fold the counters of threads that have exited into the total; must be called with the lock held
+		threads = []
+		for thread_ref, counters in self._threads:
+			thread = thread_ref()
+			if thread is None or not thread.is_alive():
+				self._retired.add(counters)
+			else:
+				threads.append((thread_ref, counters))
+		self._threads = threads
+
+	def total(self) -> Any:
+		# Get the sum of the counters of all threads, including those that have exited
+		with self._lock:
+			self._retire()
+			total = self._factory()
+			total.add(self._retired)
+			for _, counters in self._threads:
+				total.add(counters)
+			return total
+
+	def reset(self) -> None:
+		with self._lock:
+			self._retired = self._factory()
+			for _, counters in self._threads:
+				counters.reset()
@@ -3,13 +3,19 @@ from __future__ import annotations
 import os
 import sys
 from collections.abc import Collection, Hashable, Iterator, Iterable, Sequence, Sized
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from . import render, _rules
+from . import interning, render, _rules
 from .platform import Platform
+from ._nodes import PathNode, make_node
 
 from ._compat import Final, Union
 
+try:
+	from . import _speedups
+except ImportError:
+	_speedups = None  # The optional compiled accelerator was not built
+
 
 __all__ = ('GPath', 'GPathLike')
 
@@ -23,39 +29,10 @@ else:
 
 
 DEFAULT_PLATFORM: Final = Platform.GENERIC
+LOCAL_PLATFORM: Final = Platform.WINDOWS if os.name == 'nt' else Platform.POSIX
 DEFAULT_ENCODING: Final = 'utf-8'
 
 
-def _split_relative(
-	path: str,
-	delimiters: Union[str, Collection[str]],
-	collapse: bool=True
-) -> list[str]:
-	if path == "":
-		return [path]
-
-	if delimiters == "" or len(delimiters) == 0:
-		return [path]
-
-	if isinstance(delimiters, Iterable):
-		delimiter_iter = iter(delimiters)
-		delimiter = next(delimiter_iter)
-		for d in delimiter_iter:
-			path = path.replace(d, delimiter)
-
-	if collapse:
-		# Assumes len(delimiter) == 1
-		new_path = delimiter
-		for c in path:
-			if c == delimiter and new_path[-1] == delimiter:
-				pass
-			else:
-				new_path += c
-		path = new_path[1:]
-
-	return path.split(delimiter)
-
-
 def _normalise_relative(
 	parts: Sequence[str],
 	current_dirs: Collection[str]=_rules.COMMON_CURRENT_INDICATOR,
@@ -77,6 +54,296 @@ def _normalise_relative(
 	return output
 
 
+def _make_parser(rules, with_drive: bool) -> Callable[[str], tuple[tuple[str, ...], bool, str, int]]:
+	# Precompile the rules of a platform into a function returning the values of (_parts, _root, _drive, _parent_level), using the compiled accelerator if it is available
+	drive_postfixes = rules.drive_postfixes if with_drive else []
+	if _speedups is not None and all(len(indicator) == 1 for indicator in (*drive_postfixes, *rules.separators)):
+		return _speedups.Parser("".join(drive_postfixes), "".join(rules.separators), rules.current_indicators[0], rules.parent_indicators[0], interning)
+	return _make_python_parser(rules, with_drive)
+
+
+def _make_python_parser(rules, with_drive: bool) -> Callable[[str], tuple[tuple[str, ...], bool, str, int]]:
+	# Pure-Python implementation of `_make_parser()`, which looks up the rules once instead of on every call
+	drive_postfixes = frozenset(rules.drive_postfixes) if with_drive else frozenset()
+	separator = rules.separators[0]
+	other_separators = tuple(rules.separators[1:])
+	# Every root indicator is also a separator, so roots can be detected after the separators are unified
+	current = rules.current_indicators[0]
+	parent = rules.parent_indicators[0]
+
+	def parse(path: str) -> tuple[tuple[str, ...], bool, str, int]:
+		if len(path) >= 2 and path[1] in drive_postfixes:
+			drive = path[0]
+			path = path[2:]
+		else:
+			drive = ""
+
+		for other_separator in other_separators:
+			path = path.replace(other_separator, separator)
+		root = path.startswith(separator)
+		if root:
+			path = path[1:]
+		parts = path.split(separator)
+
+		if "" in parts or current in parts or parent in parts:
+			parts = _normalise_relative(parts, current, parent)
+			parent_level = 0
+			while parent_level < len(parts) and parts[parent_level] == parent:
+				parent_level += 1
+			if parent_level > 0:
+				parts = parts[parent_level:]
+		else:
+			parent_level = 0  # Already normalised, which is the common case
+
+		if interning._pool is None:
+			named_parts = tuple(parts)
+		else:
+			named_parts = interning._pool.intern_parts(parts)
+		return (named_parts, root, drive, 0 if root else parent_level)
+
+	return parse
+
+
+_parse_generic: Final = _make_parser(_rules.generic_rules, with_drive=True)
+_parse_posix: Final = _make_parser(_rules.posix_rules, with_drive=False)
+_parse_windows: Final = _make_parser(_rules.windows_rules, with_drive=True)
+
+_parsers_of_platforms: dict[Platform, Callable[[str], tuple[tuple[str, ...], bool, str, int]]] = {
+	Platform.GENERIC: _parse_generic,
+	Platform.POSIX: _parse_posix,
+	Platform.WINDOWS: _parse_windows,
+}
+
+
+_platforms_with_drives: Final = frozenset((Platform.GENERIC, Platform.WINDOWS))
+
+
+def _parse_canonical(path: str, platform: Platform) -> Optional[tuple[tuple[str, ...], bool, str, int]]:
+	# Return the values of (_parts, _root, _drive, _parent_level) if `path` is canonical, or None otherwise
+	# A path is canonical if it is exactly the generic rendering of its own normalised form, i.e. `str(GPath(path)) == path`, which holds for most real-world paths; such paths can be parsed by splitting alone, without normalisation
+	if path == "" or "\\" in path:
+		return None
+	if platform in _platforms_with_drives and len(path) >= 2 and path[1] == ":":
+		drive = path[0]
+		path = path[2:]
+	else:
+		drive = ""
+
+	root = path.startswith("/")
+	if root:
+		path = path[1:]
+	parts = path.split("/") if path != "" else []
+	parent_level = 0
+	while parent_level < len(parts) and parts[parent_level] == "..":
+		parent_level += 1
+	if parent_level > 0:
+		if root:
+			return None
+		parts = parts[parent_level:]
+	if "" in parts or "." in parts or ".." in parts:
+		return None
+
+	if interning._pool is None:
+		named_parts = tuple(parts)
+	else:
+		named_parts = interning._pool.intern_parts(parts)
+	return (named_parts, root, drive, parent_level)
+
+
+def _parse_operand(path: Union[str, bytes, os.PathLike, None], encoding: Optional[str]) -> tuple[tuple[str, ...], bool, str, int]:
+	# Return the values of (_parts, _root, _drive, _parent_level) of GPath(path, encoding=encoding), without instantiating a GPath
+	if path is None or path == "":
+		return ((), False, "", 0)
+	path = os.fspath(path)
+	if isinstance(path, bytes):
+		path = path.decode(DEFAULT_ENCODING if encoding is None else encoding)
+	return _parse_generic(path)
+
+
+def _convert_parts(parts: Sequence[str], compact: Optional[bool]) -> Sequence[str]:
+	# Return `parts` as a PathNode if `compact` is True, as a tuple if `compact` is False, or unchanged if `compact` is None
+	if compact is None:
+		return parts
+	if compact:
+		return parts if isinstance(parts, PathNode) else make_node(parts)
+	return parts if isinstance(parts, tuple) else tuple(parts)
+
+
+def _parts_like(template: Sequence[str], parts: Sequence[str]) -> Sequence[str]:
+	# Return `parts` in the same representation as `template`, which is either a tuple or a PathNode
+	return _convert_parts(parts, isinstance(template, PathNode))
+
+
+def _common_prefix_length(parts1: Sequence[str], parts2: Sequence[str]) -> int:
+	if type(parts1) is PathNode and type(parts2) is PathNode:
+		# Nodes are hash-consed, so both sides usually reach a shared node quickly, below which every component is equal
+		# Until then, components are still compared by name, so that the result does not depend on every node being unique
+		depth = min(len(parts1), len(parts2))
+		length = depth
+		node1, node2 = parts1.ancestor(depth), parts2.ancestor(depth)
+		while node1 is not node2:
+			if node1.name != node2.name:
+				length = depth - 1
+			node1, node2 = node1.parent, node2.parent
+			depth -= 1
+		return length
+
+	length = 0
+	for part1, part2 in zip(parts1, parts2):
+		if part1 != part2:
+			break
+		length += 1
+	return length
+
+
+def _is_prefix(prefix: Sequence[str], parts: Sequence[str]) -> bool:
+	# Check if `prefix` is a prefix of `parts`, returning at the first mismatched component without building any intermediate sequence
+	length = len(prefix)
+	if length > len(parts):
+		return False
+	if type(prefix) is PathNode and type(parts) is PathNode:  # PathNode is a Sequence, so isinstance() would go through the slow ABC check
+		return parts.ancestor(length) == prefix  # Short-circuits as soon as both reach a shared node
+	for part1, part2 in zip(prefix, parts):
+		if part1 != part2:
+			return False
+	return True
+
+
+class _Partition:
+	# Accumulates the paths of one partition in `GPath.partition()`, narrowing down their common base path as each path is added
+
+	__slots__ = ('first', 'parts', 'parent_level', 'members')
+
+	def __init__(self, path: GPath, keep_members: bool):
+		self.first: GPath = path
+		self.parts: tuple[str, ...] = path._parts
+		self.parent_level: int = path._parent_level
+		self.members: Optional[list[GPath]] = [path] if keep_members else None
+
+	@staticmethod
+	def key_of(path: GPath, allow_current: bool, allow_parents: bool) -> tuple:
+		if path._root:
+			return (path._drive, True)
+		if allow_parents:
+			return (path._drive, False)
+		if not allow_current and path._drive == "" and path._parent_level == 0:
+			# Without the current directory as a common base path, such paths can only be grouped by their first component
+			return ("", False, 0, path._parts[0] if len(path._parts) > 0 else None)
+		return (path._drive, False, path._parent_level)
+
+	def add(self, path: GPath) -> None:
+		if path._parent_level != self.parent_level:
+			# Only possible if allow_parents is True, in which case the common base path is the higher parent directory
+			self.parent_level = max(self.parent_level, path._parent_level)
+			self.parts = ()
+		elif path._parts[:len(self.parts)] != self.parts:
+			self.parts = self.parts[:_common_prefix_length(self.parts, path._parts)]
+
+		if self.members is not None:
+			self.members.append(path)
+
+	def to_item(self) -> tuple[GPath, list[GPath]]:
+		base = GPath(self.first)
+		base._parts = self.parts
+		base._parent_level = self.parent_level
+
+		subpaths = []
+		if self.members is not None:
+			base_length = len(self.parts)
+			for path in self.members:
+				subpath = GPath(path)
+				subpath._parts = path._parts[base_length:]
+				subpath._drive = ""
+				subpath._root = False
+				subpath._parent_level = 0
+				subpaths.append(subpath)
+
+		return (base, subpaths)
+
+
+_MIN_PARTITION_SHARD_SIZE: Final = 10000
+
+
+def _partition_serial(
+	paths: Iterable[GPathLike],
+	allow_current: bool,
+	allow_parents: bool,
+	platform: Optional[Union[str, Platform]],
+	encoding: Optional[str],
+) -> dict[tuple, _Partition]:
+	gpaths = [path if isinstance(path, GPath) else GPath(path, encoding=encoding, platform=platform) for path in paths]
+
+	# Paths can only share a base path if they have the same key, and paths with the same key always share a base path, so each key is one partition
+	partitions: dict[tuple, _Partition] = {}
+	for path in gpaths:
+		path._validate()
+		key = _Partition.key_of(path, allow_current=allow_current, allow_parents=allow_parents)
+		partition = partitions.get(key)
+		if partition is None:
+			partitions[key] = _Partition(path, keep_members=not allow_parents)
+		else:
+			partition.add(path)
+	return partitions
+
+
+def _partition_shard(
+	paths: list[GPathLike],
+	allow_current: bool,
+	allow_parents: bool,
+	platform: Optional[Union[str, Platform]],
+	encoding: Optional[str],
+) -> list[tuple[tuple, GPath, list[GPath]]]:
+	# Run in a worker process by `GPath.partition()`, returning the partitions of one shard in order of first appearance
+	partitions = _partition_serial(paths, allow_current, allow_parents, platform, encoding)
+	return [(key, *partition.to_item()) for key, partition in partitions.items()]
+
+
+def _merge_partition_shards(shards: Iterable[list[tuple[tuple, GPath, list[GPath]]]]) -> dict[GPath, list[GPath]]:
+	# Merge the partitions of contiguous shards in order, giving the same result as partitioning all the paths at once
+	items_of_keys: dict[tuple, list[tuple[GPath, list[GPath]]]] = {}
+	for shard in shards:
+		for key, base, subpaths in shard:
+			items = items_of_keys.get(key)
+			if items is None:
+				items_of_keys[key] = [(base, subpaths)]
+			else:
+				items.append((base, subpaths))
+
+	partition_map = {}
+	for items in items_of_keys.values():
+		first_base = items[0][0]
+		parts = first_base._parts
+		parent_level = first_base._parent_level
+		for base, _ in items[1:]:
+			if base._parent_level != parent_level:
+				parent_level = max(parent_level, base._parent_level)
+				parts = parts[:0]
+			else:
+				parts = parts[:_common_prefix_length(parts, base._parts)]
+
+		merged_base = GPath(first_base)
+		merged_base._parts = parts
+		merged_base._parent_level = parent_level
+
+		merged_subpaths = []
+		for base, subpaths in items:
+			# Subpaths are relative to the base path of their shard, which may be a descendant of the merged base path
+			prefix = tuple(base._parts[len(parts):])
+			if len(prefix) == 0:
+				merged_subpaths.extend(subpaths)
+				continue
+			for subpath in subpaths:
+				new_subpath = GPath(subpath)
+				new_subpath._parts = _parts_like(subpath._parts, prefix + tuple(subpath._parts))
+				merged_subpaths.append(new_subpath)
+
+		partition_map[merged_base] = merged_subpaths
+	return partition_map
+
+
+_LAZY_FIELDS: Final = frozenset(('_parts', '_root', '_drive', '_parent_level'))
+
+
 class GPath(Hashable, Sized, Iterable, render.Renderable):
 	"""
 		An immutable generalised abstract file path that has no dependency on any real filesystem.
@@ -95,6 +362,9 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		'_parent_level',
 		'_platform',
 		'_encoding',
+		'_hash',
+		'_rendered',
+		'_raw',  # Only used by _LazyGPath, but declared here so that both classes have the same layout
 	)
 
 
@@ -102,6 +372,8 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		path: Union[str, bytes, os.PathLike, GPath, None]="",
 		platform: Optional[Union[str, Platform]]=None,
 		encoding: Optional[str]=None,
+		compact: Optional[bool]=None,
+		lazy: bool=False,
 	):
 		"""
 			Initialise a normalised and generalised abstract file path, possibly by copying an existing GPath object.
@@ -117,6 +389,12 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			`​encoding`
 			: the text encoding that should be used to decode paths given as bytes-like objects; if not specified, `'utf_8'` will be used by default. The encoding name should be one of the standard Python text encodings, as listed in the `codecs` module of the standard library. If specified, the encoding will propagate to new GPaths returned by operations on this GPath; for binary operations of two GPaths, the encoding specified by the left operand will be propagated.
 
+			`​compact`
+			: whether to store the path components in a compact representation, in which paths that share a common prefix also share the memory used by that prefix, and in which adding or removing a single component takes constant time. This is useful when working with many paths in the same directory tree. If None, the representation of `path` is kept if it is a GPath, or the default non-compact representation is used otherwise. The representation propagates to new GPaths returned by operations on this GPath, and does not affect the behaviour of the GPath in any other way.
+
+			`​lazy`
+			: whether to defer parsing `path` until its components are first needed, such as by `named_parts`, `len()`, iteration, hashing or any operation that returns a new GPath. This saves time when many GPaths are created but most of them are only rendered with `str()` or compared with equal paths; parsing for `str()` is cheaper if the path is already in its normalised form, and `==` does not need to parse the path at all if both GPaths were created from the same string. Interning (see `gpath.interning`) takes place when the path is parsed. This has no effect if `path` is a GPath, or if `compact` is True.
+
 			Raises
 			------
 			`ValueError` if `other` is an invalid GPath
@@ -138,6 +416,10 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		self._platform: Optional[Platform] = Platform.from_str(platform) if isinstance(platform, str) else platform
 		self._encoding: Optional[str] = encoding
 
+		# Caches are filled on first use, since every operation modifies its new copy before returning it
+		self._hash: Optional[int] = None
+		self._rendered: Optional[dict[Platform, str]] = None
+
 		if isinstance(path, GPath):
 			path._validate()
 			self._parts = path._parts
@@ -147,9 +429,11 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 
 			self._platform = path._platform if self._platform is None else self._platform
 			self._encoding = path._encoding if self._encoding is None else self._encoding
+			self._parts = _convert_parts(self._parts, compact)
 			return
 
 		if path is None or path == "":
+			self._parts = _convert_parts(self._parts, compact)
 			return
 
 		path = os.fspath(path)
@@ -162,70 +446,20 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 
 		# path is a str
 
+		if lazy and not compact and type(self) is GPath:
+			# Leave the fields unset, so that the first access to any of them goes through _LazyGPath.__getattr__() and parses the path
+			self.__class__ = _LazyGPath
+			del self._parts, self._root, self._drive, self._parent_level
+			self._raw = path
+			return
+
 		if self._platform is None:
 			platform = Platform.GENERIC
 		else:
 			platform = self._platform
 
-		if platform == Platform.POSIX:
-			for root in _rules.posix_rules.roots:
-				if path.startswith(root):
-					self._root = True
-					break
-
-			if self._root:
-				rootless_path = path[1:]
-			else:
-				rootless_path = path
-
-			parts = _split_relative(rootless_path, delimiters=_rules.posix_rules.separators)
-
-		elif platform == Platform.WINDOWS:
-			if len(path) >= 2 and path[1] in _rules.windows_rules.drive_postfixes:
-				self._drive = path[0]
-				driveless_path = path[2:]
-			else:
-				driveless_path = path
-
-			for root in _rules.windows_rules.roots:
-				if driveless_path.startswith(root):
-					self._root = True
-					break
-
-			if self._root:
-				rootless_path = driveless_path[1:]
-			else:
-				rootless_path = driveless_path
-
-			parts = _split_relative(rootless_path, delimiters=_rules.windows_rules.separators)
-
-		else:
-			if len(path) >= 2 and path[1] in _rules.generic_rules.drive_postfixes:
-				self._drive = path[0]
-				driveless_path = path[2:]
-			else:
-				driveless_path = path
-
-			for root in _rules.generic_rules.roots:
-				if driveless_path.startswith(root):
-					self._root = True
-					break
-
-			if self._root:
-				rootless_path = driveless_path[1:]
-			else:
-				rootless_path = driveless_path
-
-			parts = _split_relative(rootless_path, delimiters=_rules.generic_rules.separators)
-
-
-		parts = _normalise_relative(parts)
-		parent_level = 0
-		while parent_level < len(parts) and parts[parent_level] in _rules.generic_rules.parent_indicators:
-			parent_level += 1
-		self._parts = tuple(parts[parent_level:])
-		if self._root == False:
-			self._parent_level = parent_level
+		self._parts, self._root, self._drive, self._parent_level = _parsers_of_platforms[platform](path)
+		self._parts = _convert_parts(self._parts, compact)
 
 
 	@property
@@ -343,6 +577,13 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		"""
 		return self._encoding
 
+	@property
+	def compact(self) -> bool:
+		"""
+			Read-only flag for whether the path components are stored in the compact representation (see `__init__()`)
+		"""
+		return isinstance(self._parts, PathNode)
+
 	@property
 	def platform(self) -> Union[str, None]:
 		"""
@@ -391,6 +632,89 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		return GPath(path, platform=Platform.WINDOWS, encoding=encoding)
 
 
+	@staticmethod
+	def from_many(
+		paths: Iterable[Union[str, bytes, os.PathLike, GPath, None]],
+		platform: Optional[Union[str, Platform]]=None,
+		encoding: Optional[str]=None,
+		compact: Optional[bool]=None,
+		lazy: bool=False,
+	) -> list[GPath]:
+		"""
+			Initialise a list of GPaths from an iterable of paths, with the same result as calling the constructor on each of them individually.
+
+			This is faster than calling the constructor repeatedly when there are many paths to be parsed, because the platform and encoding are resolved only once for the entire batch.
+
+			Parameters
+			----------
+			`paths`
+			: path-like objects representing (possibly unnormalised) file paths, or GPath objects to be copied
+
+			`​platform`
+			: interpret non-GPath objects in `paths` as originating from a specific platform (see `__init__()`)
+
+			`​encoding`
+			: the text encoding that should be used to decode bytes-like objects in `paths` (see `__init__()`)
+
+			`​compact`
+			: whether to store the path components of the new GPaths in the compact representation; if None, the representation of each GPath in `paths` is kept (see `__init__()`)
+
+			`​lazy`
+			: whether to defer parsing each path until its components are first needed (see `__init__()`)
+
+			Returns
+			-------
+			`list[GPath]`
+			: a new GPath for each item in `paths`, in the same order
+
+			Raises
+			------
+			`ValueError` if any of the GPaths in `paths` are invalid
+
+			Examples
+			--------
+			```python
+			GPath.from_many(["/usr/bin", "../Documents"])         # [GPath("/usr/bin"), GPath("../Documents")]
+			GPath.from_many([b"C:/Windows"], platform='windows')  # [GPath("C:/Windows", platform='windows')]
+			```
+		"""
+		platform = Platform.from_str(platform) if isinstance(platform, str) else platform
+		parse = _parsers_of_platforms[Platform.GENERIC if platform is None else platform]
+		decode_encoding = DEFAULT_ENCODING if encoding is None else encoding
+		lazy = lazy and not compact
+
+		gpaths = []
+		for path in paths:
+			if isinstance(path, str):
+				pass
+			elif isinstance(path, GPath):
+				gpaths.append(GPath(path, platform=platform, encoding=encoding, compact=compact))
+				continue
+			elif path is None:
+				path = ""
+			else:
+				path = os.fspath(path)
+				if isinstance(path, bytes):
+					path = path.decode(decode_encoding)
+
+			if lazy and path != "":
+				new_path = _LazyGPath.__new__(_LazyGPath)
+				new_path._raw = path
+				new_path._platform = platform
+				new_path._encoding = encoding
+				new_path._hash = None
+				new_path._rendered = None
+				gpaths.append(new_path)
+				continue
+
+			parts, root, drive, parent_level = parse(path)
+			if compact:
+				parts = make_node(parts)
+			gpaths.append(GPath._from_fields(parts, root, drive, parent_level, platform, encoding))
+
+		return gpaths
+
+
 	#@overload
 	#@staticmethod
 	#def partition(paths: Iterable[GPathLike], /, *, allow_current, allow_parents, platform, encoding) -> dict[GPath, list[GPath]]:
@@ -406,6 +730,7 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		allow_parents: bool=True,
 		platform: Optional[Union[str, Platform]]=None,
 		encoding: Optional[str]=None,
+		processes: Optional[int]=None,
 	) -> dict[GPath, list[GPath]]:
 		"""
 			Partition a collection of paths based on shared common base paths such that each path belongs to one partition.
@@ -431,6 +756,9 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			`​encoding`
 			: the text encoding that should be used to decode bytes-like objects in `paths`, if any (see `__init__()`).
 
+			`processes`
+			: if greater than 1, split `paths` into contiguous shards and partition them in parallel using a pool of up to this many worker processes, then merge the partitions of each shard in order. The result is the same as partitioning serially, but the paths, as well as the returned GPaths, must be picklable. Since starting the workers and sending the paths to them has a significant cost, this is only worthwhile for very large collections of paths, and inputs with fewer than 10000 paths per worker will use fewer workers, or none at all. If None or 1, all paths are partitioned in the current process.
+
 			Returns
 			-------
 			a dictionary that maps the common base path of each partition to a list of relative paths
@@ -438,7 +766,7 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			Raises
 			------
 			  `ValueError`
-			  if any of the GPaths are invalid
+			  if any of the GPaths are invalid, or if `processes` is less than 1
 
 			Examples
 			--------
@@ -458,37 +786,26 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 				flattened_paths.append(path_or_list)
 			else:
 				flattened_paths.extend(path_or_list)
-		gpaths = [path if isinstance(path, GPath) else GPath(path, encoding=encoding, platform=platform) for path in flattened_paths]
 
-		partition_map = {}
-		if len(gpaths) > 0:
-			if allow_parents == True:
-				partition_map[gpaths[0]] = []
-			else:
-				partition_map[gpaths[0]] = [gpaths[0]]
-
-		for path in gpaths[1:]:
-			partition_found = False
-			for partition in partition_map:
-				candidate_common = partition.common_with(path, allow_current=allow_current, allow_parents=allow_parents)
-				if candidate_common is not None:
-					partition_found = True
-					if candidate_common != partition:
-						partition_map[candidate_common] = partition_map[partition]
-						del partition_map[partition]
-					if allow_parents == False:
-						partition_map[candidate_common].append(path)
-					break
-			if not partition_found:
-				if allow_parents == True:
-					partition_map[path] = []
-				else:
-					partition_map[path] = [path]
+		if allow_parents:
+			allow_current = True
 
-		for partition, path_list in partition_map.items():
-			partition_map[partition] = [path.subpath_from(partition) for path in path_list]
+		if processes is not None:
+			if processes < 1:
+				raise ValueError(f"processes must be at least 1: {processes}")
+			shard_count = min(processes, len(flattened_paths) // _MIN_PARTITION_SHARD_SIZE)
+			if shard_count > 1:
+				# Imported here, since multiprocessing is slow to import and is not needed otherwise
+				from concurrent.futures import ProcessPoolExecutor
 
-		return partition_map
+				shard_size = -(-len(flattened_paths) // shard_count)
+				shards = [flattened_paths[i:i + shard_size] for i in range(0, len(flattened_paths), shard_size)]
+				with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+					futures = [executor.submit(_partition_shard, shard, allow_current, allow_parents, platform, encoding) for shard in shards]
+					return _merge_partition_shards(future.result() for future in futures)
+
+		partitions = _partition_serial(flattened_paths, allow_current, allow_parents, platform, encoding)
+		return dict(partition.to_item() for partition in partitions.values())
 
 
 	#@overload
@@ -542,11 +859,44 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			return GPath(encoding=encoding, platform=platform)
 
 		combined_path = flattened_paths[0]
-		if not isinstance(combined_path, GPath):
+		if isinstance(combined_path, GPath):
+			combined_path = GPath(combined_path)
+		else:
 			combined_path = GPath(combined_path, encoding=encoding, platform=platform)
+
+		# Same as adding each path in turn with __add__(), but modifying a single list of parts in place, or a single PathNode
+		compact = isinstance(combined_path._parts, PathNode)
+		parts = combined_path._parts if compact else list(combined_path._parts)
+		root = combined_path._root
+		drive = combined_path._drive
+		parent_level = combined_path._parent_level
 		for path in flattened_paths[1:]:
-			combined_path = combined_path + path
+			if isinstance(path, GPath):
+				other_parts, other_root, other_drive, other_parent_level = path._parts, path._root, path._drive, path._parent_level
+			else:
+				other_parts, other_root, other_drive, other_parent_level = _parse_operand(path, combined_path._encoding)
+
+			if other_root:
+				parts = make_node(other_parts) if compact else list(other_parts)
+				root = other_root
+				parent_level = other_parent_level
+			else:
+				removed = min(other_parent_level, len(parts))  # parent of directory of root is still root
+				if not root:
+					parent_level += other_parent_level - removed
+				if compact:
+					parts = parts.ancestor(len(parts) - removed).descendant(other_parts)
+				else:
+					del parts[len(parts) - removed:]
+					parts.extend(other_parts)
 
+			if other_drive != "":
+				drive = other_drive
+
+		combined_path._parts = parts if compact else tuple(parts)
+		combined_path._root = root
+		combined_path._drive = drive
+		combined_path._parent_level = parent_level
 		return combined_path
 
 
@@ -726,26 +1076,17 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		if allow_parents:
 			allow_current = True
 
-		parts = []
-		if self._root:
+		if self._parent_level != other._parent_level:
+			if not allow_parents:
+				return None
+
 			common_path = GPath(self)
-			for part1, part2 in zip(self._parts, other._parts):
-				if part1 == part2:
-					parts.append(part1)
+			common_path._parent_level = max(self._parent_level, other._parent_level)
+			common_path._parts = self._parts[:0]
 		else:
-			if self._parent_level != other._parent_level:
-				if not allow_parents:
-					return None
-
-				common_path = GPath(self)
-				common_path._parent_level = max(self._parent_level, other._parent_level)
-			else:
-				common_path = GPath(self)
-				for part1, part2 in zip(self._parts, other._parts):
-					if part1 == part2:
-						parts.append(part1)
-
-		common_path._parts = tuple(parts)
+			common_path = GPath(self)
+			# Slicing keeps the representation of self._parts, and returns the tuple itself if self is the common base path
+			common_path._parts = self._parts[:_common_prefix_length(self._parts, other._parts)]
 
 		if not allow_current and not bool(common_path):
 			if common_path != self or common_path != other:
@@ -786,11 +1127,13 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			GPath("/usr/bin").subpath_from("../Documents")    # None
 			```
 		"""
+		self._validate()
 		if not isinstance(base, GPath):
 			base = GPath(base, encoding=self._encoding)
+		base._validate()
 
-		if self.common_with(base, allow_current=True, allow_parents=False) is not None and self in base:
-			# If self._parent_level > base._parent_level, self is not in base, whereas if self._parent_level < base._parent_level, path from base to self's parent cannot be known
+		# If self._parent_level > base._parent_level, self is not in base, whereas if self._parent_level < base._parent_level, path from base to self's parent cannot be known
+		if self._parent_level == base._parent_level and base._contains_parsed(self._parts, self._root, self._drive, self._parent_level):
 			base_length = len(base._parts)
 			new_path = GPath(self)
 			new_path._parts = self._parts[base_length:]  # () when self == base
@@ -920,7 +1263,17 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			platform = DEFAULT_PLATFORM
 		elif isinstance(platform, str):
 			platform = Platform.from_str(platform)
-		return render.get_type(platform)(self)
+
+		# Only the rendered strings are cached, since a cached RenderedPath would refer back to this GPath and form a reference cycle
+		rendered_path = render.get_type(platform)(self)
+		if self._rendered is None:
+			self._rendered = {}
+		rendered_str = self._rendered.get(platform)
+		if rendered_str is None:
+			self._rendered[platform] = str(rendered_path)
+		else:
+			rendered_path._str = rendered_str
+		return rendered_path
 
 
 	def __hash__(self) -> int:
@@ -929,14 +1282,16 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 
 			Usage: <code>hash(<var>g</var>)</code>
 		"""
-		return hash(self._tuple)
+		if self._hash is None:
+			self._hash = hash(self._tuple)
+		return self._hash
 
 
 	def __eq__(self, other: GPathLike) -> bool:
 		"""
 			Check if two GPaths are completely identical.
 
-			Always return False if `other` is not a GPath object, even if it is a GPath-like object.
+			If `other` is a GPath-like object but not a GPath object, it is compared as if it were `GPath(other, encoding=self.encoding)`, but without instantiating a new GPath.
 
 			Usage: <code><var>g1</var> == <var>g2</var></code>
 
@@ -946,11 +1301,15 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			GPath("/usr/bin") == GPath("/usr/bin")  # True
 			GPath("/usr/bin") == GPath("usr/bin")   # False
 			GPath("C:/") == GPath("D:/")            # False
+			GPath("/usr/bin") == "/usr/./bin"       # True
 			```
 		"""
-		if not isinstance(other, GPath):
-			other = GPath(other, encoding=self._encoding)
-		return self._tuple == other._tuple
+		if isinstance(other, GPath):
+			return self._tuple == other._tuple
+
+		if self._platform is not None:
+			return False  # GPath(other) would have no platform
+		return (self._parts, self._root, self._drive, self._parent_level) == _parse_operand(other, self._encoding)
 
 
 	def __bool__(self) -> bool:
@@ -980,6 +1339,22 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		return str(self.render(Platform.GENERIC))
 
 
+	def __fspath__(self) -> str:
+		"""
+			Return the string representation of the path for the local operating system, so that GPath can be used wherever an `os.PathLike` is accepted.
+
+			This is equivalent to <code>str(<var>g</var>.render(<var>local_platform</var>))</code>, and the string is cached after the first call.
+
+			Usage: <code>os.fspath(<var>g</var>)</code>, or <code>open(<var>g</var>)</code> and other functions that accept path-like objects
+		"""
+		# Fast path for repeated calls, which skips the platform lookup in render()
+		if self._rendered is not None:
+			rendered_str = self._rendered.get(LOCAL_PLATFORM)
+			if rendered_str is not None:
+				return rendered_str
+		return str(self.render(LOCAL_PLATFORM))
+
+
 	def __repr__(self) -> str:
 		"""
 			Return a string that, when printed, gives the Python code associated with instantiating the GPath object.
@@ -1067,11 +1442,11 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			GPath("..") in GPath("C:/")               # False
 			```
 		"""
-		if not isinstance(other, GPath):
-			other = GPath(other, encoding=self._encoding)
-
-		common_path = self.common_with(other, allow_current=True, allow_parents=True)
-		return common_path is not None and common_path == self
+		self._validate()
+		if isinstance(other, GPath):
+			other._validate()
+			return self._contains_parsed(other._parts, other._root, other._drive, other._parent_level)
+		return self._contains_parsed(*_parse_operand(other, self._encoding))
 
 
 	def __add__(self, other: GPathLike) -> GPath:
@@ -1105,21 +1480,15 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 
 		new_path = GPath(self)
 		if other._root:
-			new_path._parts = other._parts
+			new_path._parts = _parts_like(self._parts, other._parts)
 			new_path._root = other._root
 			new_path._parent_level = other._parent_level
 		else:
-			new_parts = [part for part in self._parts]
-			for i in range(other._parent_level):
-				if len(new_parts) > 0:
-					new_parts.pop()
-				elif not new_path._root:
-					new_path._parent_level += 1
-				else:
-					pass  # parent of directory of root is still root
-
-			new_parts.extend(other._parts)
-			new_path._parts = tuple(new_parts)
+			removed = min(other._parent_level, len(self._parts))  # parent of directory of root is still root
+			if not new_path._root:
+				new_path._parent_level += other._parent_level - removed
+			# For a PathNode, the slice and concatenation take time proportional only to the number of components removed and added
+			new_path._parts = self._parts[:len(self._parts) - removed] + other._parts
 
 		if other._drive != "":
 			new_path._drive = other._drive
@@ -1148,15 +1517,10 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 			raise ValueError("cannot subtract a negative number of components from the path: {n}; use __add__() instead")
 
 		new_path = GPath(self)
-		new_parts = [part for part in self._parts]
-		for i in range(n):
-			if len(new_parts) > 0:
-				new_parts.pop()
-			elif not new_path._root:
-				new_path._parent_level += 1
-			else:
-				pass  # removing components from root should still give root
-		new_path._parts = tuple(new_parts)
+		removed = min(n, len(self._parts))  # removing components from root should still give root
+		if not new_path._root:
+			new_path._parent_level += n - removed
+		new_path._parts = self._parts[:len(self._parts) - removed]
 		return new_path
 
 
@@ -1261,6 +1625,39 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		return new_path
 
 
+	def __getstate__(self) -> tuple:
+		# Exclude the caches, since the hash is not valid in another interpreter
+		return (
+			self._parts,
+			self._root,
+			self._drive,
+			self._parent_level,
+			self._platform,
+			self._encoding,
+		)
+
+
+	def __setstate__(self, state: tuple) -> None:
+		self._parts, self._root, self._drive, self._parent_level, self._platform, self._encoding = state
+		self._hash = None
+		self._rendered = None
+
+
+	@staticmethod
+	def _from_fields(parts: Sequence[str], root: bool, drive: str, parent_level: int, platform: Optional[Platform], encoding: Optional[str]) -> GPath:
+		# Create a GPath directly from the values of its fields, which must already be parsed, normalised and valid, without going through the constructor
+		new_path = GPath.__new__(GPath)
+		new_path._parts = parts
+		new_path._root = root
+		new_path._drive = drive
+		new_path._parent_level = parent_level
+		new_path._platform = platform
+		new_path._encoding = encoding
+		new_path._hash = None
+		new_path._rendered = None
+		return new_path
+
+
 	@property
 	def _tuple(self) -> tuple:
 		# Get a tuple of all fields
@@ -1274,6 +1671,16 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		)
 
 
+	def _contains_parsed(self, parts: Sequence[str], root: bool, drive: str, parent_level: int) -> bool:
+		# Check if self contains the path with the given values of (_parts, _root, _drive, _parent_level), without instantiating any GPath
+		if self._drive != drive or self._root != root:
+			return False
+		if self._parent_level != parent_level:
+			# A parent directory contains every relative path of a lower level, but only if it has no named components
+			return len(self._parts) == 0 and self._parent_level > parent_level
+		return _is_prefix(self._parts, parts)
+
+
 	def _validate(self) -> bool:
 		# Check if self is in a valid state
 		if self._parent_level < 0:
@@ -1284,5 +1691,65 @@ class GPath(Hashable, Sized, Iterable, render.Renderable):
 		return True
 
 
+class _LazyGPath(GPath):
+	# A GPath whose path is parsed only when its fields are first needed, returned by `GPath(..., lazy=True)` and `GPath.from_many(..., lazy=True)`
+	# This is a separate class because defining __getattr__() on a class slows down every attribute access on its instances, which must not affect ordinary GPaths
+	# Until the path is parsed, the fields in _LAZY_FIELDS are unset and `_raw` holds the unparsed path; afterwards, `_raw` is None
+	# Operations that return a new GPath copy the fields, so they always return ordinary GPaths
+
+	__slots__ = ()
+
+	def __getattr__(self, name: str) -> Any:
+		# Only called when an attribute is not found normally, which means that the fields are needed for the first time
+		if name in _LAZY_FIELDS:
+			self._parse_raw()
+			return object.__getattribute__(self, name)
+		raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+	def _parse_raw(self) -> Optional[bool]:
+		# Parse the path and set the fields, returning whether the path was canonical, or None if it has already been parsed
+		# `_raw` is read only once, since another thread may finish parsing the same GPath at any time; parsing twice is harmless, since both threads set the same values
+		raw = self._raw
+		if raw is None:
+			return None
+		platform = Platform.GENERIC if self._platform is None else self._platform
+		fields = _parse_canonical(raw, platform)
+		canonical = fields is not None
+		if not canonical:
+			fields = _parsers_of_platforms[platform](raw)
+		self._parts, self._root, self._drive, self._parent_level = fields  # type: ignore
+		self._raw = None
+		return canonical
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			self._parse_raw()  # Avoids going through __getattr__(), which is only reached after an AttributeError
+		return GPath.__hash__(self)
+
+	def __eq__(self, other: GPathLike) -> bool:
+		raw = self._raw
+		if raw is not None:
+			if isinstance(other, _LazyGPath):
+				if raw == other._raw and self._platform == other._platform and self._encoding == other._encoding:
+					return True  # Both would be parsed from the same string in the same way
+			elif isinstance(other, str):
+				if raw == other and self._platform is None:
+					return True
+			self._parse_raw()
+		if isinstance(other, _LazyGPath):
+			other._parse_raw()
+		return GPath.__eq__(self, other)
+
+	def __str__(self) -> str:
+		raw = self._raw
+		if raw is not None and self._parse_raw():
+			return raw  # Canonical paths are their own generic rendering
+		return GPath.__str__(self)
+
+	def __setstate__(self, state: tuple) -> None:
+		GPath.__setstate__(self, state)
+		self._raw = None
+
+
 GPathLike = Union[GPath, str, bytes, os.PathLike]
 """Union type of GPath-like objects that can be used as the argument for most `GPath` methods."""
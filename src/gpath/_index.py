@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sized
+from typing import Optional
+
+from ._gpath import GPath, GPathLike, _common_prefix_length
+
+
+__all__ = ('GPathIndex',)
+
+
+class _IndexNode:
+	# A node in the trie of one (drive, root, parent level), representing the path made up of the components from the root node down to this node
+
+	__slots__ = ('children', 'paths', 'count')
+
+	def __init__(self):
+		self.children: dict[str, _IndexNode] = {}
+		self.paths: list[GPath] = []  # Registered paths ending at this node, which are all equivalent apart from their platform and encoding
+		self.count: int = 0  # Number of registered paths at or below this node
+
+	def iter_subtree(self) -> Iterator[GPath]:
+		stack = [self]
+		while len(stack) > 0:
+			node = stack.pop()
+			yield from node.paths
+			stack.extend(reversed(node.children.values()))
+
+
+class GPathIndex(Sized, Iterable):
+	"""
+		A collection of GPaths that answers containment queries in time proportional to the depth of the query path, instead of the number of paths in the collection.
+
+		The index behaves like a set of GPaths, and supports looking up the registered paths that contain a given path (`containing()`, `longest_prefix()`), the registered paths that are contained in a given path (`subtree()`), and the deepest registered path that contains two given paths (`lowest_common_ancestor()`). Containment has the same meaning as for <code><var>other</var> in <var>g</var></code> (see `GPath.__contains__()`), including the semantics of drives, roots and parent directories.
+
+		Examples
+		--------
+		```python
+		index = GPathIndex(["/usr", "/usr/local", "/home", "../shared"])
+		index.longest_prefix("/usr/local/bin")  # GPath("/usr/local")
+		index.containing("/usr/local/bin")      # [GPath("/usr"), GPath("/usr/local")]
+		list(index.subtree("/usr"))             # [GPath("/usr"), GPath("/usr/local")]
+		```
+	"""
+
+	__slots__ = ('_tries', '_count')
+
+	def __init__(self, paths: Iterable[GPathLike]=()):
+		"""
+			Initialise an index containing `paths`.
+
+			Raises
+			------
+			`ValueError` if any of the GPaths in `paths` are invalid
+		"""
+		# Each trie contains the paths with the same (drive, root, parent level), keyed by their named components
+		self._tries: dict[tuple[str, bool, int], _IndexNode] = {}
+		self._count: int = 0
+		for path in paths:
+			self.add(path)
+
+	@staticmethod
+	def _to_gpath(path: GPathLike) -> GPath:
+		if isinstance(path, GPath):
+			path._validate()
+			return path
+		return GPath(path)
+
+	def _find_node(self, path: GPath) -> Optional[_IndexNode]:
+		node = self._tries.get((path._drive, path._root, path._parent_level))
+		for part in path._parts:
+			if node is None:
+				return None
+			node = node.children.get(part)
+		return node
+
+	def add(self, path: GPathLike) -> None:
+		"""
+			Add `path` to the index, if it is not already in the index.
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+		"""
+		path = self._to_gpath(path)
+		node = self._find_node(path)
+		if node is not None and path in node.paths:
+			return
+
+		key = (path._drive, path._root, path._parent_level)
+		node = self._tries.get(key)
+		if node is None:
+			node = _IndexNode()
+			self._tries[key] = node
+		node.count += 1
+		for part in path._parts:
+			child = node.children.get(part)
+			if child is None:
+				child = _IndexNode()
+				node.children[part] = child
+			node = child
+			node.count += 1
+		node.paths.append(path)
+		self._count += 1
+
+	def remove(self, path: GPathLike) -> None:
+		"""
+			Remove `path` from the index.
+
+			Raises
+			------
+			`KeyError` if `path` is not in the index
+
+			`ValueError` if `path` is an invalid GPath
+		"""
+		path = self._to_gpath(path)
+		node = self._find_node(path)
+		if node is None or path not in node.paths:
+			raise KeyError(path)
+		node.paths.remove(path)
+
+		# Decrement the counts along the path, pruning any branch that no longer contains any paths
+		key = (path._drive, path._root, path._parent_level)
+		node = self._tries[key]
+		node.count -= 1
+		if node.count == 0:
+			del self._tries[key]
+		else:
+			for part in path._parts:
+				child = node.children[part]
+				child.count -= 1
+				if child.count == 0:
+					del node.children[part]
+					break
+				node = child
+		self._count -= 1
+
+	def discard(self, path: GPathLike) -> None:
+		"""
+			Remove `path` from the index if it is in the index.
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+		"""
+		try:
+			self.remove(path)
+		except KeyError:
+			pass
+
+	def containing(self, path: GPathLike) -> list[GPath]:
+		"""
+			Find every path in the index that contains `path`, including `path` itself if it is in the index.
+
+			Returns
+			-------
+			`list[GPath]`
+			: the paths in the index that contain `path`, from the outermost to the innermost
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+
+			Examples
+			--------
+			```python
+			index = GPathIndex(["/", "/usr", "/usr/local/bin", "../.."])
+			index.containing("/usr/local")  # [GPath("/"), GPath("/usr")]
+			index.containing("../a")        # [GPath("../..")]
+			```
+		"""
+		path = self._to_gpath(path)
+		result = []
+		if not path._root:
+			# Relative paths of a higher parent level without any named components contain every relative path of a lower level
+			for level in sorted((key[2] for key in self._tries if key[0] == path._drive and not key[1] and key[2] > path._parent_level), reverse=True):
+				result.extend(self._tries[(path._drive, False, level)].paths)
+
+		node = self._tries.get((path._drive, path._root, path._parent_level))
+		if node is not None:
+			result.extend(node.paths)
+			for part in path._parts:
+				node = node.children.get(part)
+				if node is None:
+					break
+				result.extend(node.paths)
+		return result
+
+	def longest_prefix(self, path: GPathLike) -> Optional[GPath]:
+		"""
+			Find the innermost path in the index that contains `path`, which is `path` itself if it is in the index.
+
+			If there are multiple such paths that differ only in their platform or encoding, the one that was added first is returned.
+
+			Returns
+			-------
+			`GPath`
+			: the innermost path in the index that contains `path`, if any
+
+			`None`
+			: otherwise
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+
+			Examples
+			--------
+			```python
+			index = GPathIndex(["/usr", "/usr/local", "../.."])
+			index.longest_prefix("/usr/local/bin")  # GPath("/usr/local")
+			index.longest_prefix("/usr/bin")        # GPath("/usr")
+			index.longest_prefix("/home")           # None
+			index.longest_prefix("..")              # GPath("../..")
+			```
+		"""
+		path = self._to_gpath(path)
+		return self._innermost(path._drive, path._root, path._parent_level, path._parts)
+
+	def subtree(self, path: GPathLike) -> Iterator[GPath]:
+		"""
+			Iterate over every path in the index that is contained in `path`, including `path` itself if it is in the index.
+
+			Paths that are relative to a lower level of parent directory are yielded after paths that are relative to the same level as `path`, and are otherwise in no particular order.
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+
+			Examples
+			--------
+			```python
+			index = GPathIndex(["/usr", "/usr/local/bin", "/home", "..", "a/b"])
+			list(index.subtree("/usr"))  # [GPath("/usr"), GPath("/usr/local/bin")]
+			list(index.subtree(".."))    # [GPath(".."), GPath("a/b")]
+			```
+		"""
+		path = self._to_gpath(path)
+		node = self._find_node(path)
+		if node is not None:
+			yield from node.iter_subtree()
+
+		if not path._root and len(path._parts) == 0:
+			# A parent directory contains every relative path of a lower level
+			for level in sorted((key[2] for key in self._tries if key[0] == path._drive and not key[1] and key[2] < path._parent_level), reverse=True):
+				yield from self._tries[(path._drive, False, level)].iter_subtree()
+
+	def lowest_common_ancestor(self, path1: GPathLike, path2: GPathLike) -> Optional[GPath]:
+		"""
+			Find the innermost path in the index that contains both `path1` and `path2`.
+
+			This is the same as the `longest_prefix()` of their common base path, <code><var>path1</var>.common_with(<var>path2</var>, allow_parents=True)</code>, but without creating that intermediate GPath.
+
+			Returns
+			-------
+			`GPath`
+			: the innermost path in the index that contains both paths, if any
+
+			`None`
+			: otherwise, including when the paths have no common base path
+
+			Raises
+			------
+			`ValueError` if either path is an invalid GPath
+
+			Examples
+			--------
+			```python
+			index = GPathIndex(["/", "/usr", "/usr/local"])
+			index.lowest_common_ancestor("/usr/local/bin", "/usr/bin")  # GPath("/usr")
+			index.lowest_common_ancestor("/usr/local/bin", "/home")     # GPath("/")
+			index.lowest_common_ancestor("/usr", "C:/Windows")          # None
+			```
+		"""
+		path1 = self._to_gpath(path1)
+		path2 = self._to_gpath(path2)
+		if path1._drive != path2._drive or path1._root != path2._root:
+			return None
+
+		if path1._parent_level != path2._parent_level:
+			common_parts: Iterable[str] = ()
+			common_level = max(path1._parent_level, path2._parent_level)
+		else:
+			common_parts = path1._parts[:_common_prefix_length(path1._parts, path2._parts)]
+			common_level = path1._parent_level
+
+		return self._innermost(path1._drive, path1._root, common_level, common_parts)
+
+	def _innermost(self, drive: str, root: bool, parent_level: int, parts: Iterable[str]) -> Optional[GPath]:
+		# Find the innermost registered path that contains the path made up of the given fields
+		innermost: Optional[GPath] = None
+		node = self._tries.get((drive, root, parent_level))
+		if node is not None:
+			if len(node.paths) > 0:
+				innermost = node.paths[0]
+			for part in parts:
+				node = node.children.get(part)
+				if node is None:
+					break
+				if len(node.paths) > 0:
+					innermost = node.paths[0]
+		if innermost is not None or root:
+			return innermost
+
+		# Otherwise, the innermost container is the one at the lowest higher parent level without any named components
+		levels = [key[2] for key, node in self._tries.items() if key[0] == drive and not key[1] and key[2] > parent_level and len(node.paths) > 0]
+		if len(levels) == 0:
+			return None
+		return self._tries[(drive, False, min(levels))].paths[0]
+
+	def __contains__(self, path: GPathLike) -> bool:
+		"""
+			Check if `path` is in the index.
+
+			Note that this checks for membership, not for containment; use `containing()` or `longest_prefix()` to find the paths that contain `path`.
+
+			Usage: <code><var>path</var> in <var>index</var></code>
+		"""
+		path = self._to_gpath(path)
+		node = self._find_node(path)
+		return node is not None and path in node.paths
+
+	def __len__(self) -> int:
+		"""
+			Get the number of paths in the index.
+
+			Usage: <code>len(<var>index</var>)</code>
+		"""
+		return self._count
+
+	def __iter__(self) -> Iterator[GPath]:
+		"""
+			Iterate over the paths in the index, in no particular order.
+
+			Usage: <code>for <var>path</var> in <var>index</var>:</code>
+		"""
+		for node in list(self._tries.values()):
+			yield from node.iter_subtree()
+
+	def __repr__(self) -> str:
+		"""
+			Return a string that, when printed, gives the Python code associated with instantiating a copy of the index.
+
+			Usage: <code>repr(<var>index</var>)</code>
+		"""
+		return f"GPathIndex({repr(list(self))})"
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, Union
+
+
+class PathNode(Sequence):
+	"""
+		Immutable sequence of path components, stored as a pointer to the node of its parent directory plus its last component.
+
+		Nodes are hash-consed: there is at most one live node for each parent node and component, so sequences that share a prefix also share the nodes representing that prefix. Appending or removing a single component therefore takes O(1) time, and equality can short-circuit as soon as both sides reach a shared node.
+
+		A PathNode compares equal to a tuple with the same components, and has the same hash.
+	"""
+
+	__slots__ = ('parent', 'name', '_length', '_hash', '__weakref__')
+
+	def __init__(self, parent: Optional[PathNode], name: Optional[str]):
+		# Use child() or make_node() instead, which return the existing node if there is one
+		self.parent: Optional[PathNode] = parent
+		self.name: Optional[str] = name
+		self._length: int = 0 if parent is None else parent._length + 1
+		self._hash: Optional[int] = None
+
+	def child(self, name: str) -> PathNode:
+		key = (id(self), name)  # self cannot be freed while any of its children are alive, so its id cannot be reused
+		node = _nodes.get(key)
+		if node is None:
+			with _nodes_lock:
+				# Another thread may have created the same node in the meantime, and there must never be two nodes for the same key
+				node = _nodes.get(key)
+				if node is None:
+					node = PathNode(self, name)
+					_nodes[key] = node
+		return node
+
+	def descendant(self, names: Iterable[str]) -> PathNode:
+		node = self
+		for name in names:
+			node = node.child(name)
+		return node
+
+	def ancestor(self, length: int) -> PathNode:
+		# Get the node representing the first `length` components, where 0 <= length <= len(self)
+		node = self
+		for i in range(self._length - length):
+			node = node.parent  # type: ignore
+		return node
+
+	def to_tuple(self) -> tuple[str, ...]:
+		names = []
+		node = self
+		while node._length > 0:
+			names.append(node.name)
+			node = node.parent  # type: ignore
+		names.reverse()
+		return tuple(names)
+
+	def __len__(self) -> int:
+		return self._length
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self.to_tuple())
+
+	def __getitem__(self, index: Union[int, slice]):
+		if isinstance(index, slice):
+			start, stop, step = index.indices(self._length)
+			if step != 1:
+				return self.to_tuple()[index]
+			if stop <= start:
+				return EMPTY_NODE
+			node = self.ancestor(stop)
+			if start == 0:
+				return node
+			return EMPTY_NODE.descendant(node.to_tuple()[start:])
+
+		if index < 0:
+			index += self._length
+		if index < 0 or index >= self._length:
+			raise IndexError(f"PathNode index out of range: {index}")
+		return self.ancestor(index + 1).name
+
+	def __eq__(self, other) -> bool:
+		if isinstance(other, PathNode):
+			if self._length != other._length:
+				return False
+			node1, node2 = self, other
+			while node1 is not node2:
+				if node1.name != node2.name:
+					return False
+				node1, node2 = node1.parent, node2.parent  # type: ignore
+			return True
+		if isinstance(other, tuple):
+			return self._length == len(other) and self.to_tuple() == other
+		return NotImplemented
+
+	def __hash__(self) -> int:
+		if self._hash is None:
+			self._hash = hash(self.to_tuple())
+		return self._hash
+
+	def __add__(self, other) -> PathNode:
+		if isinstance(other, (tuple, PathNode)):
+			return self.descendant(other)
+		return NotImplemented
+
+	def __radd__(self, other) -> tuple[str, ...]:
+		# Keep the representation of the left operand
+		if isinstance(other, tuple):
+			return other + self.to_tuple()
+		return NotImplemented
+
+	def __mul__(self, n: int) -> PathNode:
+		return EMPTY_NODE.descendant(self.to_tuple() * n)
+
+	def __reduce__(self):
+		return (make_node, (self.to_tuple(),))
+
+	def __repr__(self) -> str:
+		return f"make_node({repr(self.to_tuple())})"
+
+
+_nodes: weakref.WeakValueDictionary[tuple[int, str], PathNode] = weakref.WeakValueDictionary()
+_nodes_lock = threading.Lock()  # Taken only to add a new node, since lookups of existing nodes are safe without it
+
+EMPTY_NODE = PathNode(None, None)
+
+
+def make_node(names: Iterable[str]) -> PathNode:
+	"""Get the hash-consed node representing the sequence of components `names`"""
+	return EMPTY_NODE.descendant(names)
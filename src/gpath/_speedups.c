@@ -0,0 +1,300 @@
+/*
+	Optional compiled accelerator for the parser core of GPath.
+
+	`Parser` is a drop-in replacement for the pure-Python parsers produced by `gpath._gpath._make_python_parser()`, and must always give exactly the same results. If this module cannot be built or imported, the pure-Python parsers are used instead.
+
+	Instead of replacing separators, splitting and then normalising, the path is scanned only once. Each component is compared against the current and parent directory indicators in place, and only named components are copied into new strings.
+*/
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+#define MAX_CHARS 8  /* Maximum number of separators or drive postfixes of a platform */
+
+
+typedef struct {
+	PyObject_HEAD
+	Py_UCS4 drive_postfixes[MAX_CHARS];
+	Py_ssize_t drive_postfix_count;
+	Py_UCS4 separators[MAX_CHARS];
+	Py_ssize_t separator_count;
+	PyObject *current;    /* str */
+	PyObject *parent;     /* str */
+	PyObject *interning;  /* the module gpath.interning, whose attribute `_pool` is looked up on every call */
+} ParserObject;
+
+
+static PyObject *empty_string = NULL;
+static PyObject *pool_name = NULL;
+static PyObject *intern_parts_name = NULL;
+
+
+static int
+read_chars(PyObject *string, Py_UCS4 *chars, Py_ssize_t *count, const char *name)
+{
+	Py_ssize_t length = PyUnicode_GET_LENGTH(string);
+	if (length > MAX_CHARS) {
+		PyErr_Format(PyExc_ValueError, "too many %s: %zd", name, length);
+		return -1;
+	}
+	for (Py_ssize_t i = 0; i < length; i++) {
+		chars[i] = PyUnicode_READ_CHAR(string, i);
+	}
+	*count = length;
+	return 0;
+}
+
+
+static inline int
+contains_char(const Py_UCS4 *chars, Py_ssize_t count, Py_UCS4 c)
+{
+	for (Py_ssize_t i = 0; i < count; i++) {
+		if (chars[i] == c) {
+			return 1;
+		}
+	}
+	return 0;
+}
+
+
+static inline int
+equals_slice(int kind, const void *data, Py_ssize_t start, Py_ssize_t end, PyObject *string)
+{
+	/* Check if data[start:end] is equal to `string`, without creating a new string */
+	if (end - start != PyUnicode_GET_LENGTH(string)) {
+		return 0;
+	}
+	int string_kind = PyUnicode_KIND(string);
+	const void *string_data = PyUnicode_DATA(string);
+	for (Py_ssize_t i = start; i < end; i++) {
+		if (PyUnicode_READ(kind, data, i) != PyUnicode_READ(string_kind, string_data, i - start)) {
+			return 0;
+		}
+	}
+	return 1;
+}
+
+
+static PyObject *
+Parser_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+	static char *keywords[] = {"drive_postfixes", "separators", "current", "parent", "interning", NULL};
+	PyObject *drive_postfixes, *separators, *current, *parent, *interning;
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "UUUUO:Parser", keywords, &drive_postfixes, &separators, &current, &parent, &interning)) {
+		return NULL;
+	}
+#if PY_VERSION_HEX < 0x030C0000
+	if (PyUnicode_READY(drive_postfixes) < 0 || PyUnicode_READY(separators) < 0 || PyUnicode_READY(current) < 0 || PyUnicode_READY(parent) < 0) {
+		return NULL;
+	}
+#endif
+	if (PyUnicode_GET_LENGTH(separators) == 0) {
+		PyErr_SetString(PyExc_ValueError, "at least one separator is required");
+		return NULL;
+	}
+
+	ParserObject *self = (ParserObject *)type->tp_alloc(type, 0);
+	if (self == NULL) {
+		return NULL;
+	}
+	if (read_chars(drive_postfixes, self->drive_postfixes, &self->drive_postfix_count, "drive postfixes") < 0
+		|| read_chars(separators, self->separators, &self->separator_count, "separators") < 0
+	) {
+		Py_DECREF(self);
+		return NULL;
+	}
+	Py_INCREF(current);
+	self->current = current;
+	Py_INCREF(parent);
+	self->parent = parent;
+	Py_INCREF(interning);
+	self->interning = interning;
+	return (PyObject *)self;
+}
+
+
+static void
+Parser_dealloc(ParserObject *self)
+{
+	Py_XDECREF(self->current);
+	Py_XDECREF(self->parent);
+	Py_XDECREF(self->interning);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+
+static PyObject *
+Parser_call(ParserObject *self, PyObject *args, PyObject *kwargs)
+{
+	if ((kwargs != NULL && PyDict_GET_SIZE(kwargs) > 0) || PyTuple_GET_SIZE(args) != 1) {
+		PyErr_SetString(PyExc_TypeError, "Parser() takes exactly one positional argument");
+		return NULL;
+	}
+	PyObject *path = PyTuple_GET_ITEM(args, 0);
+	if (!PyUnicode_Check(path)) {
+		PyErr_Format(PyExc_TypeError, "path must be str, not %.100s", Py_TYPE(path)->tp_name);
+		return NULL;
+	}
+#if PY_VERSION_HEX < 0x030C0000
+	if (PyUnicode_READY(path) < 0) {
+		return NULL;
+	}
+#endif
+
+	Py_ssize_t length = PyUnicode_GET_LENGTH(path);
+	int kind = PyUnicode_KIND(path);
+	const void *data = PyUnicode_DATA(path);
+	Py_ssize_t start = 0;
+
+	PyObject *drive;
+	if (length >= 2 && contains_char(self->drive_postfixes, self->drive_postfix_count, PyUnicode_READ(kind, data, 1))) {
+		drive = PyUnicode_Substring(path, 0, 1);
+		if (drive == NULL) {
+			return NULL;
+		}
+		start = 2;
+	}
+	else {
+		drive = empty_string;
+		Py_INCREF(drive);
+	}
+
+	int root = start < length && contains_char(self->separators, self->separator_count, PyUnicode_READ(kind, data, start));
+	if (root) {
+		start += 1;
+	}
+
+	/* Named components are collected in `parts`, and parent directories that cannot cancel out a named component are counted in `parent_level`, which is equivalent to `_normalise_relative()` followed by removing the leading parent directories */
+	PyObject *parts = PyList_New(0);
+	if (parts == NULL) {
+		Py_DECREF(drive);
+		return NULL;
+	}
+	Py_ssize_t parent_level = 0;
+	Py_ssize_t part_start = start;
+	for (Py_ssize_t i = start; i <= length; i++) {
+		if (i < length && !contains_char(self->separators, self->separator_count, PyUnicode_READ(kind, data, i))) {
+			continue;
+		}
+		if (i == part_start || equals_slice(kind, data, part_start, i, self->current)) {
+			/* Empty components and current directories are dropped */
+		}
+		else if (equals_slice(kind, data, part_start, i, self->parent)) {
+			Py_ssize_t count = PyList_GET_SIZE(parts);
+			if (count > 0) {
+				if (PyList_SetSlice(parts, count - 1, count, NULL) < 0) {
+					goto error;
+				}
+			}
+			else {
+				parent_level += 1;
+			}
+		}
+		else {
+			PyObject *part = PyUnicode_Substring(path, part_start, i);
+			if (part == NULL) {
+				goto error;
+			}
+			int status = PyList_Append(parts, part);
+			Py_DECREF(part);
+			if (status < 0) {
+				goto error;
+			}
+		}
+		part_start = i + 1;
+	}
+
+	PyObject *pool = PyObject_GetAttr(self->interning, pool_name);
+	if (pool == NULL) {
+		goto error;
+	}
+	PyObject *named_parts;
+	if (pool == Py_None) {
+		named_parts = PyList_AsTuple(parts);
+	}
+	else {
+		named_parts = PyObject_CallMethodObjArgs(pool, intern_parts_name, parts, NULL);
+	}
+	Py_DECREF(pool);
+	Py_DECREF(parts);
+	if (named_parts == NULL) {
+		Py_DECREF(drive);
+		return NULL;
+	}
+
+	PyObject *level = PyLong_FromSsize_t(root ? 0 : parent_level);
+	if (level == NULL) {
+		Py_DECREF(named_parts);
+		Py_DECREF(drive);
+		return NULL;
+	}
+	PyObject *result = PyTuple_Pack(4, named_parts, root ? Py_True : Py_False, drive, level);
+	Py_DECREF(named_parts);
+	Py_DECREF(drive);
+	Py_DECREF(level);
+	return result;
+
+error:
+	Py_DECREF(parts);
+	Py_DECREF(drive);
+	return NULL;
+}
+
+
+PyDoc_STRVAR(Parser_doc,
+"Parser(drive_postfixes, separators, current, parent, interning)\n"
+"--\n"
+"\n"
+"Compiled parser for the rules of a single platform. Calling the parser on a path string returns the values of (_parts, _root, _drive, _parent_level).\n"
+"\n"
+"`drive_postfixes` and `separators` are strings in which each character is one drive postfix or separator respectively, `current` and `parent` are the current and parent directory indicators, and `interning` is the module gpath.interning.");
+
+
+static PyTypeObject ParserType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "gpath._speedups.Parser",
+	.tp_basicsize = sizeof(ParserObject),
+	.tp_itemsize = 0,
+	.tp_dealloc = (destructor)Parser_dealloc,
+	.tp_call = (ternaryfunc)Parser_call,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = Parser_doc,
+	.tp_new = Parser_new,
+};
+
+
+static struct PyModuleDef speedups_module = {
+	PyModuleDef_HEAD_INIT,
+	.m_name = "gpath._speedups",
+	.m_doc = "Optional compiled accelerator for the parser core of GPath",
+	.m_size = -1,
+};
+
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+	if (PyType_Ready(&ParserType) < 0) {
+		return NULL;
+	}
+
+	empty_string = PyUnicode_FromStringAndSize("", 0);
+	pool_name = PyUnicode_InternFromString("_pool");
+	intern_parts_name = PyUnicode_InternFromString("intern_parts");
+	if (empty_string == NULL || pool_name == NULL || intern_parts_name == NULL) {
+		return NULL;
+	}
+
+	PyObject *module = PyModule_Create(&speedups_module);
+	if (module == NULL) {
+		return NULL;
+	}
+	Py_INCREF(&ParserType);
+	if (PyModule_AddObject(module, "Parser", (PyObject *)&ParserType) < 0) {
+		Py_DECREF(&ParserType);
+		Py_DECREF(module);
+		return NULL;
+	}
+	return module;
+}
@@ -0,0 +1,250 @@
+"""
+	Bounded caches of parsed and rendered paths that can be shared between threads, such as by the request handlers of a multi-threaded server.
+
+	`ParseCache` maps a path string, platform and encoding to a GPath, and `RenderCache` maps a GPath and a target platform to the rendered string. Both evict the least recently used entry when they are full, and keep statistics of their hits and misses.
+
+	Looking up an entry that is already in a cache does not take any lock. Every key is made up only of strings, integers (including `gpath.platform.Platform`), None and tuples, whose hashing and comparison cannot switch threads, so that each individual operation on the underlying `collections.OrderedDict` is atomic, and the only operations of a lookup are to get the entry and to move it to the most recently used end. Only adding a new entry after a miss takes the lock of the cache, in order to evict the least recently used entry if necessary. Two threads that miss the same key at the same time may both parse or render the path, but only one of the results is kept.
+
+	Examples
+	--------
+	```python
+	from gpath import cache
+
+	parse_cache = cache.ParseCache(max_size=10000)
+	render_cache = cache.RenderCache(max_size=10000)
+
+	def handle(request_path: str) -> str:
+		path = parse_cache.get(request_path)
+		return render_cache.get(path / "index.html", 'posix')
+	```
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Union
+
+from ._counters import ThreadCounters
+from ._gpath import GPath, GPathLike
+from ._nodes import PathNode
+from .platform import Platform
+
+
+__all__ = ('ParseCache', 'RenderCache')
+
+
+DEFAULT_MAX_SIZE = 65536
+
+
+class _LRUCache:
+	# Common implementation of ParseCache and RenderCache
+
+	__slots__ = ('_entries', '_max_size', '_lock', '_counters')
+
+	def __init__(self, max_size: int=DEFAULT_MAX_SIZE):
+		if max_size < 1:
+			raise ValueError(f"max_size must be positive: {max_size}")
+		self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+		self._max_size: int = max_size
+		self._lock: threading.Lock = threading.Lock()
+		self._counters: ThreadCounters = ThreadCounters()
+
+	def _lookup(self, key: Hashable) -> Any:
+		# Return the cached value of `key` and mark it as the most recently used, or None if it is not in the cache
+		entries = self._entries
+		value = entries.get(key)
+		if value is None:
+			return None
+		try:
+			entries.move_to_end(key)
+		except KeyError:
+			pass  # Evicted by another thread in the meantime
+		try:
+			self._counters.local.counters.hits += 1
+		except AttributeError:
+			self._counters.get().hits += 1
+		return value
+
+	def _add(self, key: Hashable, value: Any) -> Any:
+		# Add `value` to the cache after a miss, and return the value that is kept in the cache for `key`
+		self._counters.get().misses += 1
+		entries = self._entries
+		with self._lock:
+			value = entries.setdefault(key, value)
+			if len(entries) > self._max_size:
+				entries.popitem(last=False)
+		return value
+
+	@property
+	def max_size(self) -> int:
+		"""
+			Read-only maximum number of entries that can be kept in the cache
+		"""
+		return self._max_size
+
+	@property
+	def hits(self) -> int:
+		"""
+			Read-only number of lookups that were found in the cache, across all threads
+		"""
+		return self._counters.total().hits
+
+	@property
+	def misses(self) -> int:
+		"""
+			Read-only number of lookups that were not found in the cache, across all threads
+		"""
+		return self._counters.total().misses
+
+	def clear(self) -> None:
+		"""
+			Remove all entries from the cache and reset its statistics.
+		"""
+		with self._lock:
+			self._entries.clear()
+			self._counters.reset()
+
+	def stats(self) -> dict[str, int]:
+		"""
+			Return a snapshot of the statistics of the cache, as a dictionary with the keys `'size'`, `'max_size'`, `'hits'` and `'misses'`.
+		"""
+		counters = self._counters.total()
+		return {
+			'size': len(self._entries),
+			'max_size': self._max_size,
+			'hits': counters.hits,
+			'misses': counters.misses,
+		}
+
+	def __len__(self) -> int:
+		"""
+			Get the number of entries currently in the cache.
+
+			Usage: <code>len(<var>cache</var>)</code>
+		"""
+		return len(self._entries)
+
+	def __repr__(self) -> str:
+		"""
+			Return a string representation of the cache for debugging.
+
+			Usage: <code>repr(<var>cache</var>)</code>
+		"""
+		return f"{type(self).__name__}(max_size={self._max_size})"
+
+
+class ParseCache(_LRUCache):
+	"""
+		A bounded, thread-safe cache of GPaths parsed from strings, evicting the least recently used GPath when it is full.
+
+		Since GPaths are immutable, the same GPath is returned to every caller that looks up the same path.
+	"""
+
+	__slots__ = ()
+
+	def __init__(self, max_size: int=DEFAULT_MAX_SIZE):
+		"""
+			Initialise an empty cache.
+
+			Parameters
+			----------
+			`max_size`
+			: the maximum number of GPaths to be kept in the cache
+
+			Raises
+			------
+			`ValueError` if `max_size` is not positive
+		"""
+		super().__init__(max_size)
+
+	def get(self,
+		path: Union[str, bytes, os.PathLike],
+		platform: Optional[Union[str, Platform]]=None,
+		encoding: Optional[str]=None,
+	) -> GPath:
+		"""
+			Get the GPath of `path`, with the same result as <code>GPath(<var>path</var>, platform=<var>platform</var>, encoding=<var>encoding</var>)</code>, parsing it only if it is not already in the cache.
+
+			GPaths given as `path` are copied as by the constructor, without being cached.
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+
+			Examples
+			--------
+			```python
+			parse_cache = ParseCache()
+			parse_cache.get("/usr/bin") is parse_cache.get("/usr/bin")  # True
+			parse_cache.get("/usr/bin", platform='posix')                # GPath("/usr/bin", platform='posix')
+			```
+		"""
+		if type(path) is not str and type(path) is not bytes:
+			if isinstance(path, GPath):
+				return GPath(path, platform=platform, encoding=encoding)
+			if path is not None:
+				path = os.fspath(path)
+
+		# Platform names are not resolved, since different names of the same platform can simply have separate entries
+		key = (path, platform, encoding)
+		gpath = self._lookup(key)
+		if gpath is None:
+			gpath = self._add(key, GPath(path, platform=platform, encoding=encoding))
+		return gpath
+
+
+class RenderCache(_LRUCache):
+	"""
+		A bounded, thread-safe cache of the rendered strings of GPaths for target platforms, evicting the least recently used string when it is full.
+
+		Equal GPaths share the same entry, regardless of their own platform and encoding, or whether they are the same object.
+	"""
+
+	__slots__ = ()
+
+	def __init__(self, max_size: int=DEFAULT_MAX_SIZE):
+		"""
+			Initialise an empty cache.
+
+			Parameters
+			----------
+			`max_size`
+			: the maximum number of rendered strings to be kept in the cache
+
+			Raises
+			------
+			`ValueError` if `max_size` is not positive
+		"""
+		super().__init__(max_size)
+
+	def get(self, path: GPathLike, platform: Union[str, Platform, None]=None) -> str:
+		"""
+			Get the string of `path` rendered for `platform`, with the same result as <code>str(<var>path</var>.render(<var>platform</var>))</code>, rendering it only if it is not already in the cache.
+
+			If `platform` is not given, the generic rendering is used, as by <code>str(<var>path</var>)</code>.
+
+			Raises
+			------
+			`ValueError` if `path` is an invalid GPath
+
+			Examples
+			--------
+			```python
+			render_cache = RenderCache()
+			render_cache.get(GPath("C:/Windows"), 'windows')  # "C:\\Windows"
+			render_cache.get("C:/Windows", 'posix')           # "/Windows"
+			```
+		"""
+		if not isinstance(path, GPath):
+			path = GPath(path)
+		parts = path._parts
+		if type(parts) is PathNode:
+			parts = parts.to_tuple()
+		# The platform and encoding of `path` itself do not affect its rendering, so they are not part of the key
+		key = (platform, path._root, path._drive, path._parent_level, parts)
+		rendered = self._lookup(key)
+		if rendered is None:
+			rendered = self._add(key, str(path.render(platform)))
+		return rendered
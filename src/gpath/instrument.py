@@ -0,0 +1,351 @@
+"""
+	Opt-in instrumentation of GPath operations, for finding out which operations, and which call sites, are responsible for the time spent on path handling.
+
+	When instrumentation is enabled using `enable()`, the following operations are counted and timed:
+
+	- `'construct/<platform>'`: GPaths created by the GPath constructor, including by operations that return a new GPath, per platform (where GPaths without a platform are counted as `'generic'`)
+	- `'from_many/<platform>'`: GPaths created by `GPath.from_many()`, per platform; the count is the number of paths (up to and including the path that caused an exception, if any), and the time is that of the whole batch
+	- `'decode'`: bytes-like paths decoded by the GPath constructor and `GPath.from_many()`, and bytes-like operands decoded by operations that use them without creating a GPath, such as `==`, `in` and `GPath.join()`
+	- `'common_with'`, `'relpath_from'` and `'partition'`: calls of the corresponding GPath methods, including through operators such as `&`
+	- `'render'` and `'render_many'`: calls of `GPath.render()` and `gpath.render.render_many()`
+
+	Times are cumulative wall-clock times, and include the time spent in any other instrumented operation that is called internally; for example, `common_with()` creates its result using the GPath constructor, which is also counted under `'construct/<platform>'`.
+
+	Instrumentation works by replacing the instrumented functions with timing wrappers, which are removed again once every call of `enable()` has been matched by a call of `disable()` and every `measure()` block has exited. It is disabled by default, in which case it has no overhead at all.
+
+	Counts and times are process-wide: while instrumentation is enabled, the operations of every thread are recorded, and the results of a `measure()` block also include the operations of other threads during the block.
+
+	Examples
+	--------
+	```python
+	from gpath import GPath, instrument
+
+	with instrument.measure(call_sites=True) as stats:
+		paths = [GPath(f"/data/{i}") for i in range(1000)]
+		GPath.partition(paths)
+	print(stats['construct/generic']['count'])
+	print(stats['partition']['time'])
+	print(stats['partition']['call_sites'])  # {'example.py:5': 1}
+	```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
+
+from . import _gpath, render
+from ._counters import ThreadCounters
+from ._gpath import DEFAULT_ENCODING, GPath
+from .platform import Platform
+
+
+__all__ = ('enable', 'disable', 'is_enabled', 'reset', 'snapshot', 'measure')
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+_lock = threading.Lock()  # Guards the counters below, and the replacement of the instrumented functions
+
+_enable_count: int = 0  # Calls of enable() that have not been matched by disable()
+_measure_count: int = 0  # Active measure() blocks
+_call_site_measure_count: int = 0  # Active measure() blocks that record call sites
+_call_sites_option: bool = False  # The call_sites option of the latest call of enable()
+_call_sites_enabled: bool = False  # Read by the wrappers without the lock
+_originals: list[tuple[Any, str, Any]] = []  # (owner, attribute name, original attribute) of every replaced function
+
+
+
+class _Stats:
+	# Counts and times of the operations of a single thread, which are only ever recorded by that thread
+	__slots__ = ('counts', 'times', 'call_sites')
+
+	def __init__(self):
+		self.counts: dict[str, int] = {}
+		self.times: dict[str, int] = {}  # In nanoseconds
+		self.call_sites: dict[str, dict[str, int]] = {}
+
+	def add(self, other: _Stats) -> None:
+		# The dictionaries of `other` are copied before iterating over them, since its thread may be recording into them at the same time
+		for name, count in other.counts.copy().items():
+			self.counts[name] = self.counts.get(name, 0) + count
+		for name, elapsed in other.times.copy().items():
+			self.times[name] = self.times.get(name, 0) + elapsed
+		for name, other_sites in other.call_sites.copy().items():
+			sites = self.call_sites.setdefault(name, {})
+			for call_site, count in other_sites.copy().items():
+				sites[call_site] = sites.get(call_site, 0) + count
+
+	def reset(self) -> None:
+		self.counts.clear()
+		self.times.clear()
+		self.call_sites.clear()
+
+
+_stats = ThreadCounters(_Stats)
+
+
+def _get_call_site() -> str:
+	# The innermost frame outside of the gpath package, which is the caller of the outermost GPath operation
+	frame = sys._getframe(2)
+	while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+		frame = frame.f_back  # type: ignore
+	if frame is None:
+		return "<unknown>"
+	return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _record(name: str, elapsed: int, count: int=1, call_site: Optional[str]=None) -> None:
+	try:
+		stats = _stats.local.counters
+	except AttributeError:
+		stats = _stats.get()
+	counts = stats.counts
+	counts[name] = counts.get(name, 0) + count
+	times = stats.times
+	times[name] = times.get(name, 0) + elapsed
+	if call_site is not None:
+		sites = stats.call_sites.setdefault(name, {})
+		sites[call_site] = sites.get(call_site, 0) + count
+
+
+def _platform_name(platform: Optional[Platform]) -> str:
+	return str(Platform.GENERIC if platform is None else platform)
+
+
+def _decode(path: Any, encoding: Optional[str]) -> Any:
+	# Decode bytes-like paths in advance, so that decoding can be timed separately; other paths are returned unchanged, to be handled by GPath as usual
+	if path is None or isinstance(path, (str, GPath)):
+		return path
+	path = os.fspath(path)
+	if isinstance(path, bytes):
+		start = perf_counter_ns()
+		path = path.decode(DEFAULT_ENCODING if encoding is None else encoding)
+		_record('decode', perf_counter_ns() - start)
+	return path
+
+
+def _wrap_init(original: Callable) -> Callable:
+	@functools.wraps(original)
+	def __init__(self, path="", platform=None, encoding=None, compact=None, lazy=False):
+		call_site = _get_call_site() if _call_sites_enabled else None
+		path = _decode(path, encoding)
+		start = perf_counter_ns()
+		try:
+			original(self, path, platform, encoding, compact, lazy)
+		finally:
+			_record(f"construct/{_platform_name(getattr(self, '_platform', None))}", perf_counter_ns() - start, call_site=call_site)
+	return __init__
+
+
+def _wrap_from_many(original: Callable) -> Callable:
+	@functools.wraps(original)
+	def from_many(paths, platform=None, encoding=None, compact=None, lazy=False):
+		call_site = _get_call_site() if _call_sites_enabled else None
+		try:
+			name = f"from_many/{_platform_name(Platform.from_str(platform) if isinstance(platform, str) else platform)}"
+		except KeyError:
+			name = f"from_many/{_platform_name(None)}"  # Raised again by the original, and counted as by the constructor
+
+		count = 0
+		def decode_paths():
+			# Count the paths as they are consumed, so that a call that raises is counted up to the path that caused it
+			nonlocal count
+			for path in paths:
+				count += 1
+				yield _decode(path, encoding)
+
+		start = perf_counter_ns()
+		try:
+			return original(decode_paths(), platform, encoding, compact, lazy)
+		finally:
+			_record(name, perf_counter_ns() - start, count=count, call_site=call_site)
+	return from_many
+
+
+def _wrap_parse_operand(original: Callable) -> Callable:
+	@functools.wraps(original)
+	def _parse_operand(path, encoding):
+		return original(_decode(path, encoding), encoding)
+	return _parse_operand
+
+
+def _wrap(name: str, original: Callable) -> Callable:
+	@functools.wraps(original)
+	def wrapper(*args, **kwargs):
+		call_site = _get_call_site() if _call_sites_enabled else None
+		start = perf_counter_ns()
+		try:
+			return original(*args, **kwargs)
+		finally:
+			_record(name, perf_counter_ns() - start, call_site=call_site)
+	return wrapper
+
+
+def _replace(owner: Any, name: str, make_wrapper: Callable[[Callable], Callable]) -> None:
+	original = owner.__dict__[name]
+	if isinstance(original, staticmethod):
+		replacement: Any = staticmethod(make_wrapper(original.__func__))
+	else:
+		replacement = make_wrapper(original)
+	_originals.append((owner, name, original))
+	setattr(owner, name, replacement)
+
+
+def _update(was_enabled: bool) -> None:
+	# Apply a change to the counters, replacing or restoring the instrumented functions if instrumentation was just enabled or disabled; must be called with the lock held
+	global _call_sites_option, _call_sites_enabled
+	enabled = _enable_count + _measure_count > 0
+	if _enable_count == 0:
+		_call_sites_option = False
+	_call_sites_enabled = _call_sites_option or _call_site_measure_count > 0
+
+	if enabled and not was_enabled:
+		_replace(GPath, '__init__', _wrap_init)
+		_replace(GPath, 'from_many', _wrap_from_many)
+		for name in ('common_with', 'relpath_from', 'partition', 'render'):
+			_replace(GPath, name, functools.partial(_wrap, name))
+		_replace(render, 'render_many', functools.partial(_wrap, 'render_many'))
+		_replace(_gpath, '_parse_operand', _wrap_parse_operand)
+	elif was_enabled and not enabled:
+		while len(_originals) > 0:
+			owner, name, original = _originals.pop()
+			setattr(owner, name, original)
+
+
+def enable(call_sites: bool=False) -> None:
+	"""
+		Enable instrumentation of GPath operations, adding to any counts and times that were already recorded.
+
+		Calls can be nested, including from different threads, and instrumentation stays enabled until every call has been matched by a call of `disable()`. If instrumentation is already enabled by `enable()`, the `call_sites` option replaces that of the previous call.
+
+		Parameters
+		----------
+		`call_sites`
+		: whether to also count the calls of each operation by the file and line number from which they were made, outside of the gpath package. This makes instrumented operations noticeably slower.
+	"""
+	global _enable_count, _call_sites_option
+	with _lock:
+		was_enabled = _enable_count + _measure_count > 0
+		_enable_count += 1
+		_call_sites_option = call_sites
+		_update(was_enabled)
+
+
+def disable() -> None:
+	"""
+		Undo one call of `enable()`. Once every call has been undone and no `measure()` block is active, instrumentation is disabled, removing all overhead. The counts and times recorded so far are kept until `reset()`.
+
+		If there is no call of `enable()` left to undo, this has no effect.
+	"""
+	global _enable_count
+	with _lock:
+		if _enable_count == 0:
+			return
+		_enable_count -= 1
+		_update(True)
+
+
+def is_enabled() -> bool:
+	"""
+		Check if instrumentation of GPath operations is currently enabled, either by `enable()` or by an active `measure()` block.
+	"""
+	return _enable_count + _measure_count > 0
+
+
+def reset() -> None:
+	"""
+		Discard all counts and times recorded so far.
+	"""
+	_stats.reset()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+	"""
+		Return a snapshot of the counts and times recorded so far.
+
+		Returns
+		-------
+		`dict[str, dict[str, Any]]`
+		: a dictionary mapping the name of each operation that was called at least once to a dictionary with the keys `'count'`, for the number of calls, and `'time'`, for the cumulative time in seconds. If call sites were recorded for the operation, there is also the key `'call_sites'`, mapping each call site as <code><var>filename</var>:<var>line</var></code> to the number of calls from it.
+
+		Examples
+		--------
+		```python
+		instrument.enable()
+		GPath("/usr") & GPath("/usr/bin")
+		instrument.snapshot()
+		# {'construct/generic': {'count': 3, 'time': 1.2e-05}, 'common_with': {'count': 1, 'time': 8.1e-06}}
+		```
+	"""
+	stats = _stats.total()
+	result: dict[str, dict[str, Any]] = {}
+	for name, count in stats.counts.items():
+		result[name] = {'count': count, 'time': stats.times.get(name, 0) / 1e9}
+		if name in stats.call_sites:
+			result[name]['call_sites'] = stats.call_sites[name]
+	return result
+
+
+def _difference(after: dict[str, dict[str, Any]], before: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+	result: dict[str, dict[str, Any]] = {}
+	for name, stats in after.items():
+		previous = before.get(name, {'count': 0, 'time': 0.0})
+		if stats['count'] == previous['count'] and stats['time'] == previous['time']:
+			continue
+		result[name] = {'count': stats['count'] - previous['count'], 'time': stats['time'] - previous['time']}
+		if 'call_sites' in stats:
+			previous_sites = previous.get('call_sites', {})
+			result[name]['call_sites'] = {site: count - previous_sites.get(site, 0) for site, count in stats['call_sites'].items() if count != previous_sites.get(site, 0)}
+	return result
+
+
+@contextlib.contextmanager
+def measure(call_sites: bool=False) -> Iterator[dict[str, dict[str, Any]]]:
+	"""
+		Measure the GPath operations within a `with` block.
+
+		Instrumentation is enabled for the duration of the block if it is not already enabled, and disabled again afterwards unless it is still enabled by `enable()` or by another block. Blocks can be nested or overlap, including in different threads. Since counts are process-wide, each block measures the operations of every thread during the block.
+
+		Parameters
+		----------
+		`call_sites`
+		: whether to also record call sites (see `enable()`) for the duration of the block
+
+		Returns
+		-------
+		`dict[str, dict[str, Any]]`
+		: a dictionary that is empty within the block, and is filled in when the block exits with the counts and times of the operations called within the block, in the same format as `snapshot()`
+
+		Examples
+		--------
+		```python
+		with instrument.measure() as stats:
+			GPath(b"/usr/bin").render('windows')
+		stats  # {'decode': {...}, 'construct/generic': {...}, 'render': {...}}
+		```
+	"""
+	global _measure_count, _call_site_measure_count
+	with _lock:
+		was_enabled = _enable_count + _measure_count > 0
+		_measure_count += 1
+		_call_site_measure_count += call_sites
+		_update(was_enabled)
+
+	before = snapshot()
+	stats: dict[str, dict[str, Any]] = {}
+	try:
+		yield stats
+	finally:
+		stats.update(_difference(snapshot(), before))
+		with _lock:
+			_measure_count -= 1
+			_call_site_measure_count -= call_sites
+			_update(True)
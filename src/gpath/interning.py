@@ -0,0 +1,224 @@
+"""
+	Opt-in interning of path components, which deduplicates identical component strings that are shared between many GPaths.
+
+	When interning is enabled using `enable()`, every path component parsed by the GPath constructor (including when GPath-like operands are given to operators such as `__add__()`, `__truediv__()` or `GPath.join()`) is replaced by a canonical copy of the same string from a bounded pool, so that paths sharing a small vocabulary of directory names only store each name once.
+
+	Interning is disabled by default. GPaths that were created before interning was enabled are not affected, although new GPaths returned by operations on them will share whatever components they already have.
+
+	Examples
+	--------
+	```python
+	from gpath import GPath, interning
+
+	pool = interning.enable()
+	paths = [GPath(f"/data/2024/shard-{i % 100:03}") for i in range(10000)]
+	print(pool.saved_bytes)
+	interning.disable()
+	```
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Iterable
+from typing import Optional
+
+from ._counters import Counters, ThreadCounters
+
+
+__all__ = ('InternPool', 'enable', 'disable', 'get_pool')
+
+
+DEFAULT_MAX_SIZE = 65536
+
+
+class InternPool:
+	"""
+		A bounded pool of canonical strings, which can be shared between threads.
+
+		When the pool is full, the string that was added to the pool earliest is evicted to make space for a new string. Evicted strings remain valid wherever they are already used, but later occurrences of the same string will no longer share their memory with them.
+
+		Looking up a string that is already in the pool does not take any lock; only adding a new string takes the lock of the pool.
+	"""
+
+	__slots__ = ('_strings', '_max_size', '_lock', '_counters')
+
+	def __init__(self, max_size: int=DEFAULT_MAX_SIZE):
+		"""
+			Initialise an empty pool.
+
+			Parameters
+			----------
+			`max_size`
+			: the maximum number of distinct strings to be kept in the pool
+
+			Raises
+			------
+			`ValueError` if `max_size` is not positive
+		"""
+		if max_size < 1:
+			raise ValueError(f"max_size must be positive: {max_size}")
+		self._strings: dict[str, str] = {}
+		self._max_size: int = max_size
+		self._lock: threading.Lock = threading.Lock()
+		self._counters: ThreadCounters = ThreadCounters()
+
+	@property
+	def max_size(self) -> int:
+		"""
+			Read-only maximum number of distinct strings that can be kept in the pool
+		"""
+		return self._max_size
+
+	@property
+	def hits(self) -> int:
+		"""
+			Read-only number of strings that were found in the pool, across all threads
+		"""
+		return self._counters.total().hits
+
+	@property
+	def misses(self) -> int:
+		"""
+			Read-only number of strings that were not found in the pool, and had to be added to it, across all threads
+		"""
+		return self._counters.total().misses
+
+	@property
+	def saved_bytes(self) -> int:
+		"""
+			Read-only estimate of the memory saved by interning, in bytes
+
+			This is the total size of every duplicate string that was replaced by its canonical copy from the pool, which can then be freed if it is not referenced anywhere else.
+		"""
+		return self._counters.total().saved_bytes
+
+	def _add(self, string: str, counters: Counters) -> str:
+		# Add `string` to the pool after a miss, and return its canonical copy
+		strings = self._strings
+		with self._lock:
+			# Another thread may have added the same string in the meantime
+			canonical = strings.get(string)
+			if canonical is None:
+				if len(strings) >= self._max_size:
+					del strings[next(iter(strings))]
+				strings[string] = string
+		if canonical is None:
+			counters.misses += 1
+			return string
+		counters.hits += 1
+		if canonical is not string:
+			counters.saved_bytes += sys.getsizeof(string)
+		return canonical
+
+	def intern(self, string: str) -> str:
+		"""
+			Return the canonical copy of `string` from the pool, adding `string` to the pool if it is not already in it.
+		"""
+		try:
+			counters = self._counters.local.counters
+		except AttributeError:
+			counters = self._counters.get()
+		canonical = self._strings.get(string)
+		if canonical is None:
+			return self._add(string, counters)
+		counters.hits += 1
+		if canonical is not string:
+			counters.saved_bytes += sys.getsizeof(string)
+		return canonical
+
+	def intern_parts(self, parts: Iterable[str]) -> tuple[str, ...]:
+		"""
+			Return a tuple of the canonical copies of each string in `parts`.
+		"""
+		# Same as intern() for each string, but updating the statistics of the thread only once
+		try:
+			counters = self._counters.local.counters
+		except AttributeError:
+			counters = self._counters.get()
+		strings = self._strings
+		result = []
+		hits = 0
+		saved_bytes = 0
+		for string in parts:
+			canonical = strings.get(string)
+			if canonical is None:
+				canonical = self._add(string, counters)
+			else:
+				hits += 1
+				if canonical is not string:
+					saved_bytes += sys.getsizeof(string)
+			result.append(canonical)
+		counters.hits += hits
+		counters.saved_bytes += saved_bytes
+		return tuple(result)
+
+	def clear(self) -> None:
+		"""
+			Remove all strings from the pool and reset its statistics.
+		"""
+		with self._lock:
+			self._strings.clear()
+			self._counters.reset()
+
+	def stats(self) -> dict[str, int]:
+		"""
+			Return a snapshot of the statistics of the pool, as a dictionary with the keys `'size'`, `'max_size'`, `'hits'`, `'misses'` and `'saved_bytes'`.
+		"""
+		counters = self._counters.total()
+		return {
+			'size': len(self._strings),
+			'max_size': self._max_size,
+			'hits': counters.hits,
+			'misses': counters.misses,
+			'saved_bytes': counters.saved_bytes,
+		}
+
+	def __len__(self) -> int:
+		"""
+			Get the number of distinct strings currently in the pool.
+
+			Usage: <code>len(<var>pool</var>)</code>
+		"""
+		return len(self._strings)
+
+	def __repr__(self) -> str:
+		"""
+			Return a string representation of the pool for debugging.
+
+			Usage: <code>repr(<var>pool</var>)</code>
+		"""
+		return f"InternPool(max_size={self._max_size})"
+
+
+_pool: Optional[InternPool] = None
+
+
+def enable(max_size: int=DEFAULT_MAX_SIZE) -> InternPool:
+	"""
+		Enable interning of path components for all GPaths created from now on, using a new pool that can hold up to `max_size` distinct components.
+
+		Returns
+		-------
+		`InternPool`
+		: the new pool, which can be used to inspect how much memory has been saved
+	"""
+	global _pool
+	_pool = InternPool(max_size)
+	return _pool
+
+
+def disable() -> None:
+	"""
+		Disable interning of path components and discard the current pool, if any.
+	"""
+	global _pool
+	_pool = None
+
+
+def get_pool() -> Optional[InternPool]:
+	"""
+		Get the pool currently used for interning path components, or None if interning is disabled.
+	"""
+	return _pool
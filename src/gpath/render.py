@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import functools
+import itertools
+import operator
 from abc import ABC, abstractmethod
-from typing import Type
+from collections.abc import Callable, Iterable, Sequence
+from typing import Optional, TextIO, Type, Union
 
 from . import _rules
 from .platform import Platform
@@ -16,6 +19,8 @@ __all__ = (
 	'LinuxRenderedPath',
 	'MacOsRenderedPath',
 	'WindowsRenderedPath',
+	'render_many',
+	'sorted_paths',
 )
 
 
@@ -71,6 +76,39 @@ class Renderable(ABC):
 		pass
 
 
+def _make_render_function(rules, with_drive: bool) -> Callable[[bool, str, int, Sequence[str]], str]:
+	# Look up the rules once, instead of on every call
+	drive_postfix = rules.drive_postfixes[0] if with_drive else ""
+	root = rules.roots[0]
+	separator = rules.separators[0]
+	current = rules.current_indicators[0]
+	parent = rules.parent_indicators[0]
+	parent_with_separator = parent + separator
+
+	def render_path(absolute: bool, drive: str, parent_level: int, named_parts: Sequence[str]) -> str:
+		if parent_level == 0:
+			relative = separator.join(named_parts)
+		elif len(named_parts) == 0:
+			relative = parent_with_separator * (parent_level - 1) + parent
+		else:
+			relative = parent_with_separator * parent_level + separator.join(named_parts)
+
+		if absolute:
+			relative = root + relative
+		if with_drive and drive != "":
+			return drive + drive_postfix + relative
+		if relative == "":
+			return current
+		return relative
+
+	return render_path
+
+
+_render_generic = _make_render_function(_rules.generic_rules, with_drive=True)
+_render_posix = _make_render_function(_rules.posix_rules, with_drive=False)
+_render_windows = _make_render_function(_rules.windows_rules, with_drive=True)
+
+
 @functools.total_ordering
 class RenderedPath(ABC):
 	"""
@@ -83,7 +121,7 @@ class RenderedPath(ABC):
 		- meaningfully compared and sorted
 	"""
 
-	__slots__ = ('_path')
+	__slots__ = ('_path', '_hash', '_str', '_sort_key')
 
 	def __hash__(self) -> int:
 		"""
@@ -91,13 +129,39 @@ class RenderedPath(ABC):
 
 			Usage: <code>hash(<var>rp</var>)</code>
 		"""
-		return hash(self._tuple)
+		if self._hash is None:
+			self._hash = hash(self.sort_key)
+		return self._hash
 
 	def __init__(self, path: Renderable):
 		"""
 			Initialise a rendered path from any object that is Renderable.
 		"""
 		self._path: Renderable = path
+		self._hash: Optional[int] = None
+		self._str: Optional[str] = None
+		self._sort_key: Optional[tuple] = None
+
+	def __getstate__(self) -> Renderable:
+		# Exclude the cached hash, which is not valid in another interpreter
+		return self._path
+
+	def __setstate__(self, state: Renderable) -> None:
+		self._path = state
+		self._hash = None
+		self._str = None
+		self._sort_key = None
+
+	@property
+	def sort_key(self) -> tuple:
+		"""
+			Read-only key that determines the collation order of the path on the target platform, such that <code><var>rp1</var> < <var>rp2</var></code> if and only if <code><var>rp1</var>.sort_key < <var>rp2</var>.sort_key</code>, for RenderedPaths of the same type
+
+			The key is only computed on the first access, and is cached for subsequent accesses and comparisons.
+		"""
+		if self._sort_key is None:
+			self._sort_key = self._tuple
+		return self._sort_key
 
 	def __eq__(self, other) -> bool:
 		"""
@@ -105,7 +169,7 @@ class RenderedPath(ABC):
 
 			Usage: <code><var>rp1</var> == <var>rp2</var></code>
 		"""
-		return type(self) == type(other) and self._tuple == other._tuple
+		return type(self) == type(other) and self.sort_key == other.sort_key
 
 	def __lt__(self, other) -> bool:
 		"""
@@ -113,7 +177,7 @@ class RenderedPath(ABC):
 
 			Usage: <code><var>rp1</var> < <var>rp2</var></code>
 		"""
-		return self._tuple < other._tuple
+		return self.sort_key < other.sort_key
 
 	def __bool__(self) -> bool:
 		"""
@@ -129,9 +193,23 @@ class RenderedPath(ABC):
 		"""
 			Return a string representation of the path in the preferred format for the target platform
 
+			The string is only rendered on the first call, and is cached for subsequent calls.
+
 			Usage: <code>str(<var>rp</var>)</code>
 		"""
-		return repr(self)
+		if self._str is None:
+			self._str = self._render()
+		return self._str
+
+	def __fspath__(self) -> str:
+		"""
+			Return the same string as `__str__()`, so that RenderedPath can be used wherever an `os.PathLike` is accepted.
+
+			This should normally only be used when the target platform of the RenderedPath is the local operating system.
+
+			Usage: <code>os.fspath(<var>rp</var>)</code>, or <code>open(<var>rp</var>)</code> and other functions that accept path-like objects
+		"""
+		return str(self)
 
 	def __repr__(self) -> str:
 		"""
@@ -141,14 +219,14 @@ class RenderedPath(ABC):
 		"""
 		return f"{type(self).__name__}({repr(self._path)})"
 
+	def _render(self) -> str:
+		# Render the string returned by __str__(), to be overridden for each target platform
+		return repr(self)
+
 	@property
 	def _tuple(self) -> tuple:
-		return (
-			self._path.absolute,
-			self._path.drive,
-			self._path.parent_level,
-			self._path.named_parts,
-		)
+		# Compute the sort key, to be overridden for target platforms that ignore some of the fields
+		return _get_sort_key(self._path)
 
 
 class GenericRenderedPath(RenderedPath):
@@ -159,11 +237,8 @@ class GenericRenderedPath(RenderedPath):
 
 		Note that if the path contains a drive, it should be removed if the path is to be used on Linux or macOS. On Windows, forward slashes / will be used in favour of backslashes.
 	"""
-	def __str__(self) -> str:
-		if bool(self):
-			return (self._path.drive + _rules.generic_rules.drive_postfixes[0] if self._path.drive != "" else "") + (_rules.generic_rules.roots[0] if self._path.absolute else "") + _rules.generic_rules.separators[0].join(self._path.relative_parts)
-		else:
-			return _rules.generic_rules.current_indicators[0]
+	def _render(self) -> str:
+		return _render_generic(self._path.absolute, self._path.drive, self._path.parent_level, self._path.named_parts)
 
 
 class PosixRenderedPath(RenderedPath):
@@ -172,11 +247,8 @@ class PosixRenderedPath(RenderedPath):
 
 		If the original path contains a drive, it will be ignored for both printing and collation. Forward slashes are used always.
 	"""
-	def __str__(self) -> str:
-		if bool(self):
-			return (_rules.posix_rules.roots[0] if self._path.absolute else "") + _rules.posix_rules.separators[0].join(self._path.relative_parts)
-		else:
-			return _rules.posix_rules.current_indicators[0]
+	def _render(self) -> str:
+		return _render_posix(self._path.absolute, self._path.drive, self._path.parent_level, self._path.named_parts)
 
 	def __bool__(self) -> bool:
 		"""
@@ -188,11 +260,7 @@ class PosixRenderedPath(RenderedPath):
 
 	@property
 	def _tuple(self) -> tuple:
-		return (
-			self._path.absolute,
-			self._path.parent_level,
-			self._path.named_parts,
-		)
+		return _get_posix_sort_key(self._path)
 
 LinuxRenderedPath = PosixRenderedPath
 """Alias of `PosixRenderedPath`"""
@@ -207,11 +275,8 @@ class WindowsRenderedPath(RenderedPath):
 
 		The path may or may not contain a drive, which affects both its printed output and its collation order. Backslashes are used always, although forward slashes are supported on Windows NT also.
 	"""
-	def __str__(self) -> str:
-		if bool(self):
-			return (self._path.drive + _rules.windows_rules.drive_postfixes[0] if self._path.drive != "" else "") + (_rules.windows_rules.roots[0] if self._path.absolute else "") + _rules.windows_rules.separators[0].join(self._path.relative_parts)
-		else:
-			return _rules.windows_rules.current_indicators[0]
+	def _render(self) -> str:
+		return _render_windows(self._path.absolute, self._path.drive, self._path.parent_level, self._path.named_parts)
 
 
 _render_of_platforms: dict[Platform, Type[RenderedPath]] = {
@@ -221,6 +286,126 @@ _render_of_platforms: dict[Platform, Type[RenderedPath]] = {
 }
 
 
+_render_functions_of_platforms: dict[Platform, Callable[[bool, str, int, Sequence[str]], str]] = {
+	Platform.GENERIC: _render_generic,
+	Platform.POSIX: _render_posix,
+	Platform.WINDOWS: _render_windows,
+}
+
+_get_render_fields = operator.attrgetter('absolute', 'drive', 'parent_level', 'named_parts')
+
+_WRITE_CHUNK_SIZE = 4096
+
+
+def _get_sort_key(path: Renderable) -> tuple:
+	return (path.absolute, path.drive, path.parent_level, tuple(path.named_parts))
+
+
+def _get_posix_sort_key(path: Renderable) -> tuple:
+	# The drive is ignored on POSIX-like platforms
+	return (path.absolute, path.parent_level, tuple(path.named_parts))
+
+
+_sort_key_functions_of_platforms: dict[Platform, Callable[[Renderable], tuple]] = {
+	Platform.GENERIC: _get_sort_key,
+	Platform.POSIX: _get_posix_sort_key,
+	Platform.WINDOWS: _get_sort_key,
+}
+
+
 def get_type(platform: Platform) -> Type[RenderedPath]:
 	"""Get the type of RenderedPath that corresponds to the given Platform"""
 	return _render_of_platforms[platform]
+
+
+def render_many(
+	paths: Iterable[Renderable],
+	platform: Union[str, Platform],
+	file: Optional[TextIO]=None,
+	end: str="\n",
+) -> Optional[list[str]]:
+	"""
+		Render many paths for a specific target platform in a single pass, either into a list of strings or directly into a text file.
+
+		Each string is the same as <code>str(<var>path</var>.render(<var>platform</var>))</code>, but no RenderedPath is created for any of the paths, and the rules of the target platform are only looked up once. This is much faster when the same paths do not need to be rendered again later.
+
+		Parameters
+		----------
+		`paths`
+		: the paths to be rendered, usually GPaths
+
+		`platform`
+		: the target platform where the paths are to be used
+
+		`file`
+		: if given, a writable text stream that the rendered paths should be written to, instead of being returned
+
+		`end`
+		: string written after each rendered path when writing to `file`; ignored if `file` is not given
+
+		Returns
+		-------
+		`list[str]`
+		: the rendered strings, in the same order as `paths`, if `file` is not given
+
+		`None`
+		: if `file` is given
+
+		Examples
+		--------
+		```python
+		paths = [GPath("/usr/bin"), GPath("C:/Windows")]
+		render.render_many(paths, 'posix')    # ["/usr/bin", "/Windows"]
+		render.render_many(paths, 'windows')  # ["\\usr\\bin", "C:\\Windows"]
+		render.render_many(paths, 'posix', file=sys.stdout)
+		```
+	"""
+	if isinstance(platform, str):
+		platform = Platform.from_str(platform)
+	render_path = _render_functions_of_platforms[platform]
+
+	if file is None:
+		return [render_path(*_get_render_fields(path)) for path in paths]
+
+	# Write in chunks to limit both the number of writes and the memory used for the joined string
+	path_iter = iter(paths)
+	while True:
+		chunk = [render_path(*_get_render_fields(path)) for path in itertools.islice(path_iter, _WRITE_CHUNK_SIZE)]
+		if len(chunk) == 0:
+			return None
+		file.write(end.join(chunk) + end)
+
+
+def sorted_paths(paths: Iterable[Renderable], platform: Union[str, Platform], reverse: bool=False) -> list:
+	"""
+		Sort paths in the collation order of a specific target platform, which is the same order as sorting <code><var>path</var>.render(<var>platform</var>)</code> for each path.
+
+		The sort key of each path is computed exactly once and compared as a plain tuple, and no RenderedPath is created for any of the paths. This is much faster than sorting RenderedPaths for large numbers of paths. The sort is stable.
+
+		Parameters
+		----------
+		`paths`
+		: the paths to be sorted, usually GPaths
+
+		`platform`
+		: the target platform whose collation order should be used
+
+		`reverse`
+		: whether to sort in descending order instead
+
+		Returns
+		-------
+		`list`
+		: a new list of the items in `paths`, in sorted order
+
+		Examples
+		--------
+		```python
+		paths = [GPath("/usr/bin"), GPath("C:/Windows"), GPath("/usr")]
+		render.sorted_paths(paths, 'posix')    # [GPath("C:/Windows"), GPath("/usr"), GPath("/usr/bin")]
+		render.sorted_paths(paths, 'windows')  # [GPath("/usr"), GPath("/usr/bin"), GPath("C:/Windows")]
+		```
+	"""
+	if isinstance(platform, str):
+		platform = Platform.from_str(platform)
+	return sorted(paths, key=_sort_key_functions_of_platforms[platform], reverse=reverse)
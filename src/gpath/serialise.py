@@ -0,0 +1,409 @@
+"""
+	Compact binary serialisation of collections of GPaths, which is much smaller than pickling the same GPaths.
+
+	The format stores each distinct path component only once, in a dictionary that is built up as the paths are written, and stores each path as the number of components that it shares with the previous path followed by its remaining components. Sorting the paths before writing them (using `sort=True`) makes consecutive paths share longer prefixes, and therefore makes the output smaller.
+
+	Paths loaded from the same data also share their component strings in memory, similar to `gpath.interning`.
+
+	Examples
+	--------
+	```python
+	from gpath import GPath, serialise
+
+	data = serialise.dumps([GPath("/usr/bin"), GPath("/usr/local/bin")])
+	serialise.loads(data)  # [GPath("/usr/bin"), GPath("/usr/local/bin")]
+
+	with open("paths.bin", 'wb') as file:
+		serialise.dump(paths, file, sort=True)
+	with open("paths.bin", 'rb') as file:
+		paths = serialise.load(file)
+	```
+
+	Format
+	------
+	All integers are unsigned LEB128 varints. The data starts with the magic bytes `b"GPTH"` and a version byte, followed by blocks of up to `BLOCK_SIZE` paths each. Every block consists of:
+
+	- the size in bytes of its strings section, and the size in bytes of its values section
+	- the strings section, which is the UTF-8 encoding of every string that is used for the first time in this block, concatenated together; strings that cannot be encoded in UTF-8 (such as those decoded using `'surrogateescape'`) are encoded with `'surrogatepass'`
+	- the values section, which is a sequence of varints: the number of new strings, the length of each new string in code points, and then a record for each path
+
+	Strings are numbered in the order that they are introduced, across all blocks. The record for each path consists of:
+
+	- flags, as the sum of `1` if the path is absolute (has a root), `2` if the drive differs from the previous path, `4` if the parent level differs from the previous path, and `8` if the platform or encoding differ from the previous path
+	- if the drive differs, the string id of the new drive
+	- if the parent level differs, the new parent level
+	- if the platform or encoding differ, the platform (`0` for None, or the Platform value plus 1) and the string id of the encoding plus 1 (`0` for None)
+	- the number of leading components shared with the previous path
+	- the number of further components, followed by the string id of each of them
+
+	Before the first record, the previous path is taken to be an empty relative path with no drive, platform or encoding.
+
+	Keeping the strings and the varints in separate sections allows each of them to be decoded in bulk. The format does not record the total number of paths, so that it can be written in a single pass; as a result, data that is truncated exactly at the end of a block cannot be detected as truncated.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from itertools import accumulate
+from typing import BinaryIO, Optional, Union
+
+from ._gpath import GPath, _common_prefix_length
+from ._nodes import make_node
+from .platform import Platform
+
+
+__all__ = ('dump', 'dumps', 'load', 'loads')
+
+
+MAGIC = b"GPTH"
+VERSION = 1
+
+BLOCK_SIZE = 8192
+"""Maximum number of paths in each block of serialised data"""
+
+_FLAG_ROOT = 1
+_FLAG_DRIVE = 2
+_FLAG_PARENT_LEVEL = 4
+_FLAG_METADATA = 8
+
+_VARINT_PATTERN = re.compile(rb"[\x80-\xff]*[\x00-\x7f]")
+_MAX_CACHED_VARINT = 1 << 14  # Values that fit in two bytes
+
+
+def _encode_varint(value: int) -> bytes:
+	# Values that fit in up to 3 bytes are handled separately, since they are by far the most common
+	if value < 0x80:
+		return bytes((value,))
+	if value < 0x4000:
+		return bytes(((value & 0x7F) | 0x80, value >> 7))
+	if value < 0x200000:
+		return bytes(((value & 0x7F) | 0x80, ((value >> 7) & 0x7F) | 0x80, value >> 14))
+	output = bytearray()
+	while value >= 0x80:
+		output.append((value & 0x7F) | 0x80)
+		value >>= 7
+	output.append(value)
+	return bytes(output)
+
+
+def _decode_varint(encoded: bytes) -> int:
+	length = len(encoded)
+	if length == 1:
+		return encoded[0]
+	if length == 2:
+		return (encoded[0] & 0x7F) | (encoded[1] << 7)
+	if length == 3:
+		return (encoded[0] & 0x7F) | ((encoded[1] & 0x7F) << 7) | (encoded[2] << 14)
+	value = 0
+	for i, byte in enumerate(encoded):
+		value |= (byte & 0x7F) << (7 * i)
+	return value
+
+
+class _EncodedVarints(dict):
+	# Memoised encoding of small varints, so that a whole block can be encoded using map()
+	def __missing__(self, value: int) -> bytes:
+		encoded = _encode_varint(value)
+		if value < _MAX_CACHED_VARINT:
+			self[value] = encoded
+		return encoded
+
+
+class _DecodedVarints(dict):
+	# Memoised decoding of small varints, so that a whole block can be decoded using map()
+	def __missing__(self, encoded: bytes) -> int:
+		value = _decode_varint(encoded)
+		if len(encoded) <= 2:
+			self[encoded] = value
+		return value
+
+
+_encoded_varints = _EncodedVarints()
+_decoded_varints = _DecodedVarints()
+
+
+class _StringIds(dict):
+	# Assigns the next id to each string that has not been seen before, and remembers it as new for the current block
+	def __init__(self):
+		super().__init__()
+		self.new_strings: list[str] = []
+
+	def __missing__(self, string: str) -> int:
+		string_id = len(self)
+		self[string] = string_id
+		self.new_strings.append(string)
+		return string_id
+
+
+class _Writer:
+	__slots__ = ('ids', 'values', 'count', 'previous_parts', 'previous_drive', 'previous_parent_level', 'previous_metadata')
+
+	def __init__(self):
+		self.ids: _StringIds = _StringIds()
+		self.values: list[int] = []
+		self.count: int = 0
+		self.previous_parts: tuple[str, ...] = ()
+		self.previous_drive: str = ""
+		self.previous_parent_level: int = 0
+		self.previous_metadata: tuple[Optional[Platform], Optional[str]] = (None, None)
+
+	def write_path(self, path: GPath) -> None:
+		values = self.values
+		parts = tuple(path._parts)
+		metadata = (path._platform, path._encoding)
+
+		flags = _FLAG_ROOT if path._root else 0
+		if path._drive != self.previous_drive:
+			flags |= _FLAG_DRIVE
+		if path._parent_level != self.previous_parent_level:
+			flags |= _FLAG_PARENT_LEVEL
+		if metadata != self.previous_metadata:
+			flags |= _FLAG_METADATA
+		values.append(flags)
+
+		if flags & _FLAG_DRIVE:
+			values.append(self.ids[path._drive])
+			self.previous_drive = path._drive
+		if flags & _FLAG_PARENT_LEVEL:
+			values.append(path._parent_level)
+			self.previous_parent_level = path._parent_level
+		if flags & _FLAG_METADATA:
+			values.append(0 if path._platform is None else int(path._platform) + 1)
+			values.append(0 if path._encoding is None else self.ids[path._encoding] + 1)
+			self.previous_metadata = metadata
+
+		shared = _common_prefix_length(parts, self.previous_parts)
+		values.append(shared)
+		values.append(len(parts) - shared)
+		values.extend(map(self.ids.__getitem__, parts[shared:]))
+		self.previous_parts = parts
+		self.count += 1
+
+	def flush(self) -> bytes:
+		# Return the current block, and start a new one
+		new_strings = self.ids.new_strings
+		strings_section = "".join(new_strings).encode('utf_8', 'surrogatepass')
+		header = [len(new_strings)]
+		header.extend(map(len, new_strings))
+		values_section = b"".join(map(_encoded_varints.__getitem__, header)) + b"".join(map(_encoded_varints.__getitem__, self.values))
+
+		self.ids.new_strings = []
+		self.values = []
+		self.count = 0
+		return _encoded_varints[len(strings_section)] + _encoded_varints[len(values_section)] + strings_section + values_section
+
+
+def _write_blocks(paths: Iterable[GPath], sort: bool) -> Iterable[bytes]:
+	yield MAGIC + bytes([VERSION])
+	writer = _Writer()
+	for path in _sorted(paths) if sort else paths:
+		if not isinstance(path, GPath):
+			raise TypeError(f"can only serialise GPath, not {type(path).__name__}")
+		writer.write_path(path)
+		if writer.count >= BLOCK_SIZE:
+			yield writer.flush()
+	if writer.count > 0:
+		yield writer.flush()
+
+
+def dumps(paths: Iterable[GPath], sort: bool=False) -> bytes:
+	"""
+		Serialise GPaths into bytes.
+
+		Parameters
+		----------
+		`paths`
+		: the GPaths to be serialised
+
+		`sort`
+		: whether to sort the paths so that consecutive paths share longer prefixes, which makes the output smaller; the paths will then be loaded in the sorted order instead of their original order
+
+		Returns
+		-------
+		`bytes`
+		: the serialised paths, which can be loaded using `loads()`
+
+		Raises
+		------
+		`TypeError` if any item in `paths` is not a GPath
+	"""
+	return b"".join(_write_blocks(paths, sort))
+
+
+def dump(paths: Iterable[GPath], file: BinaryIO, sort: bool=False) -> None:
+	"""
+		Serialise GPaths into a binary file.
+
+		Unless `sort` is True, `paths` is consumed lazily and the output is written one block at a time, so the memory used does not depend on the number of paths (apart from the dictionary of distinct components).
+
+		Parameters
+		----------
+		`paths`
+		: the GPaths to be serialised
+
+		`file`
+		: a binary file opened for writing
+
+		`sort`
+		: whether to sort the paths so that consecutive paths share longer prefixes (see `dumps()`)
+
+		Raises
+		------
+		`TypeError` if any item in `paths` is not a GPath
+	"""
+	for block in _write_blocks(paths, sort):
+		file.write(block)
+
+
+def _sorted(paths: Iterable[GPath]) -> list[GPath]:
+	# Joining the components with a null character, which cannot appear in file names, gives the same order as comparing them as tuples, but is much faster
+	return sorted(paths, key=lambda path: (path._drive, path._root, path._parent_level, "\0".join(path._parts)))
+
+
+def loads(data: Union[bytes, bytearray, memoryview], compact: bool=False) -> list[GPath]:
+	"""
+		Deserialise GPaths from bytes that were created by `dumps()` or `dump()`.
+
+		Parameters
+		----------
+		`data`
+		: the serialised paths
+
+		`​compact`
+		: whether to store the path components of the new GPaths in the compact representation (see `GPath.__init__()`)
+
+		Returns
+		-------
+		`list[GPath]`
+		: the deserialised paths, in the order that they were serialised
+
+		Raises
+		------
+		`ValueError` if `data` is not valid serialised data, or was serialised using an unsupported version of the format
+	"""
+	data = bytes(data)
+	if data[:len(MAGIC)] != MAGIC:
+		raise ValueError("data is not serialised GPaths")
+	if len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+		raise ValueError(f"unsupported version of serialised GPaths: {data[len(MAGIC)] if len(data) > len(MAGIC) else None}")
+
+	reader = _Reader(compact)
+	try:
+		pos = len(MAGIC) + 1
+		while pos < len(data):
+			pos = reader.read_block(data, pos)
+	except IndexError:
+		raise ValueError("serialised GPaths are truncated or invalid") from None
+	return reader.paths
+
+
+def load(file: BinaryIO, compact: bool=False) -> list[GPath]:
+	"""
+		Deserialise GPaths from a binary file that was written by `dump()`.
+
+		Parameters
+		----------
+		`file`
+		: a binary file opened for reading
+
+		`​compact`
+		: whether to store the path components of the new GPaths in the compact representation (see `GPath.__init__()`)
+
+		Returns
+		-------
+		`list[GPath]`
+		: the deserialised paths, in the order that they were serialised
+
+		Raises
+		------
+		`ValueError` if the file does not contain valid serialised data, or was serialised using an unsupported version of the format
+	"""
+	return loads(file.read(), compact=compact)
+
+
+class _Reader:
+	__slots__ = ('compact', 'strings', 'paths', 'parts', 'drive', 'parent_level', 'platform', 'encoding')
+
+	_platforms: list[Optional[Platform]] = [None, *Platform]
+
+	def __init__(self, compact: bool):
+		self.compact: bool = compact
+		self.strings: list[str] = []
+		self.paths: list[GPath] = []
+		self.parts: tuple[str, ...] = ()
+		self.drive: str = ""
+		self.parent_level: int = 0
+		self.platform: Optional[Platform] = None
+		self.encoding: Optional[str] = None
+
+	def read_block(self, data: bytes, pos: int) -> int:
+		# Read the block starting at `pos`, and return the position after it
+		match = _VARINT_PATTERN.match(data, pos)
+		if match is None:
+			raise IndexError
+		strings_size = _decoded_varints[match.group()]
+		match = _VARINT_PATTERN.match(data, match.end())
+		if match is None:
+			raise IndexError
+		values_size = _decoded_varints[match.group()]
+		strings_start = match.end()
+		values_start = strings_start + strings_size
+		values_end = values_start + values_size
+		if values_end > len(data) or values_size == 0 or data[values_end - 1] >= 0x80:
+			raise IndexError  # Every byte of the values section must belong to a complete varint
+
+		values = list(map(_decoded_varints.__getitem__, _VARINT_PATTERN.findall(data, values_start, values_end)))
+
+		strings = self.strings
+		new_count = values[0]
+		text = data[strings_start:values_start].decode('utf_8', 'surrogatepass')
+		offsets = [0, *accumulate(values[1:1 + new_count])]
+		if len(offsets) != new_count + 1 or offsets[-1] != len(text):
+			raise ValueError("serialised GPaths have an invalid strings section")
+		strings.extend([text[start:end] for start, end in zip(offsets, offsets[1:])])
+
+		# Everything for each path apart from creating the GPath is inlined in this loop, since function calls would dominate the running time
+		platforms = self._platforms
+		from_fields = GPath._from_fields
+		paths = self.paths
+		compact = self.compact
+		parts = self.parts
+		drive = self.drive
+		parent_level = self.parent_level
+		platform = self.platform
+		encoding = self.encoding
+
+		i = 1 + new_count
+		end = len(values)
+		while i < end:
+			flags = values[i]
+			i += 1
+			if flags & _FLAG_DRIVE:
+				drive = strings[values[i]]
+				i += 1
+			if flags & _FLAG_PARENT_LEVEL:
+				parent_level = values[i]
+				i += 1
+			if flags & _FLAG_METADATA:
+				platform = platforms[values[i]]
+				encoding = None if values[i + 1] == 0 else strings[values[i + 1] - 1]
+				i += 2
+
+			shared = values[i]
+			count = values[i + 1]
+			i += 2
+			if shared > len(parts) or i + count > end:
+				raise ValueError("serialised GPaths have an invalid path record")
+			new_parts = tuple(map(strings.__getitem__, values[i:i + count]))
+			i += count
+			parts = parts[:shared] + new_parts if shared > 0 else new_parts
+
+			paths.append(from_fields(make_node(parts) if compact else parts, bool(flags & _FLAG_ROOT), drive, parent_level, platform, encoding))
+
+		self.parts = parts
+		self.drive = drive
+		self.parent_level = parent_level
+		self.platform = platform
+		self.encoding = encoding
+		return values_end
@@ -0,0 +1,202 @@
+"""
+	Streaming input and output of newline-delimited files of paths, with memory usage that is bounded regardless of the size of the file.
+
+	Paths are read lazily from text files, binary files or memory-mapped files, and are yielded as GPaths one at a time. Paths are written in a chosen platform rendering using `gpath.render.render_many()`.
+
+	In every reader, each line is one path, the line break at the end of each line is removed (including a carriage return before it in binary files), and empty lines are skipped. Other whitespace is kept, since it is valid in file names.
+
+	Examples
+	--------
+	```python
+	from gpath import GPath, stream
+
+	with open("paths.txt") as file:
+		for path in stream.read_paths(file):
+			print(path.named_parts)
+
+	with open("paths.txt", 'w') as file:
+		stream.write_paths([GPath("/usr/bin"), GPath("C:/Windows")], file, platform='posix')
+
+	for path in stream.read_paths_mmap("paths.txt", encoding='utf_8'):
+		pass
+	```
+"""
+
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, Optional, TextIO, Union
+
+from . import render
+from ._gpath import DEFAULT_ENCODING, GPath
+from .platform import Platform
+
+
+__all__ = ('read_paths', 'read_paths_mmap', 'write_paths')
+
+
+CHUNK_SIZE = 4096
+"""Number of paths that are parsed or rendered together in a single batch"""
+
+MMAP_BLOCK_SIZE = 1024 * 1024
+"""Approximate number of bytes of a memory-mapped file that are decoded together in a single batch"""
+
+
+def _strip_line(line: Union[str, bytes]) -> Union[str, bytes]:
+	# Text files opened with universal newlines only end lines with "\n", while binary files may also have "\r\n"
+	if isinstance(line, str):
+		return line[:-1] if line.endswith("\n") else line
+	if line.endswith(b"\n"):
+		line = line[:-1]
+	if line.endswith(b"\r"):
+		line = line[:-1]
+	return line
+
+
+def read_paths(
+	file: Union[TextIO, BinaryIO, Iterable[Union[str, bytes]]],
+	platform: Optional[Union[str, Platform]]=None,
+	encoding: Optional[str]=None,
+	compact: bool=False,
+) -> Iterator[GPath]:
+	"""
+		Lazily read paths from a file with one path on each line, skipping empty lines.
+
+		Lines are parsed in batches of `CHUNK_SIZE` using `GPath.from_many()`, so that only one batch is held in memory at a time.
+
+		Parameters
+		----------
+		`file`
+		: a text or binary file opened for reading, or any other iterable of lines as str or bytes
+
+		`​platform`
+		: interpret the paths as originating from a specific platform (see `GPath.__init__()`)
+
+		`​encoding`
+		: the text encoding that should be used to decode lines read from a binary file (see `GPath.__init__()`). Binary files are split into lines at the byte `b"\\n"`, so files in encodings such as UTF-16 should be opened in text mode instead.
+
+		`​compact`
+		: whether to store the path components of the new GPaths in the compact representation (see `GPath.__init__()`)
+
+		Returns
+		-------
+		`Iterator[GPath]`
+		: a new GPath for each non-empty line in `file`, in order
+
+		Examples
+		--------
+		```python
+		with open("paths.txt", 'rb') as file:
+			for path in stream.read_paths(file, encoding='latin_1'):
+				print(path)
+		```
+	"""
+	lines = (line for line in map(_strip_line, file) if len(line) > 0)
+	while True:
+		chunk = list(itertools.islice(lines, CHUNK_SIZE))
+		if len(chunk) == 0:
+			return
+		yield from GPath.from_many(chunk, platform=platform, encoding=encoding, compact=compact)
+
+
+def read_paths_mmap(
+	file: Union[str, bytes, os.PathLike, BinaryIO],
+	platform: Optional[Union[str, Platform]]=None,
+	encoding: Optional[str]=None,
+	compact: bool=False,
+) -> Iterator[GPath]:
+	"""
+		Lazily read paths from a memory-mapped file with one path on each line, skipping empty lines.
+
+		The file is decoded in blocks of about `MMAP_BLOCK_SIZE` bytes, directly from zero-copy slices of the memory map, so the file is never read into memory as a whole and no intermediate bytes objects are created. Since blocks are split at the byte `b"\\n"`, `encoding` must be one in which this byte always represents a line break, such as UTF-8, Latin-1 or Shift JIS, but not UTF-16.
+
+		The file is unmapped when the iterator is exhausted or closed.
+
+		Parameters
+		----------
+		`file`
+		: the name of the file, or a binary file opened for reading that has a file descriptor
+
+		`​platform`
+		: interpret the paths as originating from a specific platform (see `GPath.__init__()`)
+
+		`​encoding`
+		: the text encoding of the file (see `GPath.__init__()`)
+
+		`​compact`
+		: whether to store the path components of the new GPaths in the compact representation (see `GPath.__init__()`)
+
+		Returns
+		-------
+		`Iterator[GPath]`
+		: a new GPath for each non-empty line in `file`, in order
+
+		Raises
+		------
+		`OSError` if `file` cannot be opened or mapped into memory
+	"""
+	decode_encoding = DEFAULT_ENCODING if encoding is None else encoding
+
+	if isinstance(file, (str, bytes, os.PathLike)):
+		with open(file, 'rb') as opened_file:
+			yield from _read_mapped(opened_file.fileno(), platform, encoding, decode_encoding, compact)
+	else:
+		yield from _read_mapped(file.fileno(), platform, encoding, decode_encoding, compact)
+
+
+def _read_mapped(fileno: int, platform: Optional[Union[str, Platform]], encoding: Optional[str], decode_encoding: str, compact: bool) -> Iterator[GPath]:
+	if os.fstat(fileno).st_size == 0:
+		return  # Empty files cannot be mapped
+
+	with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+		size = len(mapped)
+		start = 0
+		while start < size:
+			# Each block ends at a line break, so that it can be decoded on its own
+			end = mapped.rfind(b"\n", start, start + MMAP_BLOCK_SIZE)
+			if end == -1:
+				end = mapped.find(b"\n", start + MMAP_BLOCK_SIZE)
+			end = size if end == -1 else end + 1
+
+			with memoryview(mapped)[start:end] as block:
+				text = str(block, decode_encoding)
+			# The view must be released before yielding, since the map cannot be closed while there are any views of it
+			lines = [line for line in text.replace("\r\n", "\n").split("\n") if line != ""]
+			del text
+			start = end
+
+			for i in range(0, len(lines), CHUNK_SIZE):
+				yield from GPath.from_many(lines[i:i + CHUNK_SIZE], platform=platform, encoding=encoding, compact=compact)
+
+
+def write_paths(
+	paths: Iterable[GPath],
+	file: TextIO,
+	platform: Optional[Union[str, Platform]]=None,
+	end: str="\n",
+) -> None:
+	"""
+		Write paths to a text file with one path on each line, rendered for a specific target platform.
+
+		Paths are rendered and written in batches using `gpath.render.render_many()`, so `paths` can be a lazy iterable of any length, such as the iterator returned by `read_paths()`.
+
+		Parameters
+		----------
+		`paths`
+		: the paths to be written
+
+		`file`
+		: a text file opened for writing
+
+		`platform`
+		: the target platform where the paths are to be used; if not specified, the generic rendering of `str(path)` is used
+
+		`end`
+		: string written after each path
+	"""
+	if platform is None:
+		platform = Platform.GENERIC
+	render.render_many(paths, platform, file=file, end=end)
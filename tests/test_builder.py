@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from gpath import GPath, GPathBuilder, interning
+
+
+@pytest.mark.parametrize('start', ["", "/", "..", "C:/", "C:a", "/usr/local", "../a/b"])
+def test_builder_operations(start: str):
+	"""
+		Test that random sequences of `push()`, `pop()` and `extend()` give the same paths as the equivalent GPath operators.
+	"""
+	rng = random.Random(start)
+	builder = GPathBuilder(start)
+	expected = GPath(start)
+	assert builder.freeze() == expected
+	for _ in range(200):
+		choice = rng.random()
+		if choice < 0.5:
+			name = rng.choice(["a", "b", "c", ".", "..", ""])
+			builder.push(name)
+			expected = expected / name
+		elif choice < 0.8:
+			n = rng.randint(0, 3)
+			builder.pop(n)
+			expected = expected - n
+		else:
+			other = rng.choice(["d/e", "../f", "../../..", "/g", "D:h", "C:/i", GPath("j/../k")])
+			builder.extend(other)
+			expected = expected + other
+		assert builder.freeze() == expected
+		assert len(builder) == len(expected)
+	assert builder.freeze().compact == True
+
+
+def test_builder_sharing():
+	"""
+		Test that GPaths frozen from the same builder are independent of later changes, and share their common prefixes.
+	"""
+	builder = GPathBuilder("/srv/data")
+	builder.push("a")
+	snapshot1 = builder.freeze()
+	builder.pop()
+	builder.push("b")
+	snapshot2 = builder.freeze()
+	assert snapshot1 == GPath("/srv/data/a")
+	assert snapshot2 == GPath("/srv/data/b")
+	assert snapshot1._parts.parent is snapshot2._parts.parent
+	assert repr(builder) == "GPathBuilder(GPath('/srv/data/b'))"
+
+	builder.push("c")
+	assert repr(builder) == "GPathBuilder(GPath('/srv/data/b/c'))"
+	assert builder._pending == ["c"]  # Not flushed by repr()
+
+
+def test_builder_platform():
+	"""
+		Test that the builder propagates the platform and encoding to frozen GPaths, and rejects components containing separators.
+	"""
+	builder = GPathBuilder(b"C:\\Windows", platform='windows', encoding='latin_1')
+	builder.push("System32")
+	assert builder.freeze() == GPath("C:\\Windows\\System32", platform='windows', encoding='latin_1')
+	with pytest.raises(ValueError):
+		builder.push("a\\b")
+	with pytest.raises(ValueError):
+		builder.push("a/b")
+	with pytest.raises(ValueError):
+		builder.pop(-1)
+
+	builder = GPathBuilder("/usr", platform='posix')
+	with pytest.raises(ValueError):
+		builder.push("a/b")
+	builder.push("a\\b")
+	assert builder.freeze().named_parts == ["usr", "a\\b"]
+
+
+def test_builder_interning():
+	"""
+		Test that components added by `push()` are interned when interning is enabled.
+	"""
+	pool = interning.enable()
+	try:
+		canonical = GPath("/test_builder_interning")[-1]
+		builder = GPathBuilder("/srv")
+		builder.push("".join(["test_builder_", "interning"]))
+		assert builder.freeze()[-1] is canonical
+		assert pool.hits == 1
+	finally:
+		interning.disable()
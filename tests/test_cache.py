@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pathlib
+import threading
+
+import pytest
+
+from gpath import GPath, cache
+from gpath.platform import Platform
+
+
+def test_parse_cache():
+	"""
+		Test that `ParseCache.get()` gives the same GPaths as the constructor, and counts hits and misses.
+	"""
+	parse_cache = cache.ParseCache(max_size=8)
+	first = parse_cache.get("/usr/./bin")
+	assert first == GPath("/usr/bin")
+	assert parse_cache.get("/usr/./bin") is first
+	assert (parse_cache.hits, parse_cache.misses) == (1, 1)
+
+	assert parse_cache.get("/usr/bin", platform='linux')._platform == Platform.POSIX
+	assert parse_cache.get("/usr/bin", platform=Platform.POSIX) is parse_cache.get("/usr/bin", platform=Platform.POSIX)
+	assert parse_cache.get("/usr/bin", platform='posix') == parse_cache.get("/usr/bin", platform=Platform.POSIX)
+	assert parse_cache.get("/usr/bin", platform='posix') != first
+	assert parse_cache.get(b"/usr/bin") == GPath(b"/usr/bin")
+	assert parse_cache.get(b"/\xe9", encoding='latin_1') == GPath("/é", encoding='latin_1')
+	assert parse_cache.get(pathlib.PurePosixPath("/usr/bin")) == GPath("/usr/bin")
+	assert parse_cache.get(None) == GPath("")
+	assert parse_cache.get(first) == first
+	assert parse_cache.get(first) is not first
+
+	assert parse_cache.stats() == {'size': 8, 'max_size': 8, 'hits': 4, 'misses': 8}
+	assert repr(parse_cache) == "ParseCache(max_size=8)"
+	parse_cache.clear()
+	assert len(parse_cache) == 0
+	assert (parse_cache.hits, parse_cache.misses) == (0, 0)
+
+	with pytest.raises(ValueError):
+		cache.ParseCache(max_size=0)
+
+
+def test_render_cache():
+	"""
+		Test that `RenderCache.get()` gives the same strings as rendering the GPaths, and shares entries between equal GPaths.
+	"""
+	render_cache = cache.RenderCache(max_size=8)
+	for path in ["", "/", "..", "C:/Windows", "../a/b", "/usr/bin"]:
+		for platform in [None, 'generic', 'posix', 'windows', 'linux']:
+			expected = str(GPath(path)) if platform is None else str(GPath(path).render(platform))
+			assert render_cache.get(GPath(path), platform) == expected
+			assert render_cache.get(path, platform) == expected
+			assert render_cache.get(GPath(path, compact=True), platform) == expected
+	assert render_cache.get(GPath("/usr/bin", platform='windows', encoding='latin_1'), 'posix') == "/usr/bin"
+	assert render_cache.hits > 0
+	assert len(render_cache) == 8
+	assert repr(render_cache) == "RenderCache(max_size=8)"
+
+
+def test_eviction():
+	"""
+		Test that the least recently used entry is evicted when the cache is full.
+	"""
+	parse_cache = cache.ParseCache(max_size=2)
+	a = parse_cache.get("a")
+	parse_cache.get("b")
+	assert parse_cache.get("a") is a  # "a" is now the most recently used
+	parse_cache.get("c")              # Evicts "b"
+	assert len(parse_cache) == 2
+	assert parse_cache.get("a") is a
+	misses = parse_cache.misses
+	parse_cache.get("b")
+	assert parse_cache.misses == misses + 1
+
+
+@pytest.mark.parametrize('max_size', [4, 1000])
+def test_threads(max_size: int):
+	"""
+		Test that the caches give correct results and consistent statistics when shared between many threads.
+	"""
+	parse_cache = cache.ParseCache(max_size=max_size)
+	render_cache = cache.RenderCache(max_size=max_size)
+	paths = [f"/data/{i % 7}/../shard-{i}" for i in range(50)]
+	expected_parsed = {path: GPath(path) for path in paths}
+	expected_rendered = {path: str(GPath(path).render('windows')) for path in paths}
+	errors = []
+	calls = 2000
+
+	def work(seed: int) -> None:
+		try:
+			for i in range(calls):
+				path = paths[(seed * 31 + i * 7) % len(paths)]
+				gpath = parse_cache.get(path)
+				if gpath != expected_parsed[path] or render_cache.get(gpath, 'windows') != expected_rendered[path]:
+					errors.append(path)
+		except Exception as e:
+			errors.append(e)
+
+	threads = [threading.Thread(target=work, args=(seed,)) for seed in range(32)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	assert errors == []
+	for c in (parse_cache, render_cache):
+		assert c.hits + c.misses == 32 * calls
+		assert len(c) <= max_size
+
+
+def test_thread_churn():
+	"""
+		Test that the statistics of threads that have exited are kept, without keeping separate statistics for each of them.
+	"""
+	parse_cache = cache.ParseCache()
+	for _ in range(50):
+		thread = threading.Thread(target=parse_cache.get, args=("/usr/bin",))
+		thread.start()
+		thread.join()
+	assert parse_cache.stats() == {'size': 1, 'max_size': parse_cache.max_size, 'hits': 49, 'misses': 1}
+	assert len(parse_cache._counters._threads) <= 1
+	parse_cache.clear()
+	assert parse_cache.hits == 0 and parse_cache.misses == 0
+
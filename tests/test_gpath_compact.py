@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import pickle
+import sys
+import threading
+
+import pytest
+
+from gpath import GPath, GPathIndex
+from gpath._nodes import PathNode, make_node
+from util import TestGPath
+
+
+class TestGPathCompact(TestGPath):
+	@staticmethod
+	@pytest.mark.parametrize('path', ["", "/", "..", "C:", "/usr/local/bin", "../../a/b/c", "C:/Windows/System32", "C:a/b"])
+	def test_compact(path: str):
+		"""
+			Test that the compact representation behaves identically to the default representation, including after copying and pickling.
+		"""
+		gpath = GPath(path)
+		compact_gpath = GPath(path, compact=True)
+		assert compact_gpath.compact == True
+		assert gpath.compact == False
+
+		assert compact_gpath == gpath
+		assert gpath == compact_gpath
+		assert hash(compact_gpath) == hash(gpath)
+		assert str(compact_gpath) == str(gpath)
+		assert len(compact_gpath) == len(gpath)
+		assert list(compact_gpath) == list(gpath)
+		assert compact_gpath.named_parts == gpath.named_parts
+		assert compact_gpath.relative_parts == gpath.relative_parts
+		for i in range(-len(gpath), len(gpath)):
+			assert compact_gpath[i] == gpath[i]
+		assert compact_gpath[1:] == gpath[1:]
+		assert compact_gpath[::2] == gpath[::2]
+
+		assert GPath(compact_gpath).compact == True
+		assert GPath(compact_gpath, compact=False).compact == False
+		assert GPath(gpath, compact=True).compact == True
+		assert GPath.from_many([path], compact=True)[0].compact == True
+		assert [g.compact for g in GPath.from_many([compact_gpath, gpath, path])] == [True, False, False]  # Same as the constructor
+		assert GPath.from_many([compact_gpath], compact=False)[0].compact == False
+
+		unpickled = pickle.loads(pickle.dumps(compact_gpath))
+		assert unpickled.compact == True
+		assert unpickled == gpath
+
+
+	@staticmethod
+	@pytest.mark.parametrize(
+		('path1', 'path2'),
+		[
+			("/usr/local", "bin"),
+			("/usr/local", "../bin"),
+			("/usr/local", "../../../bin"),
+			("/usr/local", "/opt"),
+			("/srv/a/b/c", "/srv/x/b/c"),
+			("../a", "../../b"),
+			("C:/Windows", "D:System32"),
+			("", ""),
+		]
+	)
+	def test_compact_operations(path1: str, path2: str):
+		"""
+			Test that operations on a compact GPath give the same results as on a default GPath, and propagate the compact representation.
+		"""
+		gpath1 = GPath(path1)
+		compact_gpath1 = GPath(path1, compact=True)
+		for result, expected in [
+			(compact_gpath1 + path2, gpath1 + path2),
+			(compact_gpath1 / GPath(path2), gpath1 / GPath(path2)),
+			(GPath.join(compact_gpath1, path2, path2), GPath.join(gpath1, path2, path2)),
+			(compact_gpath1 - 1, gpath1 - 1),
+			(compact_gpath1 * 2, gpath1 * 2),
+			(compact_gpath1.common_with(path2, allow_parents=True), gpath1.common_with(path2, allow_parents=True)),
+			(compact_gpath1.relpath_from(path2), gpath1.relpath_from(path2)),
+		]:
+			assert result == expected
+			if result is not None:
+				assert result.compact == True
+
+
+	@staticmethod
+	def test_compact_sharing():
+		"""
+			Test that compact GPaths share the representation of their common prefixes.
+		"""
+		parent = GPath("/srv/data/2024", compact=True)
+		child1 = parent / "a"
+		child2 = GPath("/srv/data/2024/b", compact=True)
+		assert child1._parts.parent is parent._parts
+		assert child2._parts.parent is parent._parts
+		assert (child1 - 1)._parts is parent._parts
+		assert (child1 - 1) == parent
+		assert child1 != child2
+
+
+	@staticmethod
+	def test_compact_duplicate_nodes():
+		"""
+			Test that operations on compact GPaths still compare components by name when the same prefix is represented by distinct nodes.
+		"""
+		parts1 = make_node(("t0", "x", "y", "z0"))
+		parts2 = PathNode(PathNode(make_node(("t0",)), "x"), "y").child("z1")  # Bypasses hash-consing of "/t0/x" and "/t0/x/y"
+		assert parts2.parent is not parts1.parent
+		path1 = GPath._from_fields(parts1, True, "", 0, None, None)
+		path2 = GPath._from_fields(parts2, True, "", 0, None, None)
+
+		assert path1.common_with(path2) == GPath("/t0/x/y")
+		assert path1.relpath_from(path2) == GPath("../z0")
+		assert GPath.partition(path1, path2, allow_parents=False) == {GPath("/t0/x/y"): [GPath("z0"), GPath("z1")]}
+		assert GPathIndex(["/t0/x", "/t0/x/y"]).lowest_common_ancestor(path1, path2) == GPath("/t0/x/y")
+
+
+	@staticmethod
+	def test_compact_sharing_threads():
+		"""
+			Test that threads creating the same compact GPaths at the same time still share a single node for each path.
+		"""
+		switch_interval = sys.getswitchinterval()
+		sys.setswitchinterval(1e-6)
+		try:
+			for trial in range(50):
+				names = [f"test_compact_sharing_threads-{trial}", "x", "y", "z"]
+				barrier = threading.Barrier(4)
+				results = []
+
+				def work() -> None:
+					barrier.wait()
+					results.append(GPath.from_many(["/".join(names[:i]) for i in range(1, 5)], compact=True))
+
+				threads = [threading.Thread(target=work) for _ in range(4)]
+				for thread in threads:
+					thread.start()
+				for thread in threads:
+					thread.join()
+
+				for gpaths in results[1:]:
+					for gpath, first in zip(gpaths, results[0]):
+						assert gpath._parts is first._parts
+		finally:
+			sys.setswitchinterval(switch_interval)
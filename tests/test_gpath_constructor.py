@@ -160,3 +160,29 @@ class TestGPathConstructor(TestGPath):
 		assert gpath_copy.drive == expected_drive
 		assert gpath_copy.named_parts == list(expected_parts)
 		assert gpath_copy.parent_level == expected_parent_level
+
+
+	@staticmethod
+	@pytest.mark.parametrize(
+		('path', 'expected_parts', 'expected_root'),
+		[
+			("usr//bin", ("usr", "bin"), False),
+			("usr\\\\bin", ("usr", "bin"), False),
+			("usr/\\/bin", ("usr", "bin"), False),
+			("usr/bin//", ("usr", "bin"), False),
+			("//usr///bin", ("usr", "bin"), True),
+			("\\\\usr\\bin\\", ("usr", "bin"), True),
+			("///", tuple(), True),
+			("a/" * 10000, ("a", ) * 10000, False),
+			("/a//b" * 5000, ("a", "b") * 5000, True),
+		]
+	)
+	def test_constructor_separators(path: str, expected_parts: tuple[str, ...], expected_root: bool):
+		"""
+			Test constructor `__init__()` with repeated and mixed separators, including on long paths.
+		"""
+		gpath = GPath(path)
+		assert gpath._parts == expected_parts
+		assert gpath._root == expected_root
+		assert gpath._drive == ""
+		assert gpath._parent_level == 0
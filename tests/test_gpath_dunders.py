@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import pickle
+import sys
+from pathlib import PurePosixPath
 from typing import Union
 
 import pytest
@@ -71,6 +74,53 @@ class TestGPathDunders(TestGPath):
 			assert hash(gpath1) != hash(gpath2)
 
 
+	@staticmethod
+	@pytest.mark.parametrize(
+		('path', 'platform', 'encoding', 'other'),
+		[
+			("/usr/bin", None, None, "/usr/bin"),
+			("/usr/bin", None, None, b"/usr/./bin"),
+			("/usr/bin", None, None, PurePosixPath("/usr/bin")),
+			("/usr/bin", None, 'utf_16_le', "/usr/bin".encode('utf_16_le')),
+			("", None, None, None),
+			("", None, None, ""),
+			("/usr/bin", 'posix', None, "/usr/bin"),
+			("C:/Windows", 'windows', None, "C:/Windows"),
+			("a\\b", None, None, "a/b"),
+			("/usr/bin", None, None, "/usr"),
+			("/usr/bin", None, None, b"usr/bin"),
+			("C:/", None, None, None),
+		]
+	)
+	def test_eq_gpathlike(path: str, platform: str, encoding: str, other):
+		"""
+			Test `__eq__()` with operands that are GPath-like but not GPath objects.
+		"""
+		gpath = GPath(path, platform=platform, encoding=encoding)
+		expected = gpath._tuple == GPath(other, encoding=encoding)._tuple
+		assert (gpath == other) == expected
+		assert (gpath != other) == (not expected)
+
+
+	@staticmethod
+	@pytest.mark.parametrize('path', ["", "/", "../a/b", "C:/Windows", "C:a"])
+	@pytest.mark.parametrize('platform', [None, 'posix', 'windows'])
+	def test_hash_pickle(path: str, platform: str):
+		"""
+			Test that `__hash__()` is stable across calls and copies, and that pickling does not carry over the cached hash.
+		"""
+		gpath = GPath(path, platform=platform)
+		expected_hash = hash(gpath._tuple)
+		assert hash(gpath) == expected_hash
+		assert hash(gpath) == expected_hash
+		assert hash(GPath(gpath)) == expected_hash
+
+		gpath_copy = pickle.loads(pickle.dumps(gpath))
+		assert gpath_copy._hash is None
+		assert gpath_copy == gpath
+		assert hash(gpath_copy) == expected_hash
+
+
 	@staticmethod
 	@pytest.mark.parametrize(
 		('gpath1', 'expected'),
@@ -154,6 +204,55 @@ class TestGPathDunders(TestGPath):
 		assert result_eval == gpath
 
 
+	@staticmethod
+	@pytest.mark.parametrize('path', ["", "/usr/bin", "../a/b", "C:/Windows"])
+	def test_str_render_cache(path: str):
+		"""
+			Test that `__str__()` and `render()` reuse their cached strings, that the caches do not refer back to the GPath, and that the caches are not carried over to new paths.
+		"""
+		gpath = GPath(path)
+		assert str(gpath) is str(gpath)
+		for platform in ['generic', 'posix', 'windows']:
+			rendered_path = gpath.render(platform)
+			assert str(gpath.render(platform)) is str(rendered_path)
+			assert str(rendered_path) is str(rendered_path)
+
+		# Only RenderedPaths refer to the GPath, so dropping them must leave no other references that would form a cycle
+		gpath = GPath(path)
+		reference_count = sys.getrefcount(gpath)
+		os.fspath(gpath)
+		str(gpath.render('windows'))
+		assert sys.getrefcount(gpath) == reference_count
+
+		assert str(gpath - 1) == str(GPath(path) - 1)
+		assert str(gpath + "x") == str(GPath(path) + "x")
+		assert str(gpath.as_absolute()) == str(GPath(path).as_absolute())
+
+
+	@staticmethod
+	@pytest.mark.parametrize(
+		('path', 'expected'),
+		[
+			("", {'posix': ".", 'nt': "."}),
+			("/usr/bin", {'posix': "/usr/bin", 'nt': "\\usr\\bin"}),
+			("../a/b", {'posix': "../a/b", 'nt': "..\\a\\b"}),
+			("C:/Windows", {'posix': "/Windows", 'nt': "C:\\Windows"}),
+		]
+	)
+	def test_fspath(path: str, expected: dict[str, str]):
+		"""
+			Test `__fspath__()` for outputs that depend on the local operating system, and that the result is cached.
+		"""
+		if os.name not in expected:
+			pytest.skip(f"no expected output for os.name {os.name}")
+		gpath = GPath(path)
+		assert isinstance(gpath, os.PathLike)
+		result = os.fspath(gpath)
+		assert result == expected[os.name]
+		assert os.fspath(gpath) is result
+		assert os.fspath(GPath(gpath)) == result
+
+
 	@staticmethod
 	@pytest.mark.parametrize(
 		('gpath1', 'expected'),
@@ -287,6 +386,9 @@ class TestGPathDunders(TestGPath):
 			("../a", "../a/b", True),
 			("C:/a", "C:/a/b", True),
 			("C:a", "C:a/b", True),
+			("/a/b", "/a/c/b", False),
+			("/a/c", "/a/b/c", False),
+			("../a/b", "../a/c", False),
 
 			("a", "a", True),
 			("/a", "/a", True),
@@ -302,6 +404,9 @@ class TestGPathDunders(TestGPath):
 		"""
 		result = gpath2 in gpath1
 		assert result == expected
+		assert (str(gpath2) in gpath1) == expected
+		assert (GPath(gpath2, compact=True) in GPath(gpath1, compact=True)) == expected
+		assert (GPath(gpath2, compact=True) in gpath1) == expected
 
 		if expected and gpath1 != gpath2:
 			result = gpath1 in gpath2
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import itertools
+import pickle
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gpath import GPath, _gpath
+from gpath.platform import Platform
+from util import TestGPath
+
+
+def _fail_parse(path: str):
+	raise AssertionError(f"path should not have been fully parsed: {repr(path)}")
+
+
+class TestGPathLazy(TestGPath):
+	@staticmethod
+	@pytest.mark.parametrize('platform', [None, 'generic', 'posix', 'windows'])
+	@pytest.mark.parametrize('path', ["", "/", "..", "C:", "/usr/local/bin", "usr//local/./bin/", "../../a/b/c", "a/../../b", "C:/Windows/System32", "C:\\Windows\\System32", "C:a/b", "C:."])
+	def test_lazy(path: str, platform: str):
+		"""
+			Test that a lazy GPath behaves identically to a GPath that is parsed immediately, whichever of its methods is called first.
+		"""
+		gpath = GPath(path, platform=platform)
+		for first in (str, hash, len, list, repr, pickle.dumps, lambda g: g.named_parts, lambda g: g == gpath, lambda g: g / "a"):
+			lazy_gpath = GPath(path, platform=platform, lazy=True)
+			first(lazy_gpath)
+			assert lazy_gpath == gpath
+			assert gpath == lazy_gpath
+			assert hash(lazy_gpath) == hash(gpath)
+			assert str(lazy_gpath) == str(gpath)
+			assert repr(lazy_gpath) == repr(gpath)
+			assert lazy_gpath._tuple == gpath._tuple
+			assert pickle.loads(pickle.dumps(lazy_gpath)) == gpath
+
+		assert GPath.from_many([path], platform=platform, lazy=True) == [gpath]
+		assert GPath(path, platform=platform, lazy=True, compact=True).compact == True
+
+
+	@staticmethod
+	def test_lazy_deferred():
+		"""
+			Test that a lazy GPath is only parsed when its components are needed.
+		"""
+		lazy_gpath = GPath("/usr/./local/bin", lazy=True)
+		other = GPath("/usr/./local/bin", lazy=True)
+		assert lazy_gpath._raw == "/usr/./local/bin"
+		with patch.dict(_gpath._parsers_of_platforms, {Platform.GENERIC: _fail_parse}):
+			assert lazy_gpath == other
+			assert lazy_gpath == "/usr/./local/bin"
+		assert lazy_gpath._raw is not None
+
+		assert lazy_gpath.named_parts == ["usr", "local", "bin"]
+		assert lazy_gpath._raw is None
+		assert other._raw is not None
+
+		with pytest.raises(AttributeError):
+			lazy_gpath._undefined
+
+
+	@staticmethod
+	def test_lazy_canonical():
+		"""
+			Test that a lazy GPath that is already in normalised form is parsed without normalisation.
+		"""
+		for path in ["/usr/local/bin", "../../Documents", "C:/Windows", "C:..", "a"]:
+			gpath = GPath(path, platform='windows')
+			with patch.dict(_gpath._parsers_of_platforms, {platform: _fail_parse for platform in Platform}):
+				assert str(GPath(path, lazy=True)) == path
+				assert GPath(path, lazy=True).named_parts == gpath.named_parts
+				assert hash(GPath(path, platform='windows', lazy=True)) == hash(gpath)
+
+
+	@staticmethod
+	def test_parse_canonical():
+		"""
+			Test that every path recognised as canonical is parsed the same way as by the full parser, and is its own generic rendering.
+		"""
+		for length in range(1, 6):
+			for chars in itertools.product(["a", ".", "/", "\\", ":", "C"], repeat=length):
+				path = "".join(chars)
+				for platform in Platform:
+					fields = _gpath._parse_canonical(path, platform)
+					if fields is not None:
+						assert fields == _gpath._parsers_of_platforms[platform](path)
+						assert str(GPath(path, platform=platform)) == path
+
+
+	@staticmethod
+	def test_lazy_type():
+		"""
+			Test that only lazy GPaths have the machinery for deferred parsing, and that operations on them return ordinary GPaths.
+		"""
+		assert '__getattr__' not in vars(GPath)
+		assert type(GPath("/usr/bin")) is GPath
+		assert type(GPath("/usr/bin", compact=True, lazy=True)) is GPath
+		assert type(GPath.from_many(["/usr/bin"])[0]) is GPath
+		assert type(GPath.from_many([""], lazy=True)[0]) is GPath
+
+		lazy_gpath = GPath("/usr/bin", lazy=True)
+		assert isinstance(lazy_gpath, GPath)
+		assert type(lazy_gpath) is not GPath
+		assert type(GPath.from_many(["/usr/bin"], lazy=True)[0]) is type(lazy_gpath)
+		assert type(lazy_gpath / "local") is GPath
+		assert type(GPath(lazy_gpath)) is GPath
+
+
+	@staticmethod
+	def test_lazy_threads():
+		"""
+			Test that lazy GPaths shared between threads are parsed correctly when several threads need their fields at the same time.
+		"""
+		paths = [f"/data/./{i % 13}/../shard-{i}" if i % 2 == 0 else f"/data/{i}/file" for i in range(2000)]
+		expected = [(hash(gpath), str(gpath)) for gpath in GPath.from_many(paths)]
+		switch_interval = sys.getswitchinterval()
+		sys.setswitchinterval(1e-6)
+		try:
+			for _ in range(5):
+				lazy_gpaths = GPath.from_many(paths, lazy=True)
+				errors = []
+
+				def work() -> None:
+					try:
+						for lazy_gpath, (expected_hash, expected_str) in zip(lazy_gpaths, expected):
+							if hash(lazy_gpath) != expected_hash or str(lazy_gpath) != expected_str or lazy_gpath != expected_str:
+								errors.append(lazy_gpath)
+					except Exception as e:
+						errors.append(e)
+
+				threads = [threading.Thread(target=work) for _ in range(4)]
+				for thread in threads:
+					thread.start()
+				for thread in threads:
+					thread.join()
+				assert errors == []
+		finally:
+			sys.setswitchinterval(switch_interval)
@@ -354,6 +354,8 @@ class TestGPathOperations(TestGPath):
 			("/a", "/b", "/", "/", "/", "/"),
 			("/a", "b", None, None, None, None),
 			("/a", "../b", None, None, None, None),
+			("/a/b/c", "/a/x/c", "/a", "/a", "/a", "/a"),
+			("/a/b/c", "/x/b/c", "/", "/", "/", "/"),
 
 			("", "", "", "", "", ""),
 			("", "..", None, "..", "..", None),
@@ -367,6 +369,8 @@ class TestGPathOperations(TestGPath):
 			("a", "C:", None, None, None, None),
 			("a", "b", "", "", "", None),
 			("a", "../b", None, "..", "..", None),
+			("a/b/c", "a/x/c", "a", "a", "a", "a"),
+			("a/b/c", "x/b/c", "", "", "", None),
 
 			("..", "..", "..", "..", "..", ".."),
 			("..", "../..", None, "../..", "../..", None),
@@ -380,6 +384,7 @@ class TestGPathOperations(TestGPath):
 			("../a", "C:", None, None, None, None),
 			("../a", "../b", "..", "..", "..", ".."),
 			("../a", "../../b", None, "../..", "../..", None),
+			("../a/b/c", "../a/x/c", "../a", "../a", "../a", "../a"),
 
 			("C:/", "C:/", "C:/", "C:/", "C:/", "C:/"),
 			("C:/", "C:", None, None, None, None),
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from gpath import GPath
@@ -62,6 +64,26 @@ class TestGPathStatic(TestGPath):
 					],
 				}
 			),
+			(["/a/x/c", "/a/y/c", "/a/x/d"], True, False, {
+				GPath("/a"): [
+					GPath("x/c"),
+					GPath("y/c"),
+					GPath("x/d"),
+				],
+			}),
+			(["usr/bin", "", "usr/lib", "home", ""], False, False, {
+				GPath("usr"): [
+					GPath("bin"),
+					GPath("lib"),
+				],
+				GPath(""): [
+					GPath(""),
+					GPath(""),
+				],
+				GPath("home"): [
+					GPath(""),
+				],
+			}),
 			([""], True, False, {GPath(""): [GPath("")]}),
 			([""], True, True, {GPath(""): []}),
 			([""], False, True, {GPath(""): []}),
@@ -129,6 +151,28 @@ class TestGPathStatic(TestGPath):
 		result = GPath.partition(*gpaths, allow_current=allow_current, allow_parents=allow_parents)
 		assert result == expected
 
+	@staticmethod
+	@pytest.mark.parametrize('processes', [2, 3])
+	@pytest.mark.parametrize(('allow_current', 'allow_parents'), [(True, False), (False, False), (True, True)])
+	def test_partition_processes(processes: int, allow_current: bool, allow_parents: bool):
+		"""
+			Test that `partition()` with multiple processes gives the same partitions as the serial implementation, in the same order.
+		"""
+		paths = [
+			"/usr/local/bin", "usr/bin", "C:/Windows", "../doc", "/usr/bin", "usr/lib", "home/user", "../doc/a",
+			"../../doc", "C:/Program Files", "/usr/local/lib", "", "usr/local", "/", "../doc/b", "C:/Windows/System32",
+		]
+		gpaths = [GPath(path, compact=(i % 2 == 0)) for i, path in enumerate(paths)]
+		for inputs in [paths, gpaths]:
+			expected = GPath.partition(inputs, allow_current=allow_current, allow_parents=allow_parents)
+			with patch('gpath._gpath._MIN_PARTITION_SHARD_SIZE', 1):
+				result = GPath.partition(inputs, allow_current=allow_current, allow_parents=allow_parents, processes=processes)
+			assert list(result.items()) == list(expected.items())
+
+		assert GPath.partition(paths, processes=4) == GPath.partition(paths)  # Too few paths for more than one process
+		with pytest.raises(ValueError):
+			GPath.partition(paths, processes=0)
+
 	@staticmethod
 	@pytest.mark.parametrize(
 		('paths', 'expected_gpath'),
@@ -197,3 +241,31 @@ class TestGPathStatic(TestGPath):
 		gpaths = [GPath(path) for path in paths]
 		result = GPath.join(gpaths)
 		assert result == expected_gpath
+
+
+	@staticmethod
+	@pytest.mark.parametrize(
+		'paths',
+		[
+			[],
+			["/usr/bin", "usr/bin", "../usr/bin", "", ".", None, "C:/Windows", "C:Windows", "C:../Windows"],
+			["a\\b", "\\a\\b", "a//b/", "//", "a/../../b", "::"],
+			[b"/usr/bin", b"C:/Windows", "/usr/bin"],
+			[GPath("/usr/bin"), GPath("../Documents", platform='posix', encoding='utf_16_le'), "C:/Windows"],
+		]
+	)
+	@pytest.mark.parametrize('platform', [None, 'generic', 'posix', 'windows'])
+	@pytest.mark.parametrize('encoding', [None, 'utf_8', 'cp037'])
+	def test_from_many(paths: list, platform: str, encoding: str):
+		"""
+			Test `from_many()`.
+		"""
+		paths = [path.decode('utf_8').encode(encoding) if isinstance(path, bytes) and encoding is not None else path for path in paths]
+		result = GPath.from_many(paths, platform=platform, encoding=encoding)
+		expected = [GPath(path, platform=platform, encoding=encoding) for path in paths]
+		assert result == expected
+		for result_gpath, expected_gpath in zip(result, expected):
+			assert result_gpath._tuple == expected_gpath._tuple
+
+		result = GPath.from_many(iter(paths), platform=platform, encoding=encoding)
+		assert result == expected
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from gpath import GPath, GPathIndex
+
+
+def _random_paths(rng: random.Random, count: int) -> list[GPath]:
+	paths = []
+	for _ in range(count):
+		drive = rng.choice(["", "", "C:"])
+		root = rng.choice(["", "/"])
+		parents = "../" * rng.choice([0, 0, 1, 2]) if root == "" else ""
+		parts = "/".join(rng.choice("abc") for _ in range(rng.randint(0, 4)))
+		paths.append(GPath(drive + root + parents + parts, platform='generic'))
+	return paths
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_queries_brute_force(seed: int):
+	"""
+		Test every query of `GPathIndex` against a linear scan using `GPath.__contains__()`, including after removals.
+	"""
+	rng = random.Random(seed)
+	paths = list(dict.fromkeys(_random_paths(rng, 60)))
+	queries = _random_paths(rng, 60)
+	index = GPathIndex(paths)
+	for path in rng.sample(paths, 20):
+		index.remove(path)
+		paths.remove(path)
+	assert len(index) == len(paths)
+	assert sorted(index, key=repr) == sorted(paths, key=repr)
+
+	for query in queries:
+		expected_containing = [path for path in paths if query in path]
+		assert sorted(index.containing(query), key=repr) == sorted(expected_containing, key=repr)
+		assert all(b in a for a, b in zip(index.containing(query), index.containing(query)[1:]))
+
+		longest = index.longest_prefix(query)
+		if len(expected_containing) == 0:
+			assert longest is None
+		else:
+			assert longest in expected_containing
+			assert all(longest in path for path in expected_containing)
+
+		expected_subtree = [path for path in paths if path in query]
+		assert sorted(index.subtree(query), key=repr) == sorted(expected_subtree, key=repr)
+
+		other = rng.choice(queries)
+		common = [path for path in paths if query in path and other in path]
+		ancestor = index.lowest_common_ancestor(query, other)
+		if len(common) == 0:
+			assert ancestor is None
+		else:
+			assert ancestor in common
+			assert all(ancestor in path for path in common)
+
+
+def test_add_remove():
+	"""
+		Test adding, removing and checking membership of paths in `GPathIndex`.
+	"""
+	index = GPathIndex(["a/b", "a/b", "a"])
+	assert len(index) == 2
+	assert GPath("a/b") in index
+	assert "a/b/c" not in index
+	assert "a" in index
+
+	index.add("a/b/c")
+	assert len(index) == 3
+	assert index.longest_prefix("a/b/c/d") == GPath("a/b/c")
+
+	index.remove("a/b")
+	assert "a/b" not in index
+	assert index.longest_prefix("a/b/c/d") == GPath("a/b/c")
+	assert index.longest_prefix("a/b/d") == GPath("a")
+	with pytest.raises(KeyError):
+		index.remove("a/b")
+	index.discard("a/b")
+	index.discard("a/b/c")
+	index.discard("a")
+	assert len(index) == 0
+	assert list(index) == []
+	assert index.longest_prefix("a") is None
+	assert repr(index) == "GPathIndex([])"
+
+
+def test_platforms():
+	"""
+		Test that paths that differ only in their platform or encoding are kept separately by `GPathIndex`, and that the one added first is returned by `longest_prefix()`.
+	"""
+	posix = GPath("/usr", platform='posix')
+	windows = GPath("/usr", platform='windows')
+	index = GPathIndex([posix, windows])
+	assert len(index) == 2
+	assert index.containing("/usr/bin") == [posix, windows]
+	assert index.longest_prefix("/usr/bin") is posix
+	index.remove(posix)
+	assert index.longest_prefix("/usr/bin") is windows
+
+
+def test_examples():
+	"""
+		Test the examples in the docstrings of `GPathIndex`.
+	"""
+	index = GPathIndex(["/usr", "/usr/local", "/home", "../shared"])
+	assert index.longest_prefix("/usr/local/bin") == GPath("/usr/local")
+	assert index.containing("/usr/local/bin") == [GPath("/usr"), GPath("/usr/local")]
+	assert list(index.subtree("/usr")) == [GPath("/usr"), GPath("/usr/local")]
+
+	index = GPathIndex(["/", "/usr", "/usr/local/bin", "../.."])
+	assert index.containing("/usr/local") == [GPath("/"), GPath("/usr")]
+	assert index.containing("../a") == [GPath("../..")]
+
+	index = GPathIndex(["/usr", "/usr/local", "../.."])
+	assert index.longest_prefix("/usr/local/bin") == GPath("/usr/local")
+	assert index.longest_prefix("/usr/bin") == GPath("/usr")
+	assert index.longest_prefix("/home") is None
+	assert index.longest_prefix("..") == GPath("../..")
+
+	index = GPathIndex(["/usr", "/usr/local/bin", "/home", "..", "a/b"])
+	assert list(index.subtree("/usr")) == [GPath("/usr"), GPath("/usr/local/bin")]
+	assert list(index.subtree("..")) == [GPath(".."), GPath("a/b")]
+
+	index = GPathIndex(["/", "/usr", "/usr/local"])
+	assert index.lowest_common_ancestor("/usr/local/bin", "/usr/bin") == GPath("/usr")
+	assert index.lowest_common_ancestor("/usr/local/bin", "/home") == GPath("/")
+	assert index.lowest_common_ancestor("/usr", "C:/Windows") is None
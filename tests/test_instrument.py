@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import io
+import threading
+from typing import Generator
+
+import pytest
+
+from gpath import GPath, _gpath, instrument, render
+
+
+@pytest.fixture
+def instrumented() -> Generator[None, None, None]:
+	instrument.reset()
+	instrument.enable()
+	yield
+	instrument.disable()
+	instrument.reset()
+
+
+def _counts(stats: dict) -> dict[str, int]:
+	return {name: value['count'] for name, value in stats.items()}
+
+
+def test_enable_disable():
+	"""
+		Test that enabling and disabling instrumentation restores the original functions once every call of `enable()` is matched by `disable()`.
+	"""
+	originals = {name: GPath.__dict__[name] for name in ('__init__', 'from_many', 'common_with', 'relpath_from', 'partition', 'render')}
+	original_render_many = render.render_many
+	original_parse_operand = _gpath._parse_operand
+
+	assert not instrument.is_enabled()
+	instrument.enable()
+	instrument.enable()
+	assert instrument.is_enabled()
+	assert GPath.__dict__['__init__'] is not originals['__init__']
+	assert isinstance(GPath.__dict__['from_many'], staticmethod)
+	assert _gpath._parse_operand is not original_parse_operand
+	instrument.disable()
+	assert instrument.is_enabled()
+	instrument.disable()
+	assert not instrument.is_enabled()
+	for name, original in originals.items():
+		assert GPath.__dict__[name] is original
+	assert render.render_many is original_render_many
+	assert _gpath._parse_operand is original_parse_operand
+
+	instrument.disable()  # Nothing left to undo
+	assert not instrument.is_enabled()
+	with instrument.measure():
+		instrument.disable()
+		assert instrument.is_enabled()
+	assert not instrument.is_enabled()
+	instrument.reset()
+
+
+def test_counts(instrumented):
+	"""
+		Test that each instrumented operation is counted, and that the results of the operations are unchanged.
+	"""
+	assert GPath(b"/usr/bin", platform='posix').named_parts == ["usr", "bin"]
+	assert GPath("C:/Windows", platform='windows').drive == "C"
+	assert _counts(instrument.snapshot()) == {'decode': 1, 'construct/posix': 1, 'construct/windows': 1}
+
+	expected = [GPath(path, platform='posix') for path in ("a", "b", "")]
+	instrument.reset()
+	assert GPath.from_many([b"a", "b", None], platform='posix') == expected
+	assert GPath.from_many(["a", "b"], compact=True)[0].compact == True
+	stats = instrument.snapshot()
+	assert stats['from_many/posix']['count'] == 3
+	assert stats['from_many/generic']['count'] == 2
+	assert stats['decode']['count'] == 1
+
+	instrument.reset()
+	assert GPath("/a/b") == b"/a/b"
+	assert b"/a/b" in GPath("/a")
+	assert GPath.join("/a", b"b", "c") == GPath("/a/b/c")
+	assert _counts(instrument.snapshot())['decode'] == 3
+
+	instrument.reset()
+	assert GPath("/a/b") & "/a/c" == GPath("/a")
+	assert GPath("/a/b").relpath_from("/a/c") == GPath("../b")
+	assert GPath.partition("/a/b", "/a/c", allow_parents=False) == {GPath("/a"): [GPath("b"), GPath("c")]}
+	assert str(GPath("/a/b").render('windows')) == "\\a\\b"
+	assert render.render_many([GPath("/a/b")], 'windows') == ["\\a\\b"]
+	file = io.StringIO()
+	render.render_many([GPath("/a/b")], 'posix', file=file)
+	stats = instrument.snapshot()
+	assert stats['common_with']['count'] == 2  # Also called by relpath_from()
+	assert stats['relpath_from']['count'] == 1
+	assert stats['partition']['count'] == 1
+	assert stats['render']['count'] == 1
+	assert stats['render_many']['count'] == 2
+	for value in stats.values():
+		assert value['time'] >= 0
+		assert 'call_sites' not in value
+
+
+def test_errors(instrumented):
+	"""
+		Test that operations that raise an exception are still counted, and that the exception is propagated.
+	"""
+	with pytest.raises(UnicodeDecodeError):
+		GPath(b"\xff", encoding='utf_8')
+	with pytest.raises(KeyError):
+		GPath("a", platform='unknown')
+	assert instrument.snapshot()['construct/generic']['count'] == 1
+
+	instrument.reset()
+	with pytest.raises(UnicodeDecodeError):
+		GPath.from_many([b"a", b"\xff", b"b"], platform='posix')
+	with pytest.raises(KeyError):
+		GPath.from_many(["a"], platform='unknown')
+	stats = instrument.snapshot()
+	assert stats['from_many/posix']['count'] == 2
+	assert stats['from_many/generic']['count'] == 0
+	assert stats['from_many/generic']['time'] > 0
+
+
+def test_threads(instrumented):
+	"""
+		Test that operations are counted in every thread, including threads that have exited.
+	"""
+	def work() -> None:
+		for i in range(100):
+			GPath(f"/a/{i}") & "/a"
+
+	threads = [threading.Thread(target=work) for _ in range(8)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	stats = instrument.snapshot()
+	assert stats['common_with']['count'] == 800
+	assert stats['construct/generic']['count'] == 8 * 100 * 3
+
+
+def test_call_sites(instrumented):
+	"""
+		Test that calls are attributed to the call site outside of the gpath package.
+	"""
+	instrument.enable(call_sites=True)
+	GPath("/a") & GPath("/b")
+	stats = instrument.snapshot()
+	line = test_call_sites.__code__.co_firstlineno + 5
+	site = f"{__file__}:{line}"
+	assert stats['common_with']['call_sites'] == {site: 1}
+	assert stats['construct/generic']['call_sites'] == {site: 3}
+	instrument.disable()
+
+
+def test_measure():
+	"""
+		Test that `measure()` only records the operations within its block, and can be nested.
+	"""
+	instrument.reset()
+	with instrument.measure() as outer:
+		assert instrument.is_enabled()
+		GPath("a")
+		with instrument.measure() as inner:
+			GPath("b") & GPath("c")
+		assert _counts(inner) == {'construct/generic': 3, 'common_with': 1}
+		GPath("d")
+		assert outer == {}
+	assert not instrument.is_enabled()
+	assert _counts(outer) == {'construct/generic': 5, 'common_with': 1}
+
+	GPath("e")
+	assert _counts(instrument.snapshot()) == {'construct/generic': 5, 'common_with': 1}
+
+	with instrument.measure(call_sites=True) as stats:
+		GPath("f")
+	assert list(stats['construct/generic']['call_sites'].values()) == [1]
+	instrument.reset()
+	assert instrument.snapshot() == {}
+
+
+def test_measure_threads():
+	"""
+		Test that `measure()` blocks in different threads can overlap without disabling each other.
+	"""
+	instrument.reset()
+	first_entered = threading.Event()
+	second_entered = threading.Event()
+	first_exited = threading.Event()
+	results = {}
+
+	def first() -> None:
+		with instrument.measure() as stats:
+			first_entered.set()
+			second_entered.wait()
+			GPath("a")
+		results['first'] = stats
+		first_exited.set()
+
+	def second() -> None:
+		first_entered.wait()
+		with instrument.measure(call_sites=True) as stats:
+			second_entered.set()
+			first_exited.wait()
+			assert instrument.is_enabled()
+			GPath("b")
+		results['second'] = stats
+
+	threads = [threading.Thread(target=first), threading.Thread(target=second)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	assert not instrument.is_enabled()
+	assert _counts(results['first']) == {'construct/generic': 1}
+	assert _counts(results['second']) == {'construct/generic': 2}  # Including that of the first thread, since counts are process-wide
+	assert sorted(results['second']['construct/generic']['call_sites'].values()) == [1, 1]  # One call site in each thread
+	instrument.reset()
+
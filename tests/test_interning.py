@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Generator
+
+import pytest
+
+from gpath import GPath, interning
+
+
+@pytest.fixture
+def pool() -> Generator[interning.InternPool, None, None]:
+	yield interning.enable(max_size=4)
+	interning.disable()
+
+
+def _new_str(string: str) -> str:
+	# Create a new str object with the same value, bypassing any interning done by the compiler
+	return "".join(list(string))
+
+
+def test_intern_pool():
+	"""
+		Test `InternPool.intern()` and its statistics.
+	"""
+	pool = interning.InternPool(max_size=2)
+	first = _new_str("data")
+	second = _new_str("data")
+	assert first is not second
+
+	assert pool.intern(first) is first
+	assert pool.intern(second) is first
+	assert pool.hits == 1
+	assert pool.misses == 1
+	assert pool.saved_bytes == sys.getsizeof(second)
+	assert len(pool) == 1
+
+	pool.intern("2024")
+	pool.intern("shard")
+	assert len(pool) == 2
+	assert pool.intern(_new_str("data")) is not first  # evicted
+
+	assert pool.stats() == {'size': 2, 'max_size': 2, 'hits': 1, 'misses': 4, 'saved_bytes': sys.getsizeof(second)}
+	pool.clear()
+	assert pool.stats() == {'size': 0, 'max_size': 2, 'hits': 0, 'misses': 0, 'saved_bytes': 0}
+
+
+def test_intern_pool_invalid():
+	"""
+		Test `InternPool()` with an invalid size.
+	"""
+	with pytest.raises(ValueError):
+		interning.InternPool(max_size=0)
+
+
+def test_intern_pool_threads():
+	"""
+		Test that `InternPool.intern()` gives correct results and consistent statistics when the pool is shared between many threads, while strings are being evicted.
+	"""
+	pool = interning.InternPool(max_size=16)
+	strings = [f"shard-{i}" for i in range(64)]
+	errors = []
+	calls = 5000
+	switch_interval = sys.getswitchinterval()
+
+	def work(seed: int) -> None:
+		try:
+			for i in range(calls):
+				string = strings[(seed * 31 + i * 7) % len(strings)]
+				if pool.intern(_new_str(string)) != string:
+					errors.append(string)
+		except Exception as e:
+			errors.append(e)
+
+	sys.setswitchinterval(1e-6)
+	try:
+		threads = [threading.Thread(target=work, args=(seed,)) for seed in range(6)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+	finally:
+		sys.setswitchinterval(switch_interval)
+
+	assert errors == []
+	assert pool.hits + pool.misses == 6 * calls
+	assert len(pool) <= 16
+
+
+def test_intern_pool_thread_churn():
+	"""
+		Test that the statistics of threads that have exited are kept, without keeping separate statistics for each of them.
+	"""
+	pool = interning.InternPool()
+	for _ in range(50):
+		thread = threading.Thread(target=pool.intern, args=(_new_str("data"),))
+		thread.start()
+		thread.join()
+	assert pool.stats()['hits'] == 49
+	assert pool.stats()['misses'] == 1
+	assert len(pool._counters._threads) <= 1
+	pool.clear()
+	assert pool.hits == 0
+
+
+def test_enable_disable():
+	"""
+		Test `enable()`, `disable()` and `get_pool()`.
+	"""
+	assert interning.get_pool() is None
+	pool = interning.enable()
+	assert interning.get_pool() is pool
+	interning.disable()
+	assert interning.get_pool() is None
+
+
+def test_interning(pool: interning.InternPool):
+	"""
+		Test that components are shared between GPaths created by the constructor and by operators when interning is enabled.
+	"""
+	gpath1 = GPath(_new_str("/data/2024/a"))
+	gpath2 = GPath(_new_str("data/2024/b"))
+	for part1, part2 in zip(gpath1._parts[:2], gpath2._parts[:2]):
+		assert part1 is part2
+
+	added = GPath("/") + _new_str("data/2024")
+	assert added._parts[0] is gpath1._parts[0]
+	divided = GPath("/") / _new_str("data")
+	assert divided._parts[0] is gpath1._parts[0]
+	joined = GPath.join("/", _new_str("data"), _new_str("2024"))
+	assert joined._parts[1] is gpath1._parts[1]
+	assert joined == GPath("/data/2024")
+
+	assert pool.hits > 0
+	assert pool.saved_bytes > 0
+
+
+def test_interning_disabled():
+	"""
+		Test that components are not shared when interning is disabled.
+	"""
+	gpath1 = GPath(_new_str("data/2024"))
+	gpath2 = GPath(_new_str("data/2024"))
+	assert gpath1._parts[0] is not gpath2._parts[0]
+	assert gpath1 == gpath2
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from gpath import _gpath, _rules
+from gpath.platform import Platform
+
+
+_python_parsers_of_platforms = {
+	Platform.GENERIC: _gpath._make_python_parser(_rules.generic_rules, with_drive=True),
+	Platform.POSIX: _gpath._make_python_parser(_rules.posix_rules, with_drive=False),
+	Platform.WINDOWS: _gpath._make_python_parser(_rules.windows_rules, with_drive=True),
+}
+
+
+@pytest.mark.parametrize(
+	('platform', 'path', 'expected'),
+	[
+		(Platform.GENERIC, "", ((), False, "", 0)),
+		(Platform.GENERIC, "usr/bin", (("usr", "bin"), False, "", 0)),
+		(Platform.GENERIC, "/usr\\bin", (("usr", "bin"), True, "", 0)),
+		(Platform.GENERIC, "C:/Windows", (("Windows",), True, "C", 0)),
+		(Platform.GENERIC, "C:Windows", (("Windows",), False, "C", 0)),
+		(Platform.GENERIC, "../../a/./b/", (("a", "b"), False, "", 2)),
+		(Platform.GENERIC, "/../a", (("a",), True, "", 0)),
+		(Platform.GENERIC, "a/b/../..", ((), False, "", 0)),
+		(Platform.GENERIC, "a/../../b", (("b",), False, "", 1)),
+		(Platform.POSIX, "", ((), False, "", 0)),
+		(Platform.POSIX, "/usr/bin", (("usr", "bin"), True, "", 0)),
+		(Platform.POSIX, "//usr//bin/", (("usr", "bin"), True, "", 0)),
+		(Platform.POSIX, "C:/Windows", (("C:", "Windows"), False, "", 0)),
+		(Platform.POSIX, "a\\b/c", (("a\\b", "c"), False, "", 0)),
+		(Platform.POSIX, "./../a/..", ((), False, "", 1)),
+		(Platform.WINDOWS, "", ((), False, "", 0)),
+		(Platform.WINDOWS, "C:\\Windows\\System32", (("Windows", "System32"), True, "C", 0)),
+		(Platform.WINDOWS, "C:/Windows/../Program Files", (("Program Files",), True, "C", 0)),
+		(Platform.WINDOWS, "D:..\\a", (("a",), False, "D", 1)),
+		(Platform.WINDOWS, "\\a\\.\\b", (("a", "b"), True, "", 0)),
+	]
+)
+def test_python_parser(platform: Platform, path: str, expected: tuple):
+	"""
+		Test the pure-Python parser of each platform, both for paths that are already normalised and for paths that need to be normalised.
+	"""
+	assert _python_parsers_of_platforms[platform](path) == expected
+
+
+@pytest.mark.parametrize(
+	('platform', 'path', 'normalised'),
+	[
+		(Platform.GENERIC, "usr/bin", True),
+		(Platform.GENERIC, "C:\\Windows/System32", True),
+		(Platform.GENERIC, "/usr/./bin", False),
+		(Platform.POSIX, "/usr/bin", True),
+		(Platform.POSIX, "usr//bin", False),
+		(Platform.WINDOWS, "C:\\Windows", True),
+		(Platform.WINDOWS, "C:\\Windows\\..", False),
+	]
+)
+def test_python_parser_normalised(platform: Platform, path: str, normalised: bool):
+	"""
+		Test that the pure-Python parser only calls `_normalise_relative()` for paths that are not already normalised, with the same result either way.
+	"""
+	with patch.object(_gpath, '_normalise_relative', wraps=_gpath._normalise_relative) as normalise_relative:
+		result = _python_parsers_of_platforms[platform](path)
+	assert normalise_relative.called != normalised
+	assert result == _gpath._parsers_of_platforms[platform](path)
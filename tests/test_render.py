@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import dataclasses
+import io
+import os
 from typing import Generator
 from unittest.mock import patch
 
 import pytest
 
-from gpath import render
+from gpath import GPath, render
 from gpath.platform import Platform
 from util import RenderableData
 
@@ -412,3 +414,68 @@ def test_platforms():
 	for platform in Platform:
 		rendered_type = render.get_type(platform)
 		assert issubclass(rendered_type, render.RenderedPath)
+
+
+def test_hash():
+	"""
+		Test `__hash__()` for RenderedPaths of GPaths.
+	"""
+	for platform in Platform:
+		rendered_path1 = GPath("C:/a/b").render(platform)
+		rendered_path2 = GPath("C:/a/./b").render(platform)
+		assert hash(rendered_path1) == hash(rendered_path2)
+		assert hash(rendered_path1) == hash(rendered_path1)
+		assert len({rendered_path1, rendered_path2}) == 1
+
+
+def test_fspath():
+	"""
+		Test `__fspath__()` for RenderedPaths of GPaths.
+	"""
+	for platform in Platform:
+		rendered_path = GPath("C:/a/b").render(platform)
+		assert isinstance(rendered_path, os.PathLike)
+		assert os.fspath(rendered_path) == str(rendered_path)
+
+
+@pytest.mark.parametrize('platform', ['generic', 'posix', 'windows', Platform.POSIX])
+def test_render_many(platform):
+	"""
+		Test that `render_many()` gives the same strings as rendering each path individually, both as a list and when writing to a file.
+	"""
+	paths = [GPath(path) for path in ["", "/", "..", "../..", "C:", "C:/", "C:..", "/a/b", "a/b", "../a", "../../a/b", "C:/a/b", "C:a", "C:../a"]]
+	expected = [str(path.render(platform)) for path in paths]
+	assert render.render_many(paths, platform) == expected
+	assert render.render_many(iter(paths), platform) == expected
+	assert render.render_many([], platform) == []
+
+	file = io.StringIO()
+	assert render.render_many(paths, platform, file=file) is None
+	assert file.getvalue() == "".join(string + "\n" for string in expected)
+
+	file = io.StringIO()
+	render.render_many(paths, platform, file=file, end="\0")
+	assert file.getvalue() == "".join(string + "\0" for string in expected)
+
+	file = io.StringIO()
+	render.render_many([], platform, file=file)
+	assert file.getvalue() == ""
+
+
+@pytest.mark.parametrize('platform', ['generic', 'posix', 'windows', Platform.POSIX])
+def test_sorted_paths(platform):
+	"""
+		Test that `sorted_paths()` sorts paths in the same order as their RenderedPaths, and that `RenderedPath.sort_key` is consistent with comparisons.
+	"""
+	paths = [GPath(path) for path in ["a/b", "", "C:/a/b", "/", "../a", "..", "C:", "/a/b", "D:/a", "C:a", "../../a/b", "/a", "C:/", "C:..", "a"]]
+	rendered_paths = [path.render(platform) for path in paths]
+	expected = [rendered_path._path for rendered_path in sorted(rendered_paths)]
+	assert render.sorted_paths(paths, platform) == expected
+	assert render.sorted_paths(iter(paths), platform, reverse=True) == [rendered_path._path for rendered_path in sorted(rendered_paths, reverse=True)]
+	assert render.sorted_paths([], platform) == []
+
+	for rendered_path1 in rendered_paths:
+		for rendered_path2 in rendered_paths:
+			assert (rendered_path1 < rendered_path2) == (rendered_path1.sort_key < rendered_path2.sort_key)
+			assert (rendered_path1 == rendered_path2) == (rendered_path1.sort_key == rendered_path2.sort_key)
+		assert rendered_path1.sort_key is rendered_path1.sort_key
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import io
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from gpath import GPath, serialise
+
+
+PATHS = [
+	GPath("/usr/bin"),
+	GPath("/usr/local/bin"),
+	GPath("/usr/local/bin"),
+	GPath(""),
+	GPath("/"),
+	GPath("../../Documents/notes.txt"),
+	GPath("../Documents"),
+	GPath("C:/Program Files", platform='windows'),
+	GPath("C:.."),
+	GPath("D:/Program Files", platform='windows'),
+	GPath(b"/donn\xe9es", encoding='latin_1'),
+	GPath("/usr/bin"),
+	GPath("/\udcff\udcfe"),
+	GPath("/usr/local/lib", compact=True),
+]
+
+
+@pytest.mark.parametrize('block_size', [1, 2, serialise.BLOCK_SIZE])
+def test_dumps_loads(block_size: int):
+	"""
+		Test that `loads()` restores every field of the GPaths serialised by `dumps()`, including across block boundaries.
+	"""
+	with patch.object(serialise, 'BLOCK_SIZE', block_size):
+		data = serialise.dumps(PATHS)
+	result = serialise.loads(data)
+	assert result == PATHS
+	for path, expected in zip(result, PATHS):
+		assert path.platform == expected.platform
+		assert path.encoding == expected.encoding
+		assert not path.compact
+		assert hash(path) == hash(expected)
+
+	assert serialise.loads(bytearray(data)) == PATHS
+	assert serialise.loads(memoryview(data)) == PATHS
+	assert all(path.compact for path in serialise.loads(data, compact=True))
+
+	# Components are shared between the loaded paths
+	assert result[0][0] is result[1][0]
+
+
+def test_dumps_loads_empty():
+	"""
+		Test `dumps()` and `loads()` on an empty collection.
+	"""
+	data = serialise.dumps([])
+	assert data == serialise.MAGIC + bytes([serialise.VERSION])
+	assert serialise.loads(data) == []
+
+
+def test_dumps_sort():
+	"""
+		Test that sorting the paths preserves them, and makes the output no larger.
+	"""
+	paths = [GPath(f"/srv/{i % 7}/data/{i % 3}/file{i}") for i in range(100)]
+	data = serialise.dumps(paths, sort=True)
+	assert len(data) <= len(serialise.dumps(paths))
+	result = serialise.loads(data)
+	assert sorted(map(str, result)) == sorted(map(str, paths))
+	assert result[0] == GPath("/srv/0/data/0/file0")
+
+
+def test_dump_load():
+	"""
+		Test `dump()` and `load()` with a binary file, and that the output is smaller than pickle.
+	"""
+	paths = [GPath(f"/srv/data/shard-{i % 100}/part-{i}.parquet") for i in range(1000)]
+	file = io.BytesIO()
+	with patch.object(serialise, 'BLOCK_SIZE', 64):
+		serialise.dump(iter(paths), file)
+	assert len(file.getvalue()) < len(pickle.dumps(paths)) / 2
+	file.seek(0)
+	assert serialise.load(file) == paths
+
+
+def test_large_ids():
+	"""
+		Test varints of every length, both directly and as string ids.
+	"""
+	for value in [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 0x1FFFFF, 0x200000, 2**35 + 12345, 2**70]:
+		encoded = serialise._encode_varint(value)
+		assert encoded[-1] < 0x80 and all(byte >= 0x80 for byte in encoded[:-1])
+		assert serialise._decode_varint(encoded) == value
+
+	paths = [GPath(f"{i}") for i in range(20000)]
+	assert serialise.loads(serialise.dumps(paths)) == paths
+
+
+def test_dumps_invalid():
+	"""
+		Test that `dumps()` rejects anything other than GPaths.
+	"""
+	with pytest.raises(TypeError):
+		serialise.dumps(["/usr/bin"])  # type: ignore
+
+
+def test_loads_invalid():
+	"""
+		Test that `loads()` raises ValueError on invalid data.
+	"""
+	data = serialise.dumps(PATHS)
+	for invalid in [
+		b"",
+		b"GPTX\x01",
+		serialise.MAGIC,
+		serialise.MAGIC + bytes([serialise.VERSION + 1]) + data[len(serialise.MAGIC) + 1:],
+		data[:-1],
+		data[:len(data) // 2],
+		data + b"\x80",
+	]:
+		with pytest.raises(ValueError):
+			serialise.loads(invalid)
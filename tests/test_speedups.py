@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from gpath import GPath, interning, _gpath, _rules
+from gpath.platform import Platform
+
+
+_speedups = pytest.importorskip('gpath._speedups', reason="the optional compiled accelerator is not built")
+
+
+_python_parsers_of_platforms = {
+	Platform.GENERIC: _gpath._make_python_parser(_rules.generic_rules, with_drive=True),
+	Platform.POSIX: _gpath._make_python_parser(_rules.posix_rules, with_drive=False),
+	Platform.WINDOWS: _gpath._make_python_parser(_rules.windows_rules, with_drive=True),
+}
+
+_alphabet = ["a", "b", "usr", ".", "..", "...", ".a", "/", "/", "\\", "\\", ":", "C", " ", "é", "中", "\U0001f600"]
+
+
+def _random_paths(rng: random.Random, count: int) -> list[str]:
+	return ["".join(rng.choice(_alphabet) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+def _state(gpath: GPath) -> tuple:
+	return (gpath._parts, gpath._root, gpath._drive, gpath._parent_level, gpath._platform, gpath._encoding)
+
+
+@pytest.mark.parametrize('platform', list(Platform))
+@pytest.mark.parametrize('seed', range(4))
+def test_parser(platform: Platform, seed: int):
+	"""
+		Test that the compiled parser gives the same results as the pure-Python parser on random paths.
+	"""
+	assert type(_gpath._parsers_of_platforms[platform]) is _speedups.Parser
+	rng = random.Random(seed)
+	parse = _gpath._parsers_of_platforms[platform]
+	python_parse = _python_parsers_of_platforms[platform]
+	for path in _random_paths(rng, 2000):
+		assert parse(path) == python_parse(path), repr(path)
+
+
+@pytest.mark.parametrize('platform', [None, 'generic', 'posix', 'windows'])
+def test_gpath_state(platform: str):
+	"""
+		Test that GPaths constructed with the compiled parser have the same state as GPaths constructed with the pure-Python parser.
+	"""
+	paths = _random_paths(random.Random(str(platform)), 2000)
+	gpaths = [GPath(path, platform=platform) for path in paths]
+	many_gpaths = GPath.from_many(paths, platform=platform)
+	with patch.dict(_gpath._parsers_of_platforms, _python_parsers_of_platforms):
+		python_gpaths = [GPath(path, platform=platform) for path in paths]
+	for path, gpath, many_gpath, python_gpath in zip(paths, gpaths, many_gpaths, python_gpaths):
+		assert _state(gpath) == _state(python_gpath), repr(path)
+		assert _state(many_gpath) == _state(python_gpath), repr(path)
+		assert str(gpath) == str(python_gpath)
+
+
+def test_interning():
+	"""
+		Test that the compiled parser interns components through the active intern pool.
+	"""
+	pool = interning.enable()
+	try:
+		name = "".join(["test_speedups", "_interning"])
+		first = _gpath._parse_generic(f"/{name}/a")[0][0]
+		second = _gpath._parse_generic(f"C:{name}")[0][0]
+		assert first == name
+		assert first is second
+		assert pool.hits >= 1
+	finally:
+		interning.disable()
+
+
+def test_errors():
+	"""
+		Test that the compiled parser rejects invalid arguments.
+	"""
+	parse = _gpath._parse_generic
+	with pytest.raises(TypeError):
+		parse(b"/usr")
+	with pytest.raises(TypeError):
+		parse()
+	with pytest.raises(TypeError):
+		parse("/usr", "/bin")
+	with pytest.raises(ValueError):
+		_speedups.Parser("", "", ".", "..", interning)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gpath import GPath, stream
+
+
+PATHS = ["/usr/bin", "../Documents/notes.txt", "C:/Program Files", "name with spaces ", "données/日本語"]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, stream.CHUNK_SIZE])
+def test_read_paths_text(chunk_size: int):
+	"""
+		Test `read_paths()` on a text file, skipping empty lines but keeping other whitespace.
+	"""
+	file = io.StringIO("\n".join(PATHS[:2]) + "\n\n" + "\n".join(PATHS[2:]))
+	with patch.object(stream, 'CHUNK_SIZE', chunk_size):
+		result = list(stream.read_paths(file))
+	assert result == [GPath(path) for path in PATHS]
+
+
+@pytest.mark.parametrize('encoding', ['utf_8', 'utf_16_le', 'shift_jis'])
+def test_read_paths_bytes(encoding: str):
+	"""
+		Test `read_paths()` on a binary file with CRLF line endings.
+	"""
+	paths = PATHS if encoding != 'shift_jis' else PATHS[:-1] + ["データ/日本語"]
+	file = io.BytesIO("".join(path + "\r\n" for path in paths).encode(encoding))
+	if encoding == 'utf_16_le':
+		# Lines cannot be split on the byte b"\n" in this encoding, so the file must be decoded as text
+		file = io.TextIOWrapper(file, encoding=encoding)
+	result = list(stream.read_paths(file, encoding=encoding))
+	assert result == [GPath(path, encoding=encoding) for path in paths]
+	assert all(path.encoding == encoding for path in result)
+
+
+def test_read_paths_options():
+	"""
+		Test that `read_paths()` passes its platform and compact arguments on to every GPath.
+	"""
+	result = list(stream.read_paths(["C:/Windows\n", "a\\b"], platform='windows', compact=True))
+	assert result == [GPath("C:/Windows", platform='windows'), GPath("a/b", platform='windows')]
+	assert all(path.platform == 'windows' and path.compact for path in result)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, stream.CHUNK_SIZE])
+@pytest.mark.parametrize('block_size', [1, 16, stream.MMAP_BLOCK_SIZE])
+@pytest.mark.parametrize('newline', ["\n", "\r\n"])
+def test_read_paths_mmap(tmp_path: Path, chunk_size: int, block_size: int, newline: str):
+	"""
+		Test `read_paths_mmap()` with both file names and file objects, with and without a trailing newline, including when lines are longer than a block.
+	"""
+	file_path = tmp_path / "paths.txt"
+	file_path.write_bytes((newline.join(PATHS[:2]) + newline * 2 + newline.join(PATHS[2:])).encode('utf_8'))
+	expected = [GPath(path) for path in PATHS]
+
+	with patch.object(stream, 'CHUNK_SIZE', chunk_size), patch.object(stream, 'MMAP_BLOCK_SIZE', block_size):
+		assert list(stream.read_paths_mmap(file_path)) == expected
+		assert list(stream.read_paths_mmap(str(file_path))) == expected
+		with open(file_path, 'rb') as file:
+			assert list(stream.read_paths_mmap(file)) == expected
+
+		file_path.write_bytes("".join(path + newline for path in PATHS).encode('utf_8'))
+		assert list(stream.read_paths_mmap(file_path)) == expected
+
+
+def test_read_paths_mmap_encoding(tmp_path: Path):
+	"""
+		Test `read_paths_mmap()` with a non-default encoding, and with an empty file.
+	"""
+	file_path = tmp_path / "paths.txt"
+	file_path.write_bytes("données\n/résumé\n".encode('latin_1'))
+	result = list(stream.read_paths_mmap(file_path, encoding='latin_1'))
+	assert result == [GPath("données", encoding='latin_1'), GPath("/résumé", encoding='latin_1')]
+	assert all(path.encoding == 'latin_1' for path in result)
+
+	file_path.write_bytes(b"")
+	assert list(stream.read_paths_mmap(file_path)) == []
+
+
+def test_read_paths_mmap_close(tmp_path: Path):
+	"""
+		Test that `read_paths_mmap()` can be closed before it is exhausted.
+	"""
+	file_path = tmp_path / "paths.txt"
+	file_path.write_bytes("".join(f"/a/{i}\n" for i in range(10)).encode('utf_8'))
+	with patch.object(stream, 'CHUNK_SIZE', 3):
+		iterator = stream.read_paths_mmap(file_path)
+		assert next(iterator) == GPath("/a/0")
+		iterator.close()
+
+
+@pytest.mark.parametrize(
+	('platform', 'expected'),
+	[
+		(None, "/usr/bin\n../a\nC:/Windows\n"),
+		('posix', "/usr/bin\n../a\n/Windows\n"),
+		('windows', "\\usr\\bin\n..\\a\nC:\\Windows\n"),
+	]
+)
+def test_write_paths(platform: str, expected: str):
+	"""
+		Test `write_paths()` for different target platforms, including from a lazy iterable.
+	"""
+	paths = [GPath("/usr/bin"), GPath("../a"), GPath("C:/Windows")]
+	file = io.StringIO()
+	stream.write_paths(iter(paths), file, platform=platform)
+	assert file.getvalue() == expected
+
+	assert list(stream.read_paths(io.StringIO(file.getvalue()), platform=platform)) == [GPath(path, platform=platform) for path in file.getvalue().splitlines()]